@@ -0,0 +1,37 @@
+"""add notification outbox lease
+
+Revision ID: a3c8e5f1d294
+Revises: f2a9d6c4b871
+Create Date: 2026-10-19 10:12:37.418302
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3c8e5f1d294"
+down_revision: Union[str, Sequence[str], None] = "f2a9d6c4b871"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "notification_outbox",
+        sa.Column(
+            "locked_until",
+            postgresql.TIMESTAMP(timezone=True, precision=3),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("notification_outbox", "locked_until")
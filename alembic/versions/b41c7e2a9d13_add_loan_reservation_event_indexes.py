@@ -0,0 +1,75 @@
+"""add loan, reservation and event indexes
+
+Revision ID: b41c7e2a9d13
+Revises: 57f3d3674406
+Create Date: 2026-10-18 21:40:12.118204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b41c7e2a9d13"
+down_revision: Union[str, Sequence[str], None] = "57f3d3674406"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NOT_RETURNED = sa.text("return_date IS NULL")
+
+INDEXES = [
+    ("ix_loans_user_id_status_id", "loans", ["user_id", "status_id"], None),
+    ("ix_loans_book_id_status_id", "loans", ["book_id", "status_id"], None),
+    ("ix_loans_status_id_id", "loans", ["status_id", "id"], None),
+    ("ix_loans_active_user_id", "loans", ["user_id"], NOT_RETURNED),
+    ("ix_loans_active_book_id", "loans", ["book_id"], NOT_RETURNED),
+    ("ix_loans_active_due_date", "loans", ["due_date"], NOT_RETURNED),
+    (
+        "ix_reservations_user_id_book_id_status_id",
+        "reservations",
+        ["user_id", "book_id", "status_id"],
+        None,
+    ),
+    (
+        "ix_reservations_book_id_status_id",
+        "reservations",
+        ["book_id", "status_id"],
+        None,
+    ),
+    ("ix_reservations_status_id_id", "reservations", ["status_id", "id"], None),
+    ("ix_book_events_book_id", "book_events", ["book_id"], None),
+    ("ix_loan_events_loan_id", "loan_events", ["loan_id"], None),
+    (
+        "ix_reservation_events_reservation_id",
+        "reservation_events",
+        ["reservation_id"],
+        None,
+    ),
+    ("ix_user_events_user_id", "user_events", ["user_id"], None),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_where=where,
+                sqlite_where=where,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
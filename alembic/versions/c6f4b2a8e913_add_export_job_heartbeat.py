@@ -0,0 +1,37 @@
+"""add export job heartbeat
+
+Revision ID: c6f4b2a8e913
+Revises: a3c8e5f1d294
+Create Date: 2026-10-19 10:41:08.227519
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c6f4b2a8e913"
+down_revision: Union[str, Sequence[str], None] = "a3c8e5f1d294"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "export_jobs",
+        sa.Column(
+            "heartbeat_at",
+            postgresql.TIMESTAMP(timezone=True, precision=3),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("export_jobs", "heartbeat_at")
@@ -0,0 +1,65 @@
+"""add export jobs
+
+Revision ID: d5e8a1f04c27
+Revises: b41c7e2a9d13
+Create Date: 2026-10-18 22:31:47.502913
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e8a1f04c27"
+down_revision: Union[str, Sequence[str], None] = "b41c7e2a9d13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "export_jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("job_key", sa.Uuid(), nullable=False),
+        sa.Column("report", sa.String(), nullable=False),
+        sa.Column("format", sa.String(), nullable=False),
+        sa.Column("filters", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("total_rows", sa.Integer(), nullable=True),
+        sa.Column("processed_rows", sa.Integer(), nullable=False),
+        sa.Column("file_path", sa.String(), nullable=True),
+        sa.Column("error", sa.String(), nullable=True),
+        sa.Column(
+            "created_at",
+            postgresql.TIMESTAMP(timezone=True, precision=3),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column(
+            "started_at",
+            postgresql.TIMESTAMP(timezone=True, precision=3),
+            nullable=True,
+        ),
+        sa.Column(
+            "finished_at",
+            postgresql.TIMESTAMP(timezone=True, precision=3),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_export_jobs_job_key"), "export_jobs", ["job_key"], unique=True
+    )
+    op.create_index(op.f("ix_export_jobs_id"), "export_jobs", ["id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_export_jobs_id"), table_name="export_jobs")
+    op.drop_index(op.f("ix_export_jobs_job_key"), table_name="export_jobs")
+    op.drop_table("export_jobs")
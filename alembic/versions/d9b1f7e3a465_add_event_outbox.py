@@ -0,0 +1,56 @@
+"""add event outbox
+
+Revision ID: d9b1f7e3a465
+Revises: c6f4b2a8e913
+Create Date: 2026-10-19 11:26:53.904117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d9b1f7e3a465"
+down_revision: Union[str, Sequence[str], None] = "c6f4b2a8e913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "event_outbox",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("event_key", sa.Uuid(), nullable=False),
+        sa.Column("routing_key", sa.String(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column(
+            "locked_until",
+            postgresql.TIMESTAMP(timezone=True, precision=3),
+            nullable=True,
+        ),
+        sa.Column(
+            "created_at",
+            postgresql.TIMESTAMP(timezone=True, precision=3),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("event_key"),
+    )
+    op.create_index(op.f("ix_event_outbox_id"), "event_outbox", ["id"], unique=False)
+    op.create_index(
+        "ix_event_outbox_status_id", "event_outbox", ["status", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_event_outbox_status_id", table_name="event_outbox")
+    op.drop_index(op.f("ix_event_outbox_id"), table_name="event_outbox")
+    op.drop_table("event_outbox")
@@ -0,0 +1,55 @@
+"""add loan stats summary
+
+Revision ID: e7c3f92b1a58
+Revises: d5e8a1f04c27
+Create Date: 2026-10-18 23:12:05.118402
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7c3f92b1a58"
+down_revision: Union[str, Sequence[str], None] = "d5e8a1f04c27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "loan_stats",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("dimension", sa.String(), nullable=False),
+        sa.Column("bucket", sa.String(), nullable=True),
+        sa.Column("loans", sa.Integer(), nullable=False),
+        sa.Column("active", sa.Integer(), nullable=False),
+        sa.Column("overdue", sa.Integer(), nullable=False),
+        sa.Column("returned", sa.Integer(), nullable=False),
+        sa.Column("fines", sa.Float(), nullable=False),
+        sa.Column(
+            "refreshed_at",
+            postgresql.TIMESTAMP(timezone=True, precision=3),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_loan_stats_id"), "loan_stats", ["id"], unique=False)
+    op.create_index(
+        "ix_loan_stats_dimension_bucket",
+        "loan_stats",
+        ["dimension", "bucket"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_loan_stats_dimension_bucket", table_name="loan_stats")
+    op.drop_index(op.f("ix_loan_stats_id"), table_name="loan_stats")
+    op.drop_table("loan_stats")
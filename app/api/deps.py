@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from fastapi import Query
 
@@ -9,6 +10,7 @@ from app.core.constants import PAGINATION_MAX_LIMIT, PAGINATION_MIN
 class PaginationParams:
     page: int = Query(1, ge=1)
     per_page: int = Query(PAGINATION_MIN, ge=1, le=PAGINATION_MAX_LIMIT)
+    cursor: Optional[str] = Query(None)
 
     @property
     def skip(self) -> int:
@@ -0,0 +1,94 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import PaginationParams
+from app.core.errors import BookNotFound, InvalidStatus
+from app.db.async_session import get_async_read_session, get_async_session
+from app.schemas.book import (
+    BookAvailabilityResponse,
+    BookCreate,
+    BookResponse,
+    BookUpdate,
+)
+from app.services.async_services import AsyncBookService
+from app.utils.pagination import set_next_cursor
+from app.utils.snapshot import SnapshotResponse
+
+router = APIRouter()
+service = AsyncBookService()
+
+
+@router.post("/", response_model=BookResponse, status_code=status.HTTP_201_CREATED)
+async def create_book(
+    book: BookCreate, session: AsyncSession = Depends(get_async_session)
+):
+    return await service.create(session=session, book=book)
+
+
+@router.patch("/{book_key}", response_model=BookResponse)
+async def update_book(
+    book_key: str,
+    payload: BookUpdate,
+    session: AsyncSession = Depends(get_async_session),
+):
+    updated = await service.update(session=session, book_key=book_key, data=payload)
+    if not updated:
+        raise BookNotFound()
+    return updated
+
+
+@router.post("/{book_key}/status", response_model=BookResponse)
+async def change_book_status(
+    book_key: str,
+    status_enum: str,
+    session: AsyncSession = Depends(get_async_session),
+):
+    updated = await service.set_status(
+        session=session, book_key=book_key, status_enum=status_enum
+    )
+    if not updated:
+        raise InvalidStatus()
+    return updated
+
+
+@router.get("/", response_model=List[BookResponse])
+async def get_books(
+    response: Response,
+    pagination: PaginationParams = Depends(),
+    genre: str = None,
+    session: AsyncSession = Depends(get_async_read_session),
+):
+    books = await service.get_all(
+        session=session,
+        skip=pagination.skip,
+        limit=pagination.per_page,
+        genre=genre,
+        cursor=pagination.cursor,
+    )
+    set_next_cursor(response, books, pagination.per_page, "book_key")
+    return books
+
+
+@router.get("/genres", response_model=List[str])
+async def get_genres(session: AsyncSession = Depends(get_async_read_session)):
+    return await service.get_genres(session=session)
+
+
+@router.get("/{book_key}", response_model=BookResponse)
+async def get_book(book_key: str, session: AsyncSession = Depends(get_async_session)):
+    book = await service.get_by_key(session=session, book_key=book_key)
+    if book is None:
+        raise BookNotFound()
+    return SnapshotResponse(content=book)
+
+
+@router.get("/{book_key}/availability", response_model=BookAvailabilityResponse)
+async def check_book_availability(
+    book_key: str, session: AsyncSession = Depends(get_async_session)
+):
+    result = await service.check_availability(session, book_key)
+    if result is None:
+        raise BookNotFound()
+    return result
@@ -0,0 +1,66 @@
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import PaginationParams
+from app.core.errors import LoanNotFound
+from app.db.async_session import get_async_read_session, get_async_session
+from app.schemas.loan import LoanCreate, LoanResponse, LoanReturnRequest
+from app.services.async_services import AsyncLoanService
+from app.utils.pagination import set_next_cursor
+from app.utils.snapshot import SnapshotResponse
+
+router = APIRouter()
+service = AsyncLoanService()
+
+
+@router.get("/", response_model=List[LoanResponse])
+async def get_loans(
+    response: Response,
+    status: Optional[str] = None,
+    overdue: bool = False,
+    pagination: PaginationParams = Depends(),
+    session: AsyncSession = Depends(get_async_read_session),
+):
+    loans = await service.get_all(
+        session,
+        skip=pagination.skip,
+        limit=pagination.per_page,
+        status=status,
+        overdue=overdue,
+        cursor=pagination.cursor,
+    )
+    set_next_cursor(response, loans, pagination.per_page, "loan_key")
+    return loans
+
+
+@router.get("/{loan_key}", response_model=LoanResponse)
+async def get_loan(loan_key: UUID, session: AsyncSession = Depends(get_async_session)):
+    loan = await service.get_by_key(session, loan_key=loan_key)
+    if loan is None:
+        raise LoanNotFound()
+    return SnapshotResponse(content=loan)
+
+
+@router.post("/", response_model=LoanResponse, status_code=status.HTTP_201_CREATED)
+async def create_loan(
+    loan_data: LoanCreate, session: AsyncSession = Depends(get_async_session)
+):
+    return await service.create(session=session, loan_data=loan_data)
+
+
+@router.post("/return", response_model=LoanResponse)
+async def return_book(
+    return_data: LoanReturnRequest,
+    session: AsyncSession = Depends(get_async_session),
+):
+    return await service.return_book(session=session, return_data=return_data)
+
+
+@router.post("/{loan_key}/renew", response_model=LoanResponse)
+async def renew_loan(
+    loan_key: UUID, session: AsyncSession = Depends(get_async_session)
+):
+    return await service.renew_loan(session=session, loan_key=loan_key)
@@ -0,0 +1,75 @@
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.errors import ReservationNotFound
+from app.db.async_session import get_async_read_session, get_async_session
+from app.schemas.reservation import ReservationCreate, ReservationResponse
+from app.services.async_services import AsyncReservationService
+from app.utils.pagination import set_next_cursor
+from app.utils.snapshot import SnapshotResponse
+
+router = APIRouter()
+service = AsyncReservationService()
+
+
+@router.post(
+    "/", response_model=ReservationResponse, status_code=status.HTTP_201_CREATED
+)
+async def create_reservation(
+    reservation: ReservationCreate,
+    session: AsyncSession = Depends(get_async_session),
+):
+    return await service.create(session, reservation)
+
+
+@router.get("/", response_model=List[ReservationResponse])
+async def get_reservations(
+    response: Response,
+    user_key: Optional[str] = None,
+    book_key: Optional[str] = None,
+    status: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_async_read_session),
+):
+    reservations = await service.get_all(
+        session,
+        skip=skip,
+        limit=limit,
+        user_key=user_key,
+        book_key=book_key,
+        status=status,
+        cursor=cursor,
+    )
+    set_next_cursor(response, reservations, limit, "reservation_key")
+    return reservations
+
+
+@router.get("/{reservation_key}", response_model=ReservationResponse)
+async def get_reservation(
+    reservation_key: UUID, session: AsyncSession = Depends(get_async_session)
+):
+    reservation = await service.get_by_key(session, reservation_key)
+    if reservation is None:
+        raise ReservationNotFound()
+    return SnapshotResponse(content=reservation)
+
+
+@router.delete("/{reservation_key}", response_model=ReservationResponse)
+async def cancel_reservation(
+    reservation_key: UUID,
+    session: AsyncSession = Depends(get_async_session),
+):
+    return await service.cancel_reservation(session, reservation_key)
+
+
+@router.post("/{reservation_key}/complete", response_model=ReservationResponse)
+async def complete_reservation(
+    reservation_key: UUID,
+    session: AsyncSession = Depends(get_async_session),
+):
+    return await service.complete_reservation(session, reservation_key)
@@ -0,0 +1,121 @@
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import PaginationParams
+from app.core.errors import InvalidStatus, UserNotFound
+from app.db.async_session import get_async_read_session, get_async_session
+from app.schemas.loan import LoanResponse
+from app.schemas.user import (
+    UserBulkCreate,
+    UserBulkCreateResponse,
+    UserBulkStatusResponse,
+    UserBulkStatusUpdate,
+    UserCreate,
+    UserResponse,
+    UserUpdate,
+)
+from app.services.async_services import AsyncUserService
+from app.utils.pagination import set_next_cursor
+from app.utils.snapshot import SnapshotResponse
+
+router = APIRouter()
+service = AsyncUserService()
+
+
+@router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+async def create_user(
+    user: UserCreate, session: AsyncSession = Depends(get_async_session)
+):
+    return await service.create(session=session, user=user)
+
+
+@router.post("/batch", response_model=UserBulkCreateResponse)
+async def create_users_batch(
+    payload: UserBulkCreate, session: AsyncSession = Depends(get_async_session)
+):
+    return await service.create_many(session=session, data=payload)
+
+
+@router.post("/batch/status", response_model=UserBulkStatusResponse)
+async def change_users_status(
+    payload: UserBulkStatusUpdate, session: AsyncSession = Depends(get_async_session)
+):
+    updated = await service.set_status_many(session=session, data=payload)
+    if updated is None:
+        raise InvalidStatus()
+    return updated
+
+
+@router.patch("/{user_key}", response_model=UserResponse)
+async def update_user(
+    user_key: UUID,
+    payload: UserUpdate,
+    session: AsyncSession = Depends(get_async_session),
+):
+    updated = await service.update(
+        session=session, user_key=str(user_key), data=payload
+    )
+    if not updated:
+        raise UserNotFound()
+    return updated
+
+
+@router.post("/{user_key}/status", response_model=UserResponse)
+async def change_user_status(
+    user_key: UUID,
+    status_enum: str,
+    session: AsyncSession = Depends(get_async_session),
+):
+    updated = await service.set_status(
+        session=session, user_key=str(user_key), status_enum=status_enum
+    )
+    if not updated:
+        raise InvalidStatus()
+    return updated
+
+
+@router.get("/", response_model=List[UserResponse])
+async def get_users(
+    response: Response,
+    pagination: PaginationParams = Depends(),
+    session: AsyncSession = Depends(get_async_read_session),
+):
+    users = await service.get_all(
+        session,
+        skip=pagination.skip,
+        limit=pagination.per_page,
+        cursor=pagination.cursor,
+    )
+    set_next_cursor(response, users, pagination.per_page, "user_key")
+    return users
+
+
+@router.get("/{user_key}", response_model=UserResponse)
+async def get_user(user_key: UUID, session: AsyncSession = Depends(get_async_session)):
+    user = await service.get_by_key(session, user_key)
+    if user is None:
+        raise UserNotFound()
+    return SnapshotResponse(content=user)
+
+
+@router.get("/{user_key}/loans", response_model=List[LoanResponse])
+async def get_user_loans(
+    response: Response,
+    user_key: UUID,
+    status: Optional[str] = None,
+    pagination: PaginationParams = Depends(),
+    session: AsyncSession = Depends(get_async_session),
+):
+    loans = await service.get_user_loans(
+        session,
+        user_key,
+        skip=pagination.skip,
+        limit=pagination.per_page,
+        status=status,
+        cursor=pagination.cursor,
+    )
+    set_next_cursor(response, loans, pagination.per_page, "loan_key")
+    return loans
@@ -1,21 +1,27 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, File, Query, Response, UploadFile, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import PaginationParams
+from app.core.constants import BOOK_IMPORT_BATCH_SIZE, BOOK_IMPORT_MAX_BATCH_SIZE
 from app.core.errors import BookNotFound, InvalidStatus
-from app.db.session import get_session
+from app.db.session import get_read_session, get_session
 from app.schemas.book import (
     BookAvailabilityResponse,
     BookCreate,
+    BookImportResponse,
     BookResponse,
     BookUpdate,
 )
+from app.services.book_import_service import BookImportService, resolve_import_format
 from app.services.book_service import BookService
+from app.utils.pagination import set_next_cursor
+from app.utils.snapshot import SnapshotResponse
 
 router = APIRouter()
 service = BookService()
+import_service = BookImportService()
 
 
 @router.post("/", response_model=BookResponse, status_code=status.HTTP_201_CREATED)
@@ -23,6 +29,19 @@ def create_book(book: BookCreate, session: Session = Depends(get_session)):
     return service.create(session=session, book=book)
 
 
+@router.post("/import", response_model=BookImportResponse)
+def import_books(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, description="csv or ndjson"),
+    batch_size: int = Query(
+        BOOK_IMPORT_BATCH_SIZE, ge=1, le=BOOK_IMPORT_MAX_BATCH_SIZE
+    ),
+    session: Session = Depends(get_session),
+):
+    fmt = resolve_import_format(format, file.filename)
+    return import_service.import_books(session, file.file, fmt, batch_size)
+
+
 @router.patch("/{book_key}", response_model=BookResponse)
 def update_book(
     book_key: str, payload: BookUpdate, session: Session = Depends(get_session)
@@ -47,17 +66,24 @@ def change_book_status(
 
 @router.get("/", response_model=List[BookResponse])
 def get_books(
+    response: Response,
     pagination: PaginationParams = Depends(),
     genre: str = None,
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_read_session),
 ):
-    return service.get_all(
-        session=session, skip=pagination.skip, limit=pagination.per_page, genre=genre
+    books = service.get_all(
+        session=session,
+        skip=pagination.skip,
+        limit=pagination.per_page,
+        genre=genre,
+        cursor=pagination.cursor,
     )
+    set_next_cursor(response, books, pagination.per_page, "book_key")
+    return books
 
 
 @router.get("/genres", response_model=List[str])
-def get_genres(session: Session = Depends(get_session)):
+def get_genres(session: Session = Depends(get_read_session)):
     return service.get_genres(session=session)
 
 
@@ -66,7 +92,7 @@ def get_book(book_key: str, session: Session = Depends(get_session)):
     book = service.get_by_key(session=session, book_key=book_key)
     if book is None:
         raise BookNotFound()
-    return book
+    return SnapshotResponse(content=book)
 
 
 @router.get("/{book_key}/availability", response_model=BookAvailabilityResponse)
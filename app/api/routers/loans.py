@@ -1,14 +1,23 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import PaginationParams
 from app.core.errors import LoanNotFound
-from app.db.session import get_session
-from app.schemas.loan import LoanCreate, LoanResponse, LoanReturnRequest
+from app.db.session import get_read_session, get_session
+from app.schemas.loan import (
+    LoanBatchCreate,
+    LoanBatchResponse,
+    LoanBatchReturnRequest,
+    LoanCreate,
+    LoanResponse,
+    LoanReturnRequest,
+)
 from app.services.loan_service import LoanService
+from app.utils.pagination import set_next_cursor
+from app.utils.snapshot import SnapshotResponse
 
 router = APIRouter()
 service = LoanService()
@@ -16,10 +25,11 @@ service = LoanService()
 
 @router.get("/", response_model=List[LoanResponse])
 def get_loans(
+    response: Response,
     status: Optional[str] = None,
     overdue: bool = False,
     pagination: PaginationParams = Depends(),
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_read_session),
 ):
     loans = service.get_all(
         session,
@@ -27,16 +37,30 @@ def get_loans(
         limit=pagination.per_page,
         status=status,
         overdue=overdue,
+        cursor=pagination.cursor,
     )
+    set_next_cursor(response, loans, pagination.per_page, "loan_key")
     return loans
 
 
+@router.post("/batch", response_model=LoanBatchResponse)
+def create_loans_batch(batch: LoanBatchCreate, session: Session = Depends(get_session)):
+    return service.create_batch(session=session, batch=batch)
+
+
+@router.post("/return/batch", response_model=LoanBatchResponse)
+def return_books_batch(
+    batch: LoanBatchReturnRequest, session: Session = Depends(get_session)
+):
+    return service.return_batch(session=session, batch=batch)
+
+
 @router.get("/{loan_key}", response_model=LoanResponse)
 def get_loan(loan_key: UUID, session: Session = Depends(get_session)):
     loan = service.get_by_key(session, loan_key=loan_key)
     if loan is None:
         raise LoanNotFound()
-    return loan
+    return SnapshotResponse(content=loan)
 
 
 @router.post("/", response_model=LoanResponse, status_code=status.HTTP_201_CREATED)
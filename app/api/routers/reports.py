@@ -1,25 +1,82 @@
+import re
 from typing import Optional
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, Response
+from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.deps import PaginationParams
 from app.core.errors import InvalidExportFormat
-from app.db.session import get_session
+from app.db.session import get_read_session, get_session
+from app.schemas.export_job import ExportJobCreate, ExportJobResponse
+from app.schemas.report_stats import LoanStatsRefreshResponse, LoanStatsResponse
+from app.services.export_job_service import ExportJobService
 from app.services.report_service import ReportService
+from app.services.stats_service import StatsService
 
 router = APIRouter()
 report_service = ReportService()
+export_job_service = ExportJobService(report_service=report_service)
+stats_service = StatsService()
+
+ENTITY_TAG_RE = re.compile(r'(?:W/)?"[^"]*"|\*')
+
+
+def _attachment(filename: str) -> dict[str, str]:
+    return {"Content-Disposition": f"attachment; filename={filename}"}
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    # If-None-Match uses weak comparison: W/"x" and "x" refer to the same entity.
+    tags = ENTITY_TAG_RE.findall(header)
+    return "*" in tags or etag.removeprefix("W/") in {
+        tag.removeprefix("W/") for tag in tags
+    }
+
+
+def _not_modified(request: Request, etag: Optional[str]) -> Optional[Response]:
+    if etag and _etag_matches(request.headers.get("If-None-Match", ""), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    return None
+
+
+def _export_response(
+    content: bytes, media_type: str, filename: str, etag: Optional[str]
+) -> Response:
+    headers = _attachment(filename)
+    if etag:
+        headers["ETag"] = etag
+    return Response(content=content, media_type=media_type, headers=headers)
 
 
 @router.get("/reports/loans/export")
 def export_loans(
+    request: Request,
     format: str = "csv",
     status_filter: Optional[str] = None,
     overdue: bool = False,
+    stream: bool = False,
     pagination: PaginationParams = Depends(),
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_read_session),
 ):
+    if stream:
+        content, media_type, filename = report_service.stream_loans(
+            session=session, status_filter=status_filter, overdue=overdue, fmt=format
+        )
+        return StreamingResponse(
+            content, media_type=media_type, headers=_attachment(filename)
+        )
+
+    filters = {"status_filter": status_filter, "overdue": overdue}
+    etag = report_service.export_etag(
+        "loans", format, pagination.skip, pagination.per_page, **filters
+    )
+    if not_modified := _not_modified(request, etag):
+        return not_modified
+
     try:
         content, media_type, filename = report_service.export_loans(
             session=session,
@@ -32,16 +89,32 @@ def export_loans(
     except ValueError as exc:
         raise InvalidExportFormat(str(exc))
 
-    headers = {"Content-Disposition": f"attachment; filename={filename}"}
-    return Response(content=content, media_type=media_type, headers=headers)
+    return _export_response(content, media_type, filename, etag)
 
 
 @router.get("/reports/users/export")
 def export_users(
+    request: Request,
     format: str = "csv",
+    stream: bool = False,
     pagination: PaginationParams = Depends(),
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_read_session),
 ):
+    if stream:
+        content, media_type, filename = report_service.stream_users(
+            session=session, fmt=format
+        )
+        return StreamingResponse(
+            content, media_type=media_type, headers=_attachment(filename)
+        )
+
+    filters: dict = {}
+    etag = report_service.export_etag(
+        "users", format, pagination.skip, pagination.per_page, **filters
+    )
+    if not_modified := _not_modified(request, etag):
+        return not_modified
+
     try:
         content, media_type, filename = report_service.export_users(
             session=session,
@@ -52,17 +125,33 @@ def export_users(
     except ValueError as exc:
         raise InvalidExportFormat(str(exc))
 
-    headers = {"Content-Disposition": f"attachment; filename={filename}"}
-    return Response(content=content, media_type=media_type, headers=headers)
+    return _export_response(content, media_type, filename, etag)
 
 
 @router.get("/reports/books/export")
 def export_books(
+    request: Request,
     format: str = "csv",
     genre: Optional[str] = None,
+    stream: bool = False,
     pagination: PaginationParams = Depends(),
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_read_session),
 ):
+    if stream:
+        content, media_type, filename = report_service.stream_books(
+            session=session, genre=genre, fmt=format
+        )
+        return StreamingResponse(
+            content, media_type=media_type, headers=_attachment(filename)
+        )
+
+    filters = {"genre": genre}
+    etag = report_service.export_etag(
+        "books", format, pagination.skip, pagination.per_page, **filters
+    )
+    if not_modified := _not_modified(request, etag):
+        return not_modified
+
     try:
         content, media_type, filename = report_service.export_books(
             session=session,
@@ -74,19 +163,43 @@ def export_books(
     except ValueError as exc:
         raise InvalidExportFormat(str(exc))
 
-    headers = {"Content-Disposition": f"attachment; filename={filename}"}
-    return Response(content=content, media_type=media_type, headers=headers)
+    return _export_response(content, media_type, filename, etag)
 
 
 @router.get("/reports/reservations/export")
 def export_reservations(
+    request: Request,
     format: str = "csv",
     user_key: Optional[str] = None,
     book_key: Optional[str] = None,
     status_filter: Optional[str] = None,
+    stream: bool = False,
     pagination: PaginationParams = Depends(),
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_read_session),
 ):
+    if stream:
+        content, media_type, filename = report_service.stream_reservations(
+            session=session,
+            user_key=user_key,
+            book_key=book_key,
+            status_filter=status_filter,
+            fmt=format,
+        )
+        return StreamingResponse(
+            content, media_type=media_type, headers=_attachment(filename)
+        )
+
+    filters = {
+        "user_key": user_key,
+        "book_key": book_key,
+        "status_filter": status_filter,
+    }
+    etag = report_service.export_etag(
+        "reservations", format, pagination.skip, pagination.per_page, **filters
+    )
+    if not_modified := _not_modified(request, etag):
+        return not_modified
+
     try:
         content, media_type, filename = report_service.export_reservations(
             session=session,
@@ -100,5 +213,40 @@ def export_reservations(
     except ValueError as exc:
         raise InvalidExportFormat(str(exc))
 
-    headers = {"Content-Disposition": f"attachment; filename={filename}"}
-    return Response(content=content, media_type=media_type, headers=headers)
+    return _export_response(content, media_type, filename, etag)
+
+
+@router.post(
+    "/reports/jobs",
+    response_model=ExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def submit_export_job(job: ExportJobCreate, session: Session = Depends(get_session)):
+    return export_job_service.submit(session=session, data=job)
+
+
+@router.get("/reports/jobs/{job_key}", response_model=ExportJobResponse)
+def get_export_job(job_key: UUID, session: Session = Depends(get_session)):
+    return export_job_service.get_by_key(session=session, job_key=job_key)
+
+
+@router.get("/reports/jobs/{job_key}/download")
+def download_export_job(job_key: UUID, session: Session = Depends(get_session)):
+    path, media_type, filename = export_job_service.get_download(
+        session=session, job_key=job_key
+    )
+    return FileResponse(path, media_type=media_type, filename=filename)
+
+
+@router.get("/reports/stats/loans", response_model=LoanStatsResponse)
+def get_loan_stats(
+    group_by: str = "status",
+    live: bool = False,
+    session: Session = Depends(get_read_session),
+):
+    return stats_service.get_loan_stats(session=session, group_by=group_by, live=live)
+
+
+@router.post("/reports/stats/refresh", response_model=LoanStatsRefreshResponse)
+def refresh_stats(session: Session = Depends(get_session)):
+    return stats_service.refresh(session=session)
@@ -1,13 +1,15 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.orm import Session
 
 from app.core.errors import ReservationNotFound
-from app.db.session import get_session
+from app.db.session import get_read_session, get_session
 from app.schemas.reservation import ReservationCreate, ReservationResponse
 from app.services.reservation_service import ReservationService
+from app.utils.pagination import set_next_cursor
+from app.utils.snapshot import SnapshotResponse
 
 router = APIRouter()
 service = ReservationService()
@@ -25,21 +27,26 @@ def create_reservation(
 
 @router.get("/", response_model=List[ReservationResponse])
 def get_reservations(
+    response: Response,
     user_key: Optional[str] = None,
     book_key: Optional[str] = None,
     status: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-    session: Session = Depends(get_session),
+    cursor: Optional[str] = None,
+    session: Session = Depends(get_read_session),
 ):
-    return service.get_all(
+    reservations = service.get_all(
         session,
         skip=skip,
         limit=limit,
         user_key=user_key,
         book_key=book_key,
         status=status,
+        cursor=cursor,
     )
+    set_next_cursor(response, reservations, limit, "reservation_key")
+    return reservations
 
 
 @router.get("/{reservation_key}", response_model=ReservationResponse)
@@ -47,7 +54,7 @@ def get_reservation(reservation_key: UUID, session: Session = Depends(get_sessio
     reservation = service.get_by_key(session, reservation_key)
     if reservation is None:
         raise ReservationNotFound()
-    return reservation
+    return SnapshotResponse(content=reservation)
 
 
 @router.delete("/{reservation_key}", response_model=ReservationResponse)
@@ -1,15 +1,25 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import PaginationParams
 from app.core.errors import InvalidStatus, UserNotFound
-from app.db.session import get_session
+from app.db.session import get_read_session, get_session
 from app.schemas.loan import LoanResponse
-from app.schemas.user import UserCreate, UserResponse, UserUpdate
+from app.schemas.user import (
+    UserBulkCreate,
+    UserBulkCreateResponse,
+    UserBulkStatusResponse,
+    UserBulkStatusUpdate,
+    UserCreate,
+    UserResponse,
+    UserUpdate,
+)
 from app.services.user_service import UserService
+from app.utils.pagination import set_next_cursor
+from app.utils.snapshot import SnapshotResponse
 
 router = APIRouter()
 service = UserService()
@@ -20,6 +30,23 @@ def create_user(user: UserCreate, session: Session = Depends(get_session)):
     return service.create(session=session, user=user)
 
 
+@router.post("/batch", response_model=UserBulkCreateResponse)
+def create_users_batch(
+    payload: UserBulkCreate, session: Session = Depends(get_session)
+):
+    return service.create_many(session=session, users=payload.users)
+
+
+@router.post("/batch/status", response_model=UserBulkStatusResponse)
+def change_users_status(
+    payload: UserBulkStatusUpdate, session: Session = Depends(get_session)
+):
+    updated = service.set_status_many(session=session, data=payload)
+    if updated is None:
+        raise InvalidStatus()
+    return updated
+
+
 @router.patch("/{user_key}", response_model=UserResponse)
 def update_user(
     user_key: UUID, payload: UserUpdate, session: Session = Depends(get_session)
@@ -44,9 +71,18 @@ def change_user_status(
 
 @router.get("/", response_model=List[UserResponse])
 def get_users(
-    pagination: PaginationParams = Depends(), session: Session = Depends(get_session)
+    response: Response,
+    pagination: PaginationParams = Depends(),
+    session: Session = Depends(get_read_session),
 ):
-    return service.get_all(session, skip=pagination.skip, limit=pagination.per_page)
+    users = service.get_all(
+        session,
+        skip=pagination.skip,
+        limit=pagination.per_page,
+        cursor=pagination.cursor,
+    )
+    set_next_cursor(response, users, pagination.per_page, "user_key")
+    return users
 
 
 @router.get("/{user_key}", response_model=UserResponse)
@@ -54,11 +90,12 @@ def get_user(user_key: UUID, session: Session = Depends(get_session)):
     user = service.get_by_key(session, user_key)
     if user is None:
         raise UserNotFound()
-    return user
+    return SnapshotResponse(content=user)
 
 
 @router.get("/{user_key}/loans", response_model=List[LoanResponse])
 def get_user_loans(
+    response: Response,
     user_key: UUID,
     status: Optional[str] = None,
     pagination: PaginationParams = Depends(),
@@ -70,5 +107,7 @@ def get_user_loans(
         skip=pagination.skip,
         limit=pagination.per_page,
         status=status,
+        cursor=pagination.cursor,
     )
+    set_next_cursor(response, loans, pagination.per_page, "loan_key")
     return loans
@@ -0,0 +1,44 @@
+"""Bulk-load books from a CSV or NDJSON catalog file.
+
+    python -m app.cli.import_books catalog.csv --batch-size 5000
+    python -m app.cli.import_books - --format ndjson < catalog.ndjson
+
+CSV files need a header with title, author and (optionally) genre columns;
+NDJSON files hold one JSON object per line with the same keys.
+"""
+
+import argparse
+import sys
+
+from app.core.constants import BOOK_IMPORT_BATCH_SIZE, BOOK_IMPORT_FORMATS
+from app.db.session import SessionLocal
+from app.services.book_import_service import BookImportService, resolve_import_format
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="catalog file, or - for stdin")
+    parser.add_argument("--format", choices=BOOK_IMPORT_FORMATS)
+    parser.add_argument("--batch-size", type=int, default=BOOK_IMPORT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    fmt = resolve_import_format(args.format, args.path)
+    stream = sys.stdin.buffer if args.path == "-" else open(args.path, "rb")
+
+    with stream, SessionLocal() as session:
+        result = BookImportService().import_books(
+            session, stream, fmt, batch_size=args.batch_size
+        )
+
+    for error in result.errors:
+        print(f"line {error.line}: {'; '.join(error.errors)}", file=sys.stderr)
+    print(
+        f"imported {result.imported}/{result.received} rows "
+        f"({result.failed} rejected) in {result.batches} batches, "
+        f"{result.elapsed_seconds:.2f}s, {result.rows_per_second:.0f} rows/s"
+    )
+    return 1 if result.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
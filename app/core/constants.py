@@ -1,5 +1,6 @@
 import os
-from typing import List
+import tempfile
+from typing import Dict, List
 
 from dotenv import load_dotenv
 
@@ -8,6 +9,14 @@ load_dotenv()
 DATABASE_URL: str | None = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL must be set via environment or .env")
+DATABASE_READ_URL: str | None = os.getenv("DATABASE_READ_URL")
+DB_MODE: str = os.getenv("DB_MODE", "sync")
+DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_STATEMENT_TIMEOUT_MS: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
 SECURITY_USER: str = os.getenv("USER", "admin")
 SECURITY_PASS: str = os.getenv("PASSWORD", "password123")
 
@@ -18,10 +27,46 @@ def get_notify_webhook_url() -> str | None:
     return os.getenv("NOTIFY_WEBHOOK_URL")
 
 
+NOTIFY_TIMEOUT: float = float(os.getenv("NOTIFY_TIMEOUT", "3"))
+NOTIFY_BATCH_SIZE: int = int(os.getenv("NOTIFY_BATCH_SIZE", "50"))
+NOTIFY_MAX_ATTEMPTS: int = int(os.getenv("NOTIFY_MAX_ATTEMPTS", "5"))
+NOTIFY_BACKOFF_SECONDS: float = float(os.getenv("NOTIFY_BACKOFF_SECONDS", "5"))
+NOTIFY_BACKOFF_MAX_SECONDS: float = float(
+    os.getenv("NOTIFY_BACKOFF_MAX_SECONDS", "900")
+)
+NOTIFY_POLL_INTERVAL: float = float(os.getenv("NOTIFY_POLL_INTERVAL", "1"))
+NOTIFY_HTTP_POOL_SIZE: int = int(os.getenv("NOTIFY_HTTP_POOL_SIZE", "4"))
+NOTIFY_LEASE_SECONDS: float = float(
+    os.getenv("NOTIFY_LEASE_SECONDS", str(NOTIFY_TIMEOUT * NOTIFY_BATCH_SIZE + 30))
+)
+NOTIFY_RETENTION_SECONDS: int = int(os.getenv("NOTIFY_RETENTION_SECONDS", "604800"))
+NOTIFY_PURGE_INTERVAL: float = float(os.getenv("NOTIFY_PURGE_INTERVAL", "3600"))
+
+
+def get_rabbitmq_url() -> str | None:
+    return os.getenv("RABBITMQ_URL")
+
+
+EVENTS_EXCHANGE: str = os.getenv("EVENTS_EXCHANGE", "library.events")
+EVENTS_BATCH_SIZE: int = int(os.getenv("EVENTS_BATCH_SIZE", "100"))
+EVENTS_BATCH_LINGER_MS: int = int(os.getenv("EVENTS_BATCH_LINGER_MS", "20"))
+EVENTS_POLL_INTERVAL: float = float(os.getenv("EVENTS_POLL_INTERVAL", "1"))
+EVENTS_LEASE_SECONDS: float = float(os.getenv("EVENTS_LEASE_SECONDS", "30"))
+
+
 LOAN_DEFAULT_DAYS: int = 14
 LOAN_FINE_PER_DAY: float = 2.0
 LOAN_MAX_ACTIVE_LOANS: int = 3
 LOAN_RENEWAL_EXTENSION_DAYS: int = 7
+LOAN_FAST_CHECKOUT: bool = os.getenv("LOAN_FAST_CHECKOUT", "false").lower() == "true"
+LOAN_BATCH_MAX_ITEMS: int = int(os.getenv("LOAN_BATCH_MAX_ITEMS", "50"))
+
+USER_BULK_MAX_ITEMS: int = int(os.getenv("USER_BULK_MAX_ITEMS", "1000"))
+
+BOOK_IMPORT_BATCH_SIZE: int = int(os.getenv("BOOK_IMPORT_BATCH_SIZE", "1000"))
+BOOK_IMPORT_MAX_BATCH_SIZE: int = 10_000
+BOOK_IMPORT_MAX_ERRORS: int = int(os.getenv("BOOK_IMPORT_MAX_ERRORS", "100"))
+BOOK_IMPORT_FORMATS: tuple[str, ...] = ("csv", "ndjson")
 
 RESERVATION_EXPIRY_DAYS: int = 7
 
@@ -29,10 +74,46 @@ CACHE_MAX_SIZE: int = 1000
 CACHE_DEFAULT_TTL: int = 300
 CACHE_ENTITY_TTL: int = 60
 CACHE_STATUS_TTL: int = 300
+CACHE_STATUS_MISS_RELOAD: int = 5
+CACHE_NAMESPACE_LIMITS: Dict[str, int] = {
+    "book": int(os.getenv("CACHE_BOOK_MAX_SIZE", "1000")),
+    "user": int(os.getenv("CACHE_USER_MAX_SIZE", "1000")),
+    "loan": int(os.getenv("CACHE_LOAN_MAX_SIZE", "1000")),
+    "reservation": int(os.getenv("CACHE_RESERVATION_MAX_SIZE", "1000")),
+    "report": int(os.getenv("CACHE_REPORT_MAX_SIZE", "50")),
+}
+
+CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "memory")
+CACHE_INVALIDATION_CHANNEL: str = "cache:invalidate"
+
+REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+REDIS_SOCKET_TIMEOUT: float = float(os.getenv("REDIS_SOCKET_TIMEOUT", "0.5"))
 
 RATE_LIMIT_REQUESTS: int = 100
 RATE_LIMIT_WINDOW: int = 60
-RATE_LIMIT_CLEANUP_INTERVAL: int = 600
+RATE_LIMIT_MAX_KEYS: int = 100_000
+RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "memory")
+
+REPORT_STREAM_CHUNK_SIZE: int = int(os.getenv("REPORT_STREAM_CHUNK_SIZE", "1000"))
+REPORT_PDF_SAMPLE_ROWS: int = int(os.getenv("REPORT_PDF_SAMPLE_ROWS", "200"))
+PDF_READ_SIZE: int = 64 * 1024
+RENDER_POOL_WORKERS: int = int(os.getenv("RENDER_POOL_WORKERS", "2"))
+RENDER_POOL_MAX_PENDING: int = int(os.getenv("RENDER_POOL_MAX_PENDING", "4"))
+RENDER_POOL_MIN_ROWS: int = int(os.getenv("RENDER_POOL_MIN_ROWS", "500"))
+REPORT_CACHE_TTL: int = int(os.getenv("REPORT_CACHE_TTL", "300"))
+REPORT_CACHE_MAX_BYTES: int = int(os.getenv("REPORT_CACHE_MAX_BYTES", str(5 * 2**20)))
+EXPORT_JOB_WORKERS: int = int(os.getenv("EXPORT_JOB_WORKERS", "2"))
+EXPORT_STORAGE_DIR: str = os.getenv(
+    "EXPORT_STORAGE_DIR", os.path.join(tempfile.gettempdir(), "library-exports")
+)
+EXPORT_JOB_STALE_SECONDS: int = int(os.getenv("EXPORT_JOB_STALE_SECONDS", "3600"))
+EXPORT_FILE_TTL_SECONDS: int = int(os.getenv("EXPORT_FILE_TTL_SECONDS", "86400"))
+REPORT_STATS_REFRESH_SECONDS: int = int(os.getenv("REPORT_STATS_REFRESH_SECONDS", "0"))
+REPORT_STATS_MAX_AGE_SECONDS: int = int(
+    os.getenv(
+        "REPORT_STATS_MAX_AGE_SECONDS", str(max(3600, 2 * REPORT_STATS_REFRESH_SECONDS))
+    )
+)
 
 PAGINATION_MIN: int = 100
 PAGINATION_MAX_LIMIT: int = 1000
@@ -235,6 +235,72 @@ class InvalidExportFormat(CustomError):
         )
 
 
+class InvalidCursor(CustomError):
+    def __init__(self):
+        super().__init__(
+            code="LBS019",
+            title="Invalid cursor",
+            description="The provided pagination cursor is invalid",
+            translation="O cursor de paginação fornecido é inválido",
+            http_status=status.HTTP_400_BAD_REQUEST,
+        )
+
+
+class ExportJobNotFound(CustomError):
+    def __init__(self):
+        super().__init__(
+            code="LBS020",
+            title="Export job not found",
+            description="The requested export job does not exist",
+            translation="O job de exportação solicitado não existe",
+            http_status=status.HTTP_404_NOT_FOUND,
+        )
+
+
+class ExportJobNotReady(CustomError):
+    def __init__(self):
+        super().__init__(
+            code="LBS021",
+            title="Export job not ready",
+            description="The export job has not completed successfully yet",
+            translation="O job de exportação ainda não foi concluído com sucesso",
+            http_status=status.HTTP_409_CONFLICT,
+        )
+
+
+class InvalidStatsGroup(CustomError):
+    def __init__(self):
+        super().__init__(
+            code="LBS022",
+            title="Invalid stats grouping",
+            description="Stats can be grouped by status, genre or month",
+            translation="Estatísticas podem ser agrupadas por status, gênero ou mês",
+            http_status=status.HTTP_400_BAD_REQUEST,
+        )
+
+
+class InvalidImportFormat(CustomError):
+    def __init__(self):
+        super().__init__(
+            code="LBS023",
+            title="Invalid import format",
+            description="Catalog imports accept csv or ndjson",
+            translation="Importações de catálogo aceitam csv ou ndjson",
+            http_status=status.HTTP_400_BAD_REQUEST,
+        )
+
+
+class ExportFileUnavailable(CustomError):
+    def __init__(self):
+        super().__init__(
+            code="LBS024",
+            title="Export file unavailable",
+            description="The export file has expired or is not reachable from this node",
+            translation="O arquivo exportado expirou ou não está acessível neste nó",
+            http_status=status.HTTP_410_GONE,
+        )
+
+
 def http_error(
     error: CustomError, *, extra: Optional[Dict[str, Any]] = None
 ) -> CustomError:
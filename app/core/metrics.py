@@ -1,4 +1,10 @@
-from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
 
 REQUEST_COUNT = Counter(
     "http_requests_total", "Total HTTP requests", ["method", "path", "status"]
@@ -6,6 +12,51 @@ REQUEST_COUNT = Counter(
 REQUEST_LATENCY = Histogram(
     "http_request_duration_seconds", "Request duration in seconds", ["method", "path"]
 )
+CACHE_HITS = Counter("cache_hits_total", "Cache hits", ["namespace"])
+CACHE_MISSES = Counter("cache_misses_total", "Cache misses", ["namespace"])
+CACHE_EVICTIONS = Counter(
+    "cache_evictions_total", "Cache evictions", ["namespace", "reason"]
+)
+CACHE_ENTRIES = Gauge("cache_entries", "Entries currently cached", ["namespace"])
+CACHE_REDIS_HITS = Counter("cache_redis_hits_total", "Redis cache hits", ["namespace"])
+CACHE_REDIS_MISSES = Counter(
+    "cache_redis_misses_total", "Redis cache misses", ["namespace"]
+)
+CACHE_REDIS_ERRORS = Counter(
+    "cache_redis_errors_total", "Failed Redis cache operations", ["operation"]
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Connections currently checked out", ["pool"]
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "Connections opened beyond pool_size", ["pool"]
+)
+DB_POOL_SIZE = Gauge("db_pool_size", "Configured pool size", ["pool"])
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    ["pool"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+REPORT_RENDER_QUEUE_DEPTH = Gauge(
+    "report_render_queue_depth", "Report renders waiting for or running in the pool"
+)
+REPORT_RENDER_DURATION = Histogram(
+    "report_render_duration_seconds",
+    "Time spent rendering report exports",
+    ["renderer", "mode"],
+)
+NOTIFICATIONS = Counter(
+    "notifications_total", "Outbox notification delivery attempts", ["result"]
+)
+DOMAIN_EVENTS = Counter(
+    "domain_events_total", "Domain events relayed to the broker", ["result"]
+)
+BOOK_IMPORT_ROWS = Counter(
+    "book_import_rows_total", "Rows processed by the catalog import", ["result"]
+)
 
 
 def record_request(
@@ -16,5 +67,63 @@ def record_request(
     REQUEST_LATENCY.labels(METHOD, path).observe(duration_seconds)
 
 
+def record_cache_hit(namespace: str) -> None:
+    CACHE_HITS.labels(namespace).inc()
+
+
+def record_cache_miss(namespace: str) -> None:
+    CACHE_MISSES.labels(namespace).inc()
+
+
+def record_cache_eviction(namespace: str, reason: str) -> None:
+    CACHE_EVICTIONS.labels(namespace, reason).inc()
+
+
+def record_cache_size(namespace: str, size: int) -> None:
+    CACHE_ENTRIES.labels(namespace).set(size)
+
+
+def record_cache_redis_hit(namespace: str) -> None:
+    CACHE_REDIS_HITS.labels(namespace).inc()
+
+
+def record_cache_redis_miss(namespace: str) -> None:
+    CACHE_REDIS_MISSES.labels(namespace).inc()
+
+
+def record_cache_redis_error(operation: str) -> None:
+    CACHE_REDIS_ERRORS.labels(operation).inc()
+
+
+def register_db_pool(name: str, pool) -> None:
+    DB_POOL_CHECKED_OUT.labels(name).set_function(pool.checkedout)
+    DB_POOL_OVERFLOW.labels(name).set_function(lambda: max(pool.overflow(), 0))
+    DB_POOL_SIZE.labels(name).set_function(pool.size)
+
+
+def record_db_pool_wait(name: str, seconds: float) -> None:
+    DB_POOL_WAIT.labels(name).observe(seconds)
+
+
+def record_render_queued(delta: int) -> None:
+    REPORT_RENDER_QUEUE_DEPTH.inc(delta)
+
+
+def record_render(renderer: str, mode: str, seconds: float) -> None:
+    REPORT_RENDER_DURATION.labels(renderer=renderer, mode=mode).observe(seconds)
+
+
+def record_notification(result: str) -> None:
+    NOTIFICATIONS.labels(result=result).inc()
+
+
+def record_domain_events(result: str, count: int = 1) -> None:
+    DOMAIN_EVENTS.labels(result=result).inc(count)
+
+
+def record_book_import(result: str, count: int) -> None:
+    BOOK_IMPORT_ROWS.labels(result=result).inc(count)
+
+
 def render_prometheus() -> tuple[bytes, str]:
     return generate_latest(), CONTENT_TYPE_LATEST
@@ -0,0 +1,139 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.constants import (
+    RATE_LIMIT_BACKEND,
+    RATE_LIMIT_MAX_KEYS,
+    RATE_LIMIT_REQUESTS,
+    RATE_LIMIT_WINDOW,
+    REDIS_SOCKET_TIMEOUT,
+    REDIS_URL,
+)
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or capacity
+local updated_at = tonumber(bucket[2]) or now
+
+tokens = math.min(capacity, tokens + math.max(now - updated_at, 0) * rate)
+
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate * 1000) + 1000)
+
+return {allowed, tostring(tokens), tostring(now)}
+"""
+
+
+@dataclass
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_at: float
+    retry_after: float
+
+
+class TokenBucketRateLimiter(ABC):
+    def __init__(
+        self, capacity: int = RATE_LIMIT_REQUESTS, window: int = RATE_LIMIT_WINDOW
+    ) -> None:
+        self.capacity = capacity
+        self.refill_rate = capacity / window
+
+    def _result(self, allowed: bool, tokens: float, now: float) -> RateLimitResult:
+        return RateLimitResult(
+            allowed=allowed,
+            limit=self.capacity,
+            remaining=int(tokens),
+            reset_at=now + (self.capacity - tokens) / self.refill_rate,
+            retry_after=0.0 if allowed else (1 - tokens) / self.refill_rate,
+        )
+
+    @abstractmethod
+    async def hit(self, key: str) -> RateLimitResult: ...
+
+
+class MemoryRateLimiter(TokenBucketRateLimiter):
+    def __init__(
+        self,
+        capacity: int = RATE_LIMIT_REQUESTS,
+        window: int = RATE_LIMIT_WINDOW,
+        max_keys: int = RATE_LIMIT_MAX_KEYS,
+    ) -> None:
+        super().__init__(capacity, window)
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def hit(self, key: str) -> RateLimitResult:
+        # No awaits below: the update is atomic with respect to the event loop.
+        now = time.time()
+        tokens, updated_at = self._buckets.pop(key, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - updated_at) * self.refill_rate)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+
+        self._buckets[key] = (tokens, now)
+        # The least recently seen bucket has had the longest time to refill.
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+        return self._result(allowed, tokens, now)
+
+
+class RedisRateLimiter(TokenBucketRateLimiter):
+    def __init__(
+        self,
+        client: aioredis.Redis,
+        capacity: int = RATE_LIMIT_REQUESTS,
+        window: int = RATE_LIMIT_WINDOW,
+    ) -> None:
+        super().__init__(capacity, window)
+        self.client = client
+        self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    async def hit(self, key: str) -> RateLimitResult:
+        try:
+            allowed, tokens, now = await self._script(
+                keys=[key], args=[self.capacity, self.refill_rate]
+            )
+        except RedisError as exc:
+            # Fail open: an unavailable limiter must not take the API down.
+            logger.warning(
+                "rate_limit_backend_error",
+                extra={"operation": "rate_limit", "details": str(exc)},
+            )
+            return self._result(True, self.capacity, time.time())
+
+        return self._result(bool(allowed), float(tokens), float(now))
+
+
+def build_rate_limiter() -> TokenBucketRateLimiter:
+    if RATE_LIMIT_BACKEND == "redis":
+        client = aioredis.Redis.from_url(
+            REDIS_URL,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+        )
+        return RedisRateLimiter(client)
+    return MemoryRateLimiter()
@@ -0,0 +1,60 @@
+from fastapi import Request
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.constants import DATABASE_READ_URL, DATABASE_URL
+from app.db.pool import engine_options, instrument_pool
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+ASYNC_DATABASE_URL = to_async_url(DATABASE_URL)
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, echo=False, **engine_options(ASYNC_DATABASE_URL)
+)
+instrument_pool(async_engine.sync_engine, "async")
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+if DATABASE_READ_URL:
+    ASYNC_DATABASE_READ_URL = to_async_url(DATABASE_READ_URL)
+    async_read_engine = create_async_engine(
+        ASYNC_DATABASE_READ_URL, echo=False, **engine_options(ASYNC_DATABASE_READ_URL)
+    )
+    instrument_pool(async_read_engine.sync_engine, "async_replica")
+else:
+    async_read_engine = async_engine
+
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_read_engine, autoflush=False, expire_on_commit=False
+)
+
+
+async def get_async_session(request: Request = None):
+    async with AsyncSessionLocal() as session:
+        if request is not None:
+            request.state.primary_session = session
+        yield session
+
+
+async def get_async_read_session(request: Request = None):
+    primary = getattr(request.state, "primary_session", None) if request else None
+    if primary is not None:
+        yield primary
+        return
+
+    async with AsyncReadSessionLocal() as session:
+        yield session
@@ -0,0 +1,74 @@
+import time
+
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.constants import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_STATEMENT_TIMEOUT_MS,
+)
+from app.core.metrics import record_db_pool_wait, register_db_pool
+
+
+class _WaitTimingMixin:
+    metrics_name = "primary"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            record_db_pool_wait(self.metrics_name, time.perf_counter() - start)
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(
+    url: str, statement_timeout_ms: int = DB_STATEMENT_TIMEOUT_MS
+) -> dict:
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        return {}
+
+    is_async = parsed.get_dialect().is_async
+    options = {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+    # Off by default: it applies to every connection, including report/export reads.
+    if statement_timeout_ms and parsed.get_backend_name() == "postgresql":
+        if parsed.get_driver_name() == "asyncpg":
+            options["connect_args"] = {
+                "server_settings": {"statement_timeout": str(statement_timeout_ms)}
+            }
+        else:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={statement_timeout_ms}"
+            }
+
+    return options
+
+
+def instrument_pool(engine: Engine, name: str) -> None:
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return
+
+    if isinstance(pool, _WaitTimingMixin):
+        pool.metrics_name = name
+    register_db_pool(name, pool)
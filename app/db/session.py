@@ -1,17 +1,55 @@
+from fastapi import Request
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
-from app.core.constants import DATABASE_URL
+from app.core.constants import DATABASE_READ_URL, DATABASE_URL
+from app.db.pool import engine_options, instrument_pool
 
-engine = create_engine(DATABASE_URL, echo=False)
+engine = create_engine(DATABASE_URL, echo=False, **engine_options(DATABASE_URL))
+instrument_pool(engine, "primary")
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
-Base = declarative_base()
+if DATABASE_READ_URL:
+    read_engine = create_engine(
+        DATABASE_READ_URL, echo=False, **engine_options(DATABASE_READ_URL)
+    )
+    instrument_pool(read_engine, "replica")
+else:
+    read_engine = engine
 
+ReadSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=read_engine
+)
 
-def get_session():
+
+class _EagerDefaults:
+    # Server defaults (created_at, ...) come back in the INSERT's RETURNING.
+    __mapper_args__ = {"eager_defaults": True}
+
+
+Base = declarative_base(cls=_EagerDefaults)
+
+
+def get_session(request: Request = None):
     db = SessionLocal()
+    if request is not None:
+        request.state.primary_session = db
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_read_session(request: Request = None):
+    primary = getattr(request.state, "primary_session", None) if request else None
+    if primary is not None:
+        yield primary
+        return
+
+    db = ReadSessionLocal()
     try:
         yield db
     finally:
@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
@@ -11,16 +13,63 @@ from app.api.routers import (
     reservations,
     users,
 )
-from app.core.constants import APP_NAME
-from app.core.logger import configure_logging
+from app.core.constants import APP_NAME, DB_MODE
+from app.core.logger import configure_logging, get_logger
 from app.core.middlewares import basic_auth, log_requests
 from app.core.middlewares import metrics as metrics_middleware
 from app.core.middlewares import rate_limit
+from app.db.session import SessionLocal
+from app.services.event_publisher import start_event_publisher, stop_event_publisher
+from app.services.export_job_service import (
+    recover_export_jobs,
+    shutdown_export_executor,
+)
+from app.services.notification_dispatcher import (
+    start_notification_dispatcher,
+    stop_notification_dispatcher,
+)
+from app.services.render_pool import shutdown_render_executor
+from app.services.stats_service import start_stats_refresher, stop_stats_refresher
+from app.utils.cache import start_cache_listener, stop_cache_listener
+from app.utils.status_registry import warm_status_registry
 
 configure_logging()
+logger = get_logger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        with SessionLocal() as session:
+            warm_status_registry(session)
+    except Exception as exc:
+        logger.warning("status_registry_warmup_failed", extra={"details": str(exc)})
+    try:
+        recover_export_jobs()
+    except Exception as exc:
+        logger.warning("export_job_recovery_failed", extra={"details": str(exc)})
+    start_cache_listener()
+    start_stats_refresher()
+    start_notification_dispatcher()
+    start_event_publisher()
+    yield
+    stop_event_publisher()
+    stop_notification_dispatcher()
+    stop_stats_refresher()
+    stop_cache_listener()
+    shutdown_export_executor()
+    shutdown_render_executor()
+    if DB_MODE == "async":
+        from app.db.async_session import async_engine, async_read_engine
+
+        await async_engine.dispose()
+        if async_read_engine is not async_engine:
+            await async_read_engine.dispose()
+
 
 app = FastAPI(
     title=APP_NAME,
+    lifespan=lifespan,
     docs_url="/docs",
     description="Library System API - Use Local Auth (default: admin/password123)",
     swagger_ui_parameters={
@@ -37,7 +86,7 @@ app.add_middleware(
     ],
     allow_credentials=True,
     allow_methods=["*"],
-    allow_headers=["*"]
+    allow_headers=["*"],
 )
 
 
@@ -67,9 +116,45 @@ app.middleware("http")(log_requests)
 
 app.include_router(healthcheck.router, prefix="", tags=["System"])
 
-app.include_router(users.router, prefix="/users", tags=["Users"])
-app.include_router(books.router, prefix="/books", tags=["Books"])
-app.include_router(loans.router, prefix="/loans", tags=["Loans"])
-app.include_router(reservations.router, prefix="/reservations", tags=["Reservations"])
+if DB_MODE == "async":
+    from app.api.routers.aio import books as async_books
+    from app.api.routers.aio import loans as async_loans
+    from app.api.routers.aio import reservations as async_reservations
+    from app.api.routers.aio import users as async_users
+
+    app.include_router(async_users.router, prefix="/users", tags=["Users"])
+    app.include_router(async_books.router, prefix="/books", tags=["Books"])
+    app.include_router(async_loans.router, prefix="/loans", tags=["Loans"])
+    app.include_router(
+        async_reservations.router, prefix="/reservations", tags=["Reservations"]
+    )
+
+# In async mode the sync routers stay mounted (hidden from the docs) so that
+# endpoints without an async twin keep working; async routes match first.
+include_sync_in_schema = DB_MODE != "async"
+app.include_router(
+    users.router,
+    prefix="/users",
+    tags=["Users"],
+    include_in_schema=include_sync_in_schema,
+)
+app.include_router(
+    books.router,
+    prefix="/books",
+    tags=["Books"],
+    include_in_schema=include_sync_in_schema,
+)
+app.include_router(
+    loans.router,
+    prefix="/loans",
+    tags=["Loans"],
+    include_in_schema=include_sync_in_schema,
+)
+app.include_router(
+    reservations.router,
+    prefix="/reservations",
+    tags=["Reservations"],
+    include_in_schema=include_sync_in_schema,
+)
 app.include_router(metrics.router, prefix="", tags=["System"])
 app.include_router(reports.router, prefix="", tags=["Reports"])
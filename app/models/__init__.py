@@ -1,9 +1,13 @@
 from .book import Book
 from .book_event import BookEvent
 from .book_status import BookStatus
+from .event_outbox import EventOutbox
+from .export_job import ExportJob
 from .loan import Loan
 from .loan_event import LoanEvent
+from .loan_stat import LoanStat
 from .loan_status import LoanStatus
+from .notification_outbox import NotificationOutbox
 from .reservation import Reservation
 from .reservation_event import ReservationEvent
 from .reservation_status import ReservationStatus
@@ -10,7 +10,7 @@ class BookEvent(Base):
     __tablename__ = "book_events"
 
     id = Column(Integer, primary_key=True, index=True)
-    book_id = Column(Integer, ForeignKey("books.id"), nullable=False)
+    book_id = Column(Integer, ForeignKey("books.id"), nullable=False, index=True)
     old_status_id = Column(Integer, ForeignKey("book_status.id"), nullable=True)
     new_status_id = Column(Integer, ForeignKey("book_status.id"), nullable=False)
     created_at = Column(
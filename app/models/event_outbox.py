@@ -0,0 +1,31 @@
+import uuid
+
+from sqlalchemy import JSON, Column, Index, Integer, String
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.sql import func
+from sqlalchemy.types import Uuid as SQLAlchemyUuid
+
+from app.db.session import Base
+
+
+class EventOutbox(Base):
+    __tablename__ = "event_outbox"
+    __table_args__ = (Index("ix_event_outbox_status_id", "status", "id"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    event_key = Column(
+        SQLAlchemyUuid(as_uuid=True),
+        default=uuid.uuid4,
+        unique=True,
+        nullable=False,
+    )
+
+    routing_key = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+    status = Column(String, nullable=False, default="pending")
+    locked_until = Column(TIMESTAMP(timezone=True, precision=3), nullable=True)
+
+    created_at = Column(
+        TIMESTAMP(timezone=True, precision=3), server_default=func.now()
+    )
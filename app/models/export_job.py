@@ -0,0 +1,38 @@
+import uuid
+
+from sqlalchemy import JSON, Column, Integer, String
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.sql import func
+from sqlalchemy.types import Uuid as SQLAlchemyUuid
+
+from app.db.session import Base
+
+
+class ExportJob(Base):
+    __tablename__ = "export_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    job_key = Column(
+        SQLAlchemyUuid(as_uuid=True),
+        default=uuid.uuid4,
+        unique=True,
+        index=True,
+        nullable=False,
+    )
+
+    report = Column(String, nullable=False)
+    format = Column(String, nullable=False)
+    filters = Column(JSON, nullable=False, default=dict)
+    status = Column(String, nullable=False, default="pending")
+    total_rows = Column(Integer, nullable=True)
+    processed_rows = Column(Integer, nullable=False, default=0)
+    file_path = Column(String, nullable=True)
+    error = Column(String, nullable=True)
+
+    created_at = Column(
+        TIMESTAMP(timezone=True, precision=3), server_default=func.now()
+    )
+    started_at = Column(TIMESTAMP(timezone=True, precision=3), nullable=True)
+    finished_at = Column(TIMESTAMP(timezone=True, precision=3), nullable=True)
+    heartbeat_at = Column(TIMESTAMP(timezone=True, precision=3), nullable=True)
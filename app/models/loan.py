@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, Float, ForeignKey, Integer
+from sqlalchemy import Column, Float, ForeignKey, Index, Integer, text
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -8,9 +8,34 @@ from sqlalchemy.types import Uuid as SQLAlchemyUuid
 
 from app.db.session import Base
 
+NOT_RETURNED = text("return_date IS NULL")
+
 
 class Loan(Base):
     __tablename__ = "loans"
+    __table_args__ = (
+        Index("ix_loans_user_id_status_id", "user_id", "status_id"),
+        Index("ix_loans_book_id_status_id", "book_id", "status_id"),
+        Index("ix_loans_status_id_id", "status_id", "id"),
+        Index(
+            "ix_loans_active_user_id",
+            "user_id",
+            postgresql_where=NOT_RETURNED,
+            sqlite_where=NOT_RETURNED,
+        ),
+        Index(
+            "ix_loans_active_book_id",
+            "book_id",
+            postgresql_where=NOT_RETURNED,
+            sqlite_where=NOT_RETURNED,
+        ),
+        Index(
+            "ix_loans_active_due_date",
+            "due_date",
+            postgresql_where=NOT_RETURNED,
+            sqlite_where=NOT_RETURNED,
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
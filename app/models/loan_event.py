@@ -10,7 +10,7 @@ class LoanEvent(Base):
     __tablename__ = "loan_events"
 
     id = Column(Integer, primary_key=True, index=True)
-    loan_id = Column(Integer, ForeignKey("loans.id"), nullable=False)
+    loan_id = Column(Integer, ForeignKey("loans.id"), nullable=False, index=True)
     old_status_id = Column(Integer, ForeignKey("loan_status.id"), nullable=True)
     new_status_id = Column(Integer, ForeignKey("loan_status.id"), nullable=False)
     created_at = Column(
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Float, Index, Integer, String
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+
+from app.db.session import Base
+
+
+class LoanStat(Base):
+    __tablename__ = "loan_stats"
+    __table_args__ = (Index("ix_loan_stats_dimension_bucket", "dimension", "bucket"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    dimension = Column(String, nullable=False)
+    bucket = Column(String, nullable=True)
+    loans = Column(Integer, nullable=False, default=0)
+    active = Column(Integer, nullable=False, default=0)
+    overdue = Column(Integer, nullable=False, default=0)
+    returned = Column(Integer, nullable=False, default=0)
+    fines = Column(Float, nullable=False, default=0.0)
+    refreshed_at = Column(TIMESTAMP(timezone=True, precision=3), nullable=False)
@@ -0,0 +1,41 @@
+import uuid
+
+from sqlalchemy import JSON, Column, Index, Integer, String
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.sql import func
+from sqlalchemy.types import Uuid as SQLAlchemyUuid
+
+from app.db.session import Base
+
+
+class NotificationOutbox(Base):
+    __tablename__ = "notification_outbox"
+    __table_args__ = (
+        Index(
+            "ix_notification_outbox_status_next_attempt", "status", "next_attempt_at"
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    event_key = Column(
+        SQLAlchemyUuid(as_uuid=True),
+        default=uuid.uuid4,
+        unique=True,
+        nullable=False,
+    )
+
+    type = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+    status = Column(String, nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(String, nullable=True)
+
+    next_attempt_at = Column(
+        TIMESTAMP(timezone=True, precision=3), server_default=func.now()
+    )
+    created_at = Column(
+        TIMESTAMP(timezone=True, precision=3), server_default=func.now()
+    )
+    sent_at = Column(TIMESTAMP(timezone=True, precision=3), nullable=True)
+    locked_until = Column(TIMESTAMP(timezone=True, precision=3), nullable=True)
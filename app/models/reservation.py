@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy import Column, ForeignKey, Index, Integer
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -11,6 +11,16 @@ from app.db.session import Base
 
 class Reservation(Base):
     __tablename__ = "reservations"
+    __table_args__ = (
+        Index(
+            "ix_reservations_user_id_book_id_status_id",
+            "user_id",
+            "book_id",
+            "status_id",
+        ),
+        Index("ix_reservations_book_id_status_id", "book_id", "status_id"),
+        Index("ix_reservations_status_id_id", "status_id", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
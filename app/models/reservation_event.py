@@ -10,7 +10,9 @@ class ReservationEvent(Base):
     __tablename__ = "reservation_events"
 
     id = Column(Integer, primary_key=True, index=True)
-    reservation_id = Column(Integer, ForeignKey("reservations.id"), nullable=False)
+    reservation_id = Column(
+        Integer, ForeignKey("reservations.id"), nullable=False, index=True
+    )
     old_status_id = Column(Integer, ForeignKey("reservation_status.id"), nullable=True)
     new_status_id = Column(Integer, ForeignKey("reservation_status.id"), nullable=False)
     created_at = Column(
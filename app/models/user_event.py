@@ -10,7 +10,7 @@ class UserEvent(Base):
     __tablename__ = "user_events"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     old_status_id = Column(Integer, ForeignKey("user_status.id"), nullable=True)
     new_status_id = Column(Integer, ForeignKey("user_status.id"), nullable=False)
     created_at = Column(
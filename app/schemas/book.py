@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, FieldValidationInfo, field_validator
@@ -58,3 +58,20 @@ class BookResponse(BookBase):
     created_at: datetime = Field(description="Creation timestamp")
     status: StatusResponse
     model_config = ConfigDict(from_attributes=True)
+
+
+class BookImportError(BaseModel):
+    line: int = Field(description="Line number in the uploaded file")
+    errors: List[str]
+
+
+class BookImportResponse(BaseModel):
+    received: int = Field(description="Rows read from the file")
+    imported: int = Field(description="Books inserted")
+    failed: int = Field(description="Rows rejected by validation")
+    batches: int = Field(description="Insert batches committed")
+    elapsed_seconds: float
+    rows_per_second: float
+    errors: List[BookImportError] = Field(
+        default_factory=list, description="First rejected rows"
+    )
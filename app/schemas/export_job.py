@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+
+class ExportJobCreate(BaseModel):
+    report: Literal["loans", "users", "books", "reservations"] = Field(
+        description="Report to export"
+    )
+    format: Literal["csv", "pdf", "ndjson", "arrow", "parquet"] = Field(
+        "csv", description="Output format"
+    )
+    status_filter: Optional[str] = Field(
+        None, description="Status filter (loans, reservations)"
+    )
+    overdue: bool = Field(False, description="Only overdue loans (loans)")
+    genre: Optional[str] = Field(None, description="Genre filter (books)")
+    user_key: Optional[str] = Field(None, description="User filter (reservations)")
+    book_key: Optional[str] = Field(None, description="Book filter (reservations)")
+
+
+class ExportJobResponse(BaseModel):
+    job_key: UUID = Field(description="Export job UUID key")
+    report: str = Field(description="Exported report")
+    format: str = Field(description="Output format")
+    status: str = Field(description="pending, running, completed, failed or expired")
+    total_rows: Optional[int] = Field(None, description="Rows to export")
+    processed_rows: int = Field(description="Rows exported so far")
+    error: Optional[str] = Field(None, description="Failure reason")
+    created_at: Optional[datetime] = Field(None, description="Submission timestamp")
+    started_at: Optional[datetime] = Field(None, description="Start timestamp")
+    finished_at: Optional[datetime] = Field(None, description="Completion timestamp")
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @computed_field(description="Completion percentage")
+    @property
+    def progress(self) -> float:
+        if self.status == "completed":
+            return 100.0
+        if not self.total_rows:
+            return 0.0
+        return round(100 * self.processed_rows / self.total_rows, 2)
@@ -1,9 +1,11 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.core.constants import LOAN_BATCH_MAX_ITEMS
+
 from .book import BookResponse
 from .loan_event import LoanEventResponse
 from .status import StatusResponse
@@ -34,3 +36,40 @@ class LoanResponse(BaseModel):
 
 class LoanReturnRequest(BaseModel):
     book_key: UUID = Field(description="UUID of the book being returned")
+
+
+class LoanBatchCreate(BaseModel):
+    user_key: UUID = Field(description="UUID of the user taking the loans")
+    book_keys: List[UUID] = Field(
+        min_length=1,
+        max_length=LOAN_BATCH_MAX_ITEMS,
+        description="UUIDs of the books to loan",
+    )
+
+
+class LoanBatchReturnRequest(BaseModel):
+    book_keys: List[UUID] = Field(
+        min_length=1,
+        max_length=LOAN_BATCH_MAX_ITEMS,
+        description="UUIDs of the books being returned",
+    )
+
+
+class LoanBatchError(BaseModel):
+    code: str
+    title: str
+    description: str
+    translation: str
+
+
+class LoanBatchItem(BaseModel):
+    book_key: UUID
+    status: Literal["created", "returned", "failed"]
+    loan: Optional[LoanResponse] = None
+    error: Optional[LoanBatchError] = None
+
+
+class LoanBatchResponse(BaseModel):
+    succeeded: int
+    failed: int
+    items: List[LoanBatchItem]
@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class LoanStatsBucket(BaseModel):
+    bucket: Optional[str] = Field(None, description="Status, genre or YYYY-MM month")
+    loans: int = Field(description="Loans in the bucket")
+    active: int = Field(description="Loans not returned yet")
+    overdue: int = Field(description="Loans not returned and past due")
+    returned: int = Field(description="Returned loans")
+    fines: float = Field(description="Sum of fines")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LoanStatsResponse(BaseModel):
+    group_by: str = Field(description="Grouping dimension")
+    source: str = Field(description="summary (refreshed table) or live")
+    refreshed_at: Optional[datetime] = Field(
+        None, description="Summary refresh timestamp"
+    )
+    buckets: list[LoanStatsBucket] = Field(description="Aggregated buckets")
+
+
+class LoanStatsRefreshResponse(BaseModel):
+    buckets: int = Field(description="Summary rows written")
+    refreshed_at: datetime = Field(description="Summary refresh timestamp")
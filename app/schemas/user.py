@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import (
@@ -11,6 +11,7 @@ from pydantic import (
     field_validator,
 )
 
+from app.core.constants import USER_BULK_MAX_ITEMS
 from app.utils.text import clean_str, normalize_email
 
 from .status import StatusResponse
@@ -63,3 +64,26 @@ class UserResponse(UserBase):
     created_at: datetime = Field(description="Creation timestamp")
     status: StatusResponse
     model_config = ConfigDict(from_attributes=True)
+
+
+class UserBulkCreate(BaseModel):
+    users: List[UserCreate] = Field(min_length=1, max_length=USER_BULK_MAX_ITEMS)
+
+
+class UserBulkCreateResponse(BaseModel):
+    created: List[UserResponse]
+    conflicts: List[str] = Field(
+        default_factory=list,
+        description="Emails already registered or repeated in the request",
+    )
+
+
+class UserBulkStatusUpdate(BaseModel):
+    user_keys: List[UUID] = Field(min_length=1, max_length=USER_BULK_MAX_ITEMS)
+    status_enum: str = Field(description="Target status enumerator")
+
+
+class UserBulkStatusResponse(BaseModel):
+    updated: int = Field(description="Users moved to the new status")
+    unchanged: int = Field(description="Users already in the requested status")
+    not_found: List[UUID] = Field(default_factory=list)
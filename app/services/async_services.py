@@ -0,0 +1,265 @@
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.book import (
+    BookAvailabilityResponse,
+    BookCreate,
+    BookResponse,
+    BookUpdate,
+)
+from app.schemas.loan import LoanCreate, LoanResponse, LoanReturnRequest
+from app.schemas.reservation import ReservationCreate, ReservationResponse
+from app.schemas.user import (
+    UserBulkCreate,
+    UserBulkStatusUpdate,
+    UserCreate,
+    UserResponse,
+    UserUpdate,
+)
+from app.services.book_service import BookService
+from app.services.loan_service import LoanService
+from app.services.reservation_service import ReservationService
+from app.services.user_service import UserService
+
+
+def _serialize(schema: Optional[type[BaseModel]], result: Any) -> Any:
+    if schema is None or result is None or isinstance(result, bytes):
+        return result
+    if isinstance(result, list):
+        return [schema.model_validate(item) for item in result]
+    return schema.model_validate(result)
+
+
+async def _run(
+    session: AsyncSession,
+    schema: Optional[type[BaseModel]],
+    method: Callable,
+    **kwargs,
+) -> Any:
+    # Serialization happens inside run_sync so lazy loads still have a greenlet.
+    def call(sync_session):
+        return _serialize(schema, method(sync_session, **kwargs))
+
+    return await session.run_sync(call)
+
+
+class AsyncBookService:
+    def __init__(self, service: Optional[BookService] = None) -> None:
+        self.service = service or BookService()
+
+    async def create(self, session: AsyncSession, book: BookCreate):
+        return await _run(session, BookResponse, self.service.create, book=book)
+
+    async def get_all(
+        self,
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        genre: str = None,
+        cursor: Optional[str] = None,
+    ):
+        return await _run(
+            session,
+            BookResponse,
+            self.service.get_all,
+            skip=skip,
+            limit=limit,
+            genre=genre,
+            cursor=cursor,
+        )
+
+    async def get_genres(self, session: AsyncSession):
+        return await _run(session, None, self.service.get_genres)
+
+    async def get_by_key(self, session: AsyncSession, book_key: str):
+        return await _run(session, None, self.service.get_by_key, book_key=book_key)
+
+    async def update(self, session: AsyncSession, book_key: str, data: BookUpdate):
+        return await _run(
+            session, BookResponse, self.service.update, book_key=book_key, data=data
+        )
+
+    async def set_status(self, session: AsyncSession, book_key: str, status_enum: str):
+        return await _run(
+            session,
+            BookResponse,
+            self.service.set_status,
+            book_key=book_key,
+            status_enum=status_enum,
+        )
+
+    async def check_availability(self, session: AsyncSession, book_key: str):
+        return await _run(
+            session,
+            BookAvailabilityResponse,
+            self.service.check_availability,
+            book_key=book_key,
+        )
+
+
+class AsyncUserService:
+    def __init__(self, service: Optional[UserService] = None) -> None:
+        self.service = service or UserService()
+
+    async def create(self, session: AsyncSession, user: UserCreate):
+        return await _run(session, UserResponse, self.service.create, user=user)
+
+    async def get_all(
+        self,
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ):
+        return await _run(
+            session,
+            UserResponse,
+            self.service.get_all,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    async def get_by_key(self, session: AsyncSession, user_key: str):
+        return await _run(session, None, self.service.get_by_key, user_key=user_key)
+
+    async def update(self, session: AsyncSession, user_key: str, data: UserUpdate):
+        return await _run(
+            session, UserResponse, self.service.update, user_key=user_key, data=data
+        )
+
+    async def set_status(self, session: AsyncSession, user_key: str, status_enum: str):
+        return await _run(
+            session,
+            UserResponse,
+            self.service.set_status,
+            user_key=user_key,
+            status_enum=status_enum,
+        )
+
+    async def create_many(self, session: AsyncSession, data: UserBulkCreate):
+        return await _run(session, None, self.service.create_many, users=data.users)
+
+    async def set_status_many(self, session: AsyncSession, data: UserBulkStatusUpdate):
+        return await _run(session, None, self.service.set_status_many, data=data)
+
+    async def get_user_loans(
+        self,
+        session: AsyncSession,
+        user_key: str,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ):
+        return await _run(
+            session,
+            LoanResponse,
+            self.service.get_user_loans,
+            user_key=user_key,
+            skip=skip,
+            limit=limit,
+            status=status,
+            cursor=cursor,
+        )
+
+
+class AsyncLoanService:
+    def __init__(self, service: Optional[LoanService] = None) -> None:
+        self.service = service or LoanService()
+
+    async def create(self, session: AsyncSession, loan_data: LoanCreate):
+        return await _run(
+            session, LoanResponse, self.service.create, loan_data=loan_data
+        )
+
+    async def get_all(
+        self,
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        status: str = None,
+        overdue: bool = False,
+        cursor: Optional[str] = None,
+    ):
+        return await _run(
+            session,
+            LoanResponse,
+            self.service.get_all,
+            skip=skip,
+            limit=limit,
+            status=status,
+            overdue=overdue,
+            cursor=cursor,
+        )
+
+    async def get_by_key(self, session: AsyncSession, loan_key: str):
+        return await _run(session, None, self.service.get_by_key, loan_key=loan_key)
+
+    async def return_book(self, session: AsyncSession, return_data: LoanReturnRequest):
+        return await _run(
+            session, LoanResponse, self.service.return_book, return_data=return_data
+        )
+
+    async def renew_loan(self, session: AsyncSession, loan_key: str):
+        return await _run(
+            session, LoanResponse, self.service.renew_loan, loan_key=loan_key
+        )
+
+
+class AsyncReservationService:
+    def __init__(self, service: Optional[ReservationService] = None) -> None:
+        self.service = service or ReservationService()
+
+    async def create(self, session: AsyncSession, reservation_data: ReservationCreate):
+        return await _run(
+            session,
+            ReservationResponse,
+            self.service.create,
+            reservation_data=reservation_data,
+        )
+
+    async def get_all(
+        self,
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        user_key: str = None,
+        book_key: str = None,
+        status: str = None,
+        cursor: Optional[str] = None,
+    ):
+        return await _run(
+            session,
+            ReservationResponse,
+            self.service.get_all,
+            skip=skip,
+            limit=limit,
+            user_key=user_key,
+            book_key=book_key,
+            status=status,
+            cursor=cursor,
+        )
+
+    async def get_by_key(self, session: AsyncSession, reservation_key: str):
+        return await _run(
+            session, None, self.service.get_by_key, reservation_key=reservation_key
+        )
+
+    async def cancel_reservation(self, session: AsyncSession, reservation_key: str):
+        return await _run(
+            session,
+            ReservationResponse,
+            self.service.cancel_reservation,
+            reservation_key=reservation_key,
+        )
+
+    async def complete_reservation(self, session: AsyncSession, reservation_key: str):
+        return await _run(
+            session,
+            ReservationResponse,
+            self.service.complete_reservation,
+            reservation_key=reservation_key,
+        )
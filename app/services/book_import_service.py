@@ -0,0 +1,184 @@
+import csv
+import io
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core.constants import (
+    BOOK_IMPORT_BATCH_SIZE,
+    BOOK_IMPORT_FORMATS,
+    BOOK_IMPORT_MAX_ERRORS,
+)
+from app.core.errors import InvalidImportFormat
+from app.core.logger import get_logger
+from app.core.metrics import record_book_import
+from app.models.book import Book
+from app.models.book_event import BookEvent
+from app.models.book_status import BookStatus
+from app.schemas.book import BookCreate, BookImportError, BookImportResponse
+from app.services.event_publisher import add_status_events
+from app.utils.status_registry import get_status_id
+
+logger = get_logger(__name__)
+
+
+def resolve_import_format(fmt: Optional[str], filename: Optional[str]) -> str:
+    if fmt is None:
+        suffix = (filename or "").rsplit(".", 1)[-1].lower()
+        fmt = "ndjson" if suffix in ("ndjson", "jsonl") else "csv"
+    if fmt not in BOOK_IMPORT_FORMATS:
+        raise InvalidImportFormat()
+    return fmt
+
+
+def iter_csv(stream: BinaryIO) -> Iterator[tuple[int, object]]:
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    reader = csv.DictReader(text)
+    try:
+        for record in reader:
+            yield reader.line_num, {
+                field: value for field, value in record.items() if field and value
+            }
+    finally:
+        text.detach()
+
+
+def iter_ndjson(stream: BinaryIO) -> Iterator[tuple[int, object]]:
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as exc:
+            yield line_number, exc
+
+
+READERS = {"csv": iter_csv, "ndjson": iter_ndjson}
+
+
+class BookImportService:
+    def import_books(
+        self,
+        session: Session,
+        stream: BinaryIO,
+        fmt: str,
+        batch_size: int = BOOK_IMPORT_BATCH_SIZE,
+    ) -> BookImportResponse:
+        return self.import_records(session, READERS[fmt](stream), batch_size)
+
+    def import_records(
+        self,
+        session: Session,
+        records: Iterable[tuple[int, object]],
+        batch_size: int = BOOK_IMPORT_BATCH_SIZE,
+    ) -> BookImportResponse:
+        available_status_id = get_status_id(session, BookStatus, "available")
+        started = time.perf_counter()
+
+        received = imported = failed = batches = 0
+        errors: list[BookImportError] = []
+        batch: list[BookCreate] = []
+
+        for line, record in records:
+            received += 1
+            try:
+                if isinstance(record, Exception):
+                    raise ValueError(f"invalid JSON: {record}")
+                batch.append(BookCreate.model_validate(record))
+            except (ValidationError, ValueError) as exc:
+                failed += 1
+                if len(errors) < BOOK_IMPORT_MAX_ERRORS:
+                    errors.append(BookImportError(line=line, errors=_messages(exc)))
+                continue
+
+            if len(batch) >= batch_size:
+                imported += self._insert_batch(session, batch, available_status_id)
+                batches += 1
+                batch = []
+
+        if batch:
+            imported += self._insert_batch(session, batch, available_status_id)
+            batches += 1
+
+        elapsed = time.perf_counter() - started
+        record_book_import("imported", imported)
+        record_book_import("failed", failed)
+        logger.info(
+            "book_import",
+            extra={
+                "details": {
+                    "received": received,
+                    "imported": imported,
+                    "failed": failed,
+                    "elapsed_seconds": round(elapsed, 3),
+                }
+            },
+        )
+
+        return BookImportResponse(
+            received=received,
+            imported=imported,
+            failed=failed,
+            batches=batches,
+            elapsed_seconds=round(elapsed, 3),
+            rows_per_second=round(imported / elapsed, 1) if elapsed else 0.0,
+            errors=errors,
+        )
+
+    def _insert_batch(
+        self, session: Session, books: list[BookCreate], status_id: int
+    ) -> int:
+        now = datetime.now(timezone.utc)
+        try:
+            created = session.execute(
+                insert(Book).returning(Book.id, Book.book_key),
+                [
+                    {
+                        "book_key": uuid.uuid4(),
+                        "title": book.title,
+                        "author": book.author,
+                        "genre": book.genre,
+                        "status_id": status_id,
+                        "created_at": now,
+                    }
+                    for book in books
+                ],
+            ).all()
+            session.execute(
+                insert(BookEvent),
+                [
+                    {
+                        "book_id": book_id,
+                        "old_status_id": None,
+                        "new_status_id": status_id,
+                        "created_at": now,
+                    }
+                    for book_id, _ in created
+                ],
+            )
+            add_status_events(
+                session,
+                BookEvent,
+                [(book_key, None, status_id) for _, book_key in created],
+            )
+            session.commit()
+        except Exception as exc:
+            session.rollback()
+            raise exc
+
+        return len(created)
+
+
+def _messages(exc: Exception) -> list[str]:
+    if isinstance(exc, ValidationError):
+        return [
+            f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}"
+            for error in exc.errors()
+        ]
+    return [str(exc)]
@@ -11,48 +11,50 @@ from app.models.book_event import BookEvent
 from app.models.book_status import BookStatus
 from app.models.loan import Loan
 from app.models.loan_status import LoanStatus
-from app.schemas.book import BookCreate, BookUpdate
+from app.schemas.book import BookCreate, BookResponse, BookUpdate
 from app.utils.cache import clear_cache, get_cache, set_cache
+from app.utils.pagination import paginate
+from app.utils.snapshot import dump_snapshot
+from app.utils.status_registry import get_status_enumerator, get_status_id
 from app.utils.uuid import validate_uuid
 
 
 class BookService:
     def create(self, session: Session, book: BookCreate):
-        available_status = (
-            session.query(BookStatus)
-            .filter(BookStatus.enumerator == "available")
-            .first()
-        )
+        available_status_id = get_status_id(session, BookStatus, "available")
 
         new_book = Book(
             title=book.title,
             author=book.author,
             genre=book.genre,
-            status_id=available_status.id,
+            status_id=available_status_id,
         )
         session.add(new_book)
         session.flush()
 
-        self._create_event(session, new_book.id, None, available_status.id)
+        self._create_event(session, new_book.id, None, available_status_id)
 
         session.commit()
-        session.refresh(new_book)
 
         return new_book
 
+    def apply_filters(self, session: Session, query, genre: str = None):
+        if genre:
+            query = query.filter(Book.genre.ilike(genre))
+
+        return query
+
     def get_all(
         self,
         session: Session,
         skip: int = 0,
         limit: int = 100,
         genre: str = None,
+        cursor: Optional[str] = None,
     ):
         query = session.query(Book).options(joinedload(Book.status))
-
-        if genre:
-            query = query.filter(Book.genre.ilike(genre))
-
-        return query.offset(skip).limit(limit).all()
+        query = self.apply_filters(session, query, genre=genre)
+        return paginate(query, Book, Book.book_key, skip, limit, cursor)
 
     def get_genres(self, session: Session):
         genre_query = (
@@ -64,7 +66,7 @@ class BookService:
 
         return session.execute(genre_query).scalars().all()
 
-    def get_by_key(self, session: Session, book_key: str):
+    def get_by_key(self, session: Session, book_key: str) -> bytes | None:
         book_key = validate_uuid(book_key)
         if not book_key:
             return None
@@ -81,10 +83,13 @@ class BookService:
             .first()
         )
 
-        if book:
-            set_cache(cache_key, book, ttl_seconds=CACHE_ENTITY_TTL)
+        if not book:
+            return None
 
-        return book
+        snapshot = dump_snapshot(BookResponse, book)
+        set_cache(cache_key, snapshot, ttl_seconds=CACHE_ENTITY_TTL)
+
+        return snapshot
 
     def _get_for_update(self, session: Session, book_key: str) -> Book | None:
         uuid = validate_uuid(book_key)
@@ -107,9 +112,13 @@ class BookService:
             book.genre = data.genre
 
         session.commit()
-        session.refresh(book)
 
-        set_cache(f"book:{book_key}:details", book, ttl_seconds=CACHE_ENTITY_TTL)
+        set_cache(
+            f"book:{book.book_key}:details",
+            dump_snapshot(BookResponse, book),
+            ttl_seconds=CACHE_ENTITY_TTL,
+            publish=True,
+        )
 
         return book
 
@@ -118,23 +127,18 @@ class BookService:
         if not book:
             raise BookNotFound()
 
-        status = (
-            session.query(BookStatus)
-            .filter(BookStatus.enumerator == status_enum)
-            .first()
-        )
-        if not status:
+        status_id = get_status_id(session, BookStatus, status_enum)
+        if not status_id:
             return None
 
         old_status_id = book.status_id
-        book.status_id = status.id
+        book.status = session.get(BookStatus, status_id)
 
-        self._create_event(session, book.id, old_status_id, status.id)
+        self._create_event(session, book.id, old_status_id, status_id)
 
         session.commit()
-        session.refresh(book)
 
-        clear_cache(f"book:{book_key}:details")
+        clear_cache(f"book:{book.book_key}:details")
 
         return book
 
@@ -154,12 +158,12 @@ class BookService:
         session.add(event)
 
     def check_availability(self, session: Session, book_key: str):
-        book = self.get_by_key(session, book_key)
+        book = self._get_for_update(session, book_key)
 
         if not book:
             return None
 
-        status_enum = book.status.enumerator
+        status_enum = get_status_enumerator(session, BookStatus, book.status_id)
         book_id = book.id
 
         response = {
@@ -173,10 +177,14 @@ class BookService:
             return response
 
         if status_enum == "loaned":
+            active_loan_status_id = get_status_id(session, LoanStatus, "active")
             active_loan = (
                 session.query(Loan)
-                .join(Loan.status)
-                .filter(Loan.book_id == book_id, LoanStatus.enumerator == "active")
+                .filter(
+                    Loan.book_id == book_id,
+                    Loan.status_id == active_loan_status_id,
+                    Loan.return_date.is_(None),
+                )
                 .first()
             )
 
@@ -0,0 +1,355 @@
+import asyncio
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from threading import Event, Lock, Thread
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+import aio_pika
+from sqlalchemy import and_, delete, event, insert, or_, update
+from sqlalchemy.orm import Session
+
+from app.core.constants import (
+    EVENTS_BATCH_LINGER_MS,
+    EVENTS_BATCH_SIZE,
+    EVENTS_EXCHANGE,
+    EVENTS_LEASE_SECONDS,
+    EVENTS_POLL_INTERVAL,
+    get_rabbitmq_url,
+)
+from app.core.logger import get_logger
+from app.core.metrics import record_domain_events
+from app.db.session import SessionLocal
+from app.models import (
+    BookEvent,
+    BookStatus,
+    EventOutbox,
+    LoanEvent,
+    LoanStatus,
+    ReservationEvent,
+    ReservationStatus,
+    UserEvent,
+    UserStatus,
+)
+from app.utils.status_registry import get_status_enumerator
+
+EVENT_SOURCES = {
+    LoanEvent: ("loan", "loan", "loan_key", LoanStatus),
+    BookEvent: ("book", "book", "book_key", BookStatus),
+    UserEvent: ("user", "user", "user_key", UserStatus),
+    ReservationEvent: (
+        "reservation",
+        "reservation",
+        "reservation_key",
+        ReservationStatus,
+    ),
+}
+
+logger = get_logger(__name__)
+
+
+class EventPublisher:
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        exchange_name: str = EVENTS_EXCHANGE,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: int = EVENTS_BATCH_SIZE,
+        linger_seconds: float = EVENTS_BATCH_LINGER_MS / 1000,
+        poll_interval: float = EVENTS_POLL_INTERVAL,
+        lease_seconds: float = EVENTS_LEASE_SECONDS,
+        connect: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> None:
+        self.url = url or get_rabbitmq_url()
+        self.exchange_name = exchange_name
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.linger_seconds = linger_seconds
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self._connect = connect or self._connect_exchange
+        self._connection = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._ready = Event()
+        self._thread: Optional[Thread] = None
+
+    async def _connect_exchange(self):
+        self._connection = await aio_pika.connect_robust(self.url)
+        channel = await self._connection.channel(publisher_confirms=True)
+        return await channel.declare_exchange(
+            self.exchange_name, aio_pika.ExchangeType.TOPIC, durable=True
+        )
+
+    def start(self) -> None:
+        self._thread = Thread(target=self._run, name="event-publisher", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout=5)
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._wake = asyncio.Event()
+        self._task = self._loop.create_task(self._relay_forever())
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    def wake(self) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def claim(self) -> list[tuple[int, dict[str, Any]]]:
+        with self.session_factory() as session:
+            now = datetime.now(timezone.utc)
+            rows = (
+                session.query(EventOutbox)
+                .filter(
+                    or_(
+                        EventOutbox.status == "pending",
+                        and_(
+                            EventOutbox.status == "sending",
+                            EventOutbox.locked_until <= now,
+                        ),
+                    )
+                )
+                .order_by(EventOutbox.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+
+            locked_until = now + timedelta(seconds=self.lease_seconds)
+            for row in rows:
+                row.status = "sending"
+                row.locked_until = locked_until
+            claimed = [(row.id, row.payload) for row in rows]
+            session.commit()
+
+            return claimed
+
+    def _finish(self, ids: list[int], published: bool) -> None:
+        # Confirmed rows have nothing left to do; drop them so the table stays small.
+        statement = (
+            delete(EventOutbox)
+            if published
+            else update(EventOutbox).values(status="pending", locked_until=None)
+        )
+        with self.session_factory() as session:
+            session.execute(
+                statement.where(
+                    EventOutbox.id.in_(ids), EventOutbox.status == "sending"
+                ).execution_options(synchronize_session=False)
+            )
+            session.commit()
+
+    async def _publish(self, exchange, batch: list[tuple[int, dict[str, Any]]]):
+        await asyncio.gather(
+            *(
+                exchange.publish(self._message(item), routing_key=item["routing_key"])
+                for _, item in batch
+            )
+        )
+
+    async def _relay_forever(self) -> None:
+        exchange = None
+        attempt = 0
+        while True:
+            try:
+                batch = await asyncio.to_thread(self.claim)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("event_claim_failed", extra={"details": str(exc)})
+                batch = []
+
+            if not batch:
+                await self._idle()
+                continue
+
+            ids = [row_id for row_id, _ in batch]
+            try:
+                exchange = exchange or await self._connect()
+                await self._publish(exchange, batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                exchange = None
+                attempt += 1
+                record_domain_events("failed", len(batch))
+                logger.warning(
+                    "event_publish_failed",
+                    extra={"details": str(exc), "attempt": attempt},
+                )
+                await asyncio.to_thread(self._finish, ids, False)
+                await asyncio.sleep(min(0.5 * 2**attempt, 30))
+                continue
+
+            attempt = 0
+            await asyncio.to_thread(self._finish, ids, True)
+            record_domain_events("published", len(batch))
+
+    async def _idle(self) -> None:
+        try:
+            await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+        except asyncio.TimeoutError:
+            return
+        self._wake.clear()
+        # Give concurrent commits a moment to land so they share one batch.
+        await asyncio.sleep(self.linger_seconds)
+
+    @staticmethod
+    def _message(item: dict[str, Any]) -> aio_pika.Message:
+        return aio_pika.Message(
+            body=json.dumps(item).encode("utf-8"),
+            content_type="application/json",
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            message_id=item["event_id"],
+            type=item["routing_key"],
+        )
+
+    async def _shutdown(self) -> None:
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        if self._connection is not None:
+            await self._connection.close()
+
+    def stop(self, timeout: float = 5) -> None:
+        # Unconfirmed rows stay leased in the outbox and are relayed again later.
+        if self._loop is None:
+            return
+        future = asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+        try:
+            future.result(timeout=timeout)
+        except Exception as exc:
+            logger.warning("event_publisher_stop_failed", extra={"details": str(exc)})
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=timeout)
+        self._loop = None
+
+
+_publisher: Optional[EventPublisher] = None
+_publisher_lock = Lock()
+
+
+def start_event_publisher(publisher: Optional[EventPublisher] = None) -> None:
+    global _publisher
+    if publisher is None and not get_rabbitmq_url():
+        return
+    with _publisher_lock:
+        if _publisher is None:
+            _publisher = publisher or EventPublisher()
+            _publisher.start()
+
+
+def stop_event_publisher() -> None:
+    global _publisher
+    with _publisher_lock:
+        if _publisher is not None:
+            _publisher.stop()
+            _publisher = None
+
+
+def _message(
+    session: Session,
+    entity: str,
+    status_model,
+    entity_key,
+    old_status_id: Optional[int],
+    new_status_id: int,
+) -> dict[str, Any]:
+    new_status = get_status_enumerator(session, status_model, new_status_id)
+    old_status = (
+        get_status_enumerator(session, status_model, old_status_id)
+        if old_status_id is not None
+        else None
+    )
+    return {
+        "event_id": str(uuid.uuid4()),
+        "routing_key": f"{entity}.{new_status}",
+        "entity": entity,
+        "entity_key": str(entity_key),
+        "old_status": old_status,
+        "new_status": new_status,
+        "occurred_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def _serialize(session: Session, instance) -> dict[str, Any]:
+    entity, relation, key_name, status_model = EVENT_SOURCES[type(instance)]
+    parent = getattr(instance, relation) or session.get(
+        getattr(type(instance), relation).property.mapper.class_,
+        getattr(instance, f"{relation}_id"),
+    )
+    return _message(
+        session,
+        entity,
+        status_model,
+        getattr(parent, key_name),
+        instance.old_status_id,
+        instance.new_status_id,
+    )
+
+
+def _write_outbox(session: Session, messages: list[dict[str, Any]]) -> None:
+    # Written on the flush connection, so rows commit or roll back with the change.
+    session.connection().execute(
+        insert(EventOutbox),
+        [
+            {
+                "event_key": uuid.UUID(message["event_id"]),
+                "routing_key": message["routing_key"],
+                "payload": message,
+                "status": "pending",
+            }
+            for message in messages
+        ],
+    )
+    session.info["domain_events"] = True
+
+
+def add_status_events(
+    session: Session,
+    event_model,
+    transitions: Iterable[tuple[Any, Optional[int], int]],
+) -> None:
+    # Bulk UPDATE/INSERT statements never reach after_flush, so callers queue them.
+    if not get_rabbitmq_url():
+        return
+    entity, _, _, status_model = EVENT_SOURCES[event_model]
+    messages = [
+        _message(session, entity, status_model, entity_key, old_id, new_id)
+        for entity_key, old_id, new_id in transitions
+    ]
+    if messages:
+        _write_outbox(session, messages)
+
+
+def _collect(session: Session, flush_context) -> None:
+    if not get_rabbitmq_url():
+        return
+    messages = [
+        _serialize(session, instance)
+        for instance in session.new
+        if type(instance) in EVENT_SOURCES
+    ]
+    if messages:
+        _write_outbox(session, messages)
+
+
+def _wake_on_commit(session: Session) -> None:
+    if session.info.pop("domain_events", None) and _publisher is not None:
+        _publisher.wake()
+
+
+def _discard_on_rollback(session: Session, previous_transaction) -> None:
+    session.info.pop("domain_events", None)
+
+
+event.listen(Session, "after_flush", _collect)
+event.listen(Session, "after_commit", _wake_on_commit)
+event.listen(Session, "after_soft_rollback", _discard_on_rollback)
@@ -0,0 +1,270 @@
+import os
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Callable, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.constants import (
+    EXPORT_FILE_TTL_SECONDS,
+    EXPORT_JOB_STALE_SECONDS,
+    EXPORT_JOB_WORKERS,
+    EXPORT_STORAGE_DIR,
+)
+from app.core.errors import (
+    ExportFileUnavailable,
+    ExportJobNotFound,
+    ExportJobNotReady,
+)
+from app.core.logger import get_logger, log_operation
+from app.db.session import ReadSessionLocal, SessionLocal
+from app.models.export_job import ExportJob
+from app.schemas.export_job import ExportJobCreate
+from app.services.report_service import EXPORT_MEDIA_TYPES, ReportService
+from app.utils.uuid import validate_uuid
+
+REPORT_FILTERS = {
+    "loans": ("status_filter", "overdue"),
+    "users": (),
+    "books": ("genre",),
+    "reservations": ("user_key", "book_key", "status_filter"),
+}
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = Lock()
+_queued: dict[Future, UUID] = {}
+
+
+def get_export_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=EXPORT_JOB_WORKERS, thread_name_prefix="export-job"
+            )
+        return _executor
+
+
+def _track(future: Future, job_key: UUID) -> None:
+    with _executor_lock:
+        _queued[future] = job_key
+    future.add_done_callback(_untrack)
+
+
+def _untrack(future: Future) -> None:
+    with _executor_lock:
+        _queued.pop(future, None)
+
+
+def shutdown_export_executor() -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+        queued = dict(_queued)
+    if executor is None:
+        return
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    cancelled = [job_key for future, job_key in queued.items() if future.cancelled()]
+    if cancelled:
+        with SessionLocal() as session:
+            ExportJobService().fail_jobs(
+                session, ExportJob.job_key.in_(cancelled), "Cancelled at shutdown"
+            )
+
+
+def recover_export_jobs() -> None:
+    service = ExportJobService()
+    with SessionLocal() as session:
+        service.recover_stale(session)
+        service.purge_expired(session)
+
+
+class ExportJobService:
+    def __init__(
+        self,
+        report_service: Optional[ReportService] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        read_session_factory: Callable[[], Session] = ReadSessionLocal,
+        executor: Optional[Executor] = None,
+        storage_dir: str = EXPORT_STORAGE_DIR,
+    ) -> None:
+        self.report_service = report_service or ReportService()
+        self.session_factory = session_factory
+        self.read_session_factory = read_session_factory
+        self.executor = executor
+        self.storage_dir = storage_dir
+        self.logger = get_logger(__name__)
+
+    def submit(self, session: Session, data: ExportJobCreate) -> ExportJob:
+        self.report_service.validate_format(data.format)
+        job = ExportJob(
+            report=data.report,
+            format=data.format,
+            filters={name: getattr(data, name) for name in REPORT_FILTERS[data.report]},
+            status="pending",
+            processed_rows=0,
+            heartbeat_at=datetime.now(timezone.utc),
+        )
+        session.add(job)
+        session.commit()
+
+        self.purge_expired(session)
+
+        executor = self.executor or get_export_executor()
+        future = executor.submit(self.run, job.job_key)
+        if isinstance(future, Future):
+            _track(future, job.job_key)
+
+        return job
+
+    def get_by_key(self, session: Session, job_key: str) -> ExportJob:
+        uuid = validate_uuid(job_key)
+        job = (
+            session.query(ExportJob).filter(ExportJob.job_key == uuid).first()
+            if uuid
+            else None
+        )
+        if not job:
+            raise ExportJobNotFound()
+        return job
+
+    def get_download(self, session: Session, job_key: str) -> tuple[str, str, str]:
+        job = self.get_by_key(session, job_key)
+        if job.status == "expired":
+            raise ExportFileUnavailable()
+        if job.status != "completed" or not job.file_path:
+            raise ExportJobNotReady()
+        # EXPORT_STORAGE_DIR must be shared by every replica serving downloads.
+        if not os.path.exists(job.file_path):
+            raise ExportFileUnavailable()
+
+        return (
+            job.file_path,
+            EXPORT_MEDIA_TYPES[job.format],
+            f"{job.report}.{job.format}",
+        )
+
+    def run(self, job_key: UUID) -> None:
+        with self.session_factory() as session:
+            job = session.query(ExportJob).filter(ExportJob.job_key == job_key).first()
+            if not job:
+                return
+
+            job.status = "running"
+            job.started_at = datetime.now(timezone.utc)
+            job.heartbeat_at = job.started_at
+            session.commit()
+
+            try:
+                with self.read_session_factory() as read_session:
+                    job.file_path = self._export(session, read_session, job)
+                job.status = "completed"
+            except Exception as exc:
+                session.rollback()
+                job.status = "failed"
+                job.error = str(exc)
+                log_operation(
+                    self.logger,
+                    operation="export",
+                    entity_type="export_job",
+                    entity_id=str(job_key),
+                    status="failed",
+                    details={"error": str(exc)},
+                    level="error",
+                )
+
+            job.finished_at = datetime.now(timezone.utc)
+            session.commit()
+
+    def fail_jobs(self, session: Session, condition, error: str) -> int:
+        result = session.execute(
+            update(ExportJob)
+            .where(ExportJob.status.in_(("pending", "running")), condition)
+            .values(status="failed", error=error, finished_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        return result.rowcount
+
+    def recover_stale(self, session: Session, now: Optional[datetime] = None) -> int:
+        # Running jobs whose worker stopped heartbeating (crash, killed replica) never
+        # finish. Pending jobs may still sit in a live replica's executor queue.
+        now = now or datetime.now(timezone.utc)
+        cutoff = now - timedelta(seconds=EXPORT_JOB_STALE_SECONDS)
+        recovered = self.fail_jobs(
+            session,
+            (ExportJob.status == "running") & (ExportJob.heartbeat_at < cutoff),
+            "Interrupted before completion",
+        )
+        if recovered:
+            log_operation(
+                self.logger,
+                operation="recover",
+                entity_type="export_job",
+                status="failed",
+                details={"jobs": recovered},
+                level="warning",
+            )
+        return recovered
+
+    def purge_expired(self, session: Session, now: Optional[datetime] = None) -> int:
+        now = now or datetime.now(timezone.utc)
+        cutoff = now - timedelta(seconds=EXPORT_FILE_TTL_SECONDS)
+        jobs = (
+            session.query(ExportJob)
+            .filter(ExportJob.status == "completed", ExportJob.finished_at < cutoff)
+            .all()
+        )
+        for job in jobs:
+            if job.file_path:
+                try:
+                    os.remove(job.file_path)
+                except FileNotFoundError:
+                    pass
+            job.status = "expired"
+            job.file_path = None
+        if jobs:
+            session.commit()
+        return len(jobs)
+
+    def _count(self, read_session: Session, report: str, filters: dict) -> int:
+        query = getattr(self.report_service, f"select_{report}")(
+            read_session, **filters
+        )
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        return read_session.execute(count_query).scalar_one()
+
+    def _export(self, session: Session, read_session: Session, job: ExportJob) -> str:
+        filters = dict(job.filters or {})
+        job.total_rows = self._count(read_session, job.report, filters)
+        session.commit()
+
+        os.makedirs(self.storage_dir, exist_ok=True)
+        path = os.path.join(self.storage_dir, f"{job.job_key}.{job.format}")
+        partial_path = f"{path}.part"
+
+        def on_progress(rows: int) -> None:
+            job.processed_rows = rows
+            job.heartbeat_at = datetime.now(timezone.utc)
+            session.commit()
+
+        stream = getattr(self.report_service, f"stream_{job.report}")
+        content, _, _ = stream(
+            read_session, fmt=job.format, on_progress=on_progress, **filters
+        )
+
+        try:
+            with open(partial_path, "wb") as output:
+                for chunk in content:
+                    output.write(chunk)
+            os.replace(partial_path, path)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+        job.processed_rows = job.total_rows
+        return path
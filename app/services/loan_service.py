@@ -1,10 +1,14 @@
+import uuid
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, insert, literal, null, select, update
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.core.constants import (
     CACHE_ENTITY_TTL,
     LOAN_DEFAULT_DAYS,
+    LOAN_FAST_CHECKOUT,
     LOAN_FINE_PER_DAY,
     LOAN_MAX_ACTIVE_LOANS,
     LOAN_RENEWAL_EXTENSION_DAYS,
@@ -15,6 +19,7 @@ from app.core.errors import (
     BookNotFound,
     CannotRenewInactiveLoan,
     CannotRenewOverdueLoan,
+    CustomError,
     LoanNotFound,
     MaxActiveLoansReached,
     UserNotActive,
@@ -26,14 +31,101 @@ from app.models.loan import Loan
 from app.models.loan_event import LoanEvent
 from app.models.loan_status import LoanStatus
 from app.models.user import User
-from app.schemas.loan import LoanCreate, LoanReturnRequest
+from app.models.user_status import UserStatus
+from app.schemas.loan import (
+    LoanBatchCreate,
+    LoanBatchItem,
+    LoanBatchResponse,
+    LoanBatchReturnRequest,
+    LoanCreate,
+    LoanResponse,
+    LoanReturnRequest,
+)
+from app.services.event_publisher import add_status_events
+from app.services.notification_dispatcher import wake_notification_dispatcher
 from app.services.notification_service import NotificationService
 from app.utils.cache import clear_cache, get_cache, set_cache
+from app.utils.data_version import mark_changed_tables
+from app.utils.pagination import paginate
+from app.utils.snapshot import dump_snapshot
+from app.utils.status_registry import get_status_id
 from app.utils.uuid import validate_uuid
 
 
 class LoanService:
+    @staticmethod
+    def _calculate_fine(loan: Loan, now: datetime) -> float:
+        if not loan.due_date:
+            return 0.0
+
+        due_date_aware = (
+            loan.due_date
+            if loan.due_date.tzinfo
+            else loan.due_date.replace(tzinfo=timezone.utc)
+        )
+        days_late = (now - due_date_aware).days
+        return days_late * LOAN_FINE_PER_DAY if days_late > 0 else 0.0
+
+    @staticmethod
+    def _lock_books(session: Session, book_keys: list) -> dict:
+        books = (
+            session.query(Book)
+            .filter(Book.book_key.in_(sorted(set(book_keys), key=str)))
+            .order_by(Book.id)
+            .with_for_update()
+            .all()
+        )
+        return {book.book_key: book for book in books}
+
+    @staticmethod
+    def _load_loans(session: Session, loan_ids: list[int]) -> dict:
+        if not loan_ids:
+            return {}
+        loans = (
+            session.query(Loan)
+            .options(
+                joinedload(Loan.user),
+                joinedload(Loan.book),
+                joinedload(Loan.status),
+                selectinload(Loan.events).joinedload(LoanEvent.new_status),
+                selectinload(Loan.events).joinedload(LoanEvent.old_status),
+            )
+            .filter(Loan.id.in_(loan_ids))
+            .populate_existing()
+            .all()
+        )
+        return {loan.id: loan for loan in loans}
+
+    @staticmethod
+    def _batch_response(
+        results: list, loans: dict, success_status: str
+    ) -> LoanBatchResponse:
+        items = []
+        for book_key, outcome in results:
+            if isinstance(outcome, CustomError):
+                items.append(
+                    LoanBatchItem(
+                        book_key=book_key, status="failed", error=outcome.detail
+                    )
+                )
+            else:
+                items.append(
+                    LoanBatchItem(
+                        book_key=book_key, status=success_status, loan=loans[outcome]
+                    )
+                )
+        succeeded = sum(1 for item in items if item.status != "failed")
+        return LoanBatchResponse(
+            succeeded=succeeded, failed=len(items) - succeeded, items=items
+        )
+
     def create(self, session: Session, loan_data: LoanCreate):
+        if self._fast_checkout_available(session):
+            loan = self._create_fast(session, loan_data)
+            if loan is not None:
+                return loan
+
+        # Slow path: also diagnoses why the single-statement checkout matched nothing.
         user = (
             session.query(User)
             .options(joinedload(User.status))
@@ -42,16 +134,18 @@ class LoanService:
         )
         if not user:
             raise UserNotFound()
-        if user.status.enumerator != "active":
+        if user.status_id != get_status_id(session, UserStatus, "active"):
             raise UserNotActive()
 
-        active_loan_status = (
-            session.query(LoanStatus).filter(LoanStatus.enumerator == "active").first()
-        )
+        active_loan_status_id = get_status_id(session, LoanStatus, "active")
 
         active_loans_count = (
             session.query(Loan)
-            .filter(Loan.user_id == user.id, Loan.status_id == active_loan_status.id)
+            .filter(
+                Loan.user_id == user.id,
+                Loan.status_id == active_loan_status_id,
+                Loan.return_date.is_(None),
+            )
             .count()
         )
         if active_loans_count >= LOAN_MAX_ACTIVE_LOANS:
@@ -66,60 +160,356 @@ class LoanService:
 
         if not book:
             raise BookNotFound()
-        if book.status.enumerator != "available":
+        if book.status_id != get_status_id(session, BookStatus, "available"):
             raise BookNotAvailable()
 
         try:
-            loaned_status = (
-                session.query(BookStatus)
-                .filter(BookStatus.enumerator == "loaned")
-                .first()
+            book.status = session.get(
+                BookStatus, get_status_id(session, BookStatus, "loaned")
             )
 
-            book.status_id = loaned_status.id
-
             now = datetime.now(timezone.utc)
             due_date = now + timedelta(days=LOAN_DEFAULT_DAYS)
 
             new_loan = Loan(
-                user_id=user.id,
-                book_id=book.id,
-                status_id=active_loan_status.id,
+                user=user,
+                book=book,
+                status=session.get(LoanStatus, active_loan_status_id),
                 start_date=now,
                 due_date=due_date,
                 fine_amount=0.0,
+                events=[
+                    LoanEvent(
+                        old_status_id=None,
+                        new_status_id=active_loan_status_id,
+                        created_at=now,
+                    )
+                ],
             )
             session.add(new_loan)
             session.flush()
 
-            event = LoanEvent(
-                loan_id=new_loan.id,
-                old_status_id=None,
-                new_status_id=active_loan_status.id,
-                created_at=now,
+            notification = NotificationService().enqueue_due_date(
+                session,
+                user_email=user.email,
+                loan_key=str(new_loan.loan_key),
+                book_title=book.title,
+                due_date=due_date,
             )
-            session.add(event)
 
             session.commit()
-            session.refresh(new_loan)
 
             clear_cache(f"book:{book.book_key}:details")
+            if notification is not None:
+                wake_notification_dispatcher()
+            return new_loan
+
+        except Exception as exc:
+            session.rollback()
+            raise exc
+
+    def create_batch(self, session: Session, batch: LoanBatchCreate):
+        user = session.query(User).filter(User.user_key == batch.user_key).first()
+        if not user:
+            raise UserNotFound()
+        if user.status_id != get_status_id(session, UserStatus, "active"):
+            raise UserNotActive()
+
+        active_loan_status_id = get_status_id(session, LoanStatus, "active")
+        available_book_status_id = get_status_id(session, BookStatus, "available")
+        loaned_book_status_id = get_status_id(session, BookStatus, "loaned")
+
+        active_loans_count = (
+            session.query(Loan)
+            .filter(
+                Loan.user_id == user.id,
+                Loan.status_id == active_loan_status_id,
+                Loan.return_date.is_(None),
+            )
+            .count()
+        )
+
+        try:
+            books = self._lock_books(session, batch.book_keys)
+
+            now = datetime.now(timezone.utc)
+            due_date = now + timedelta(days=LOAN_DEFAULT_DAYS)
+
+            results = []
+            new_loans = []
+            for book_key in batch.book_keys:
+                book = books.get(book_key)
+                if not book:
+                    results.append((book_key, BookNotFound()))
+                elif book.status_id != available_book_status_id:
+                    results.append((book_key, BookNotAvailable()))
+                elif active_loans_count + len(new_loans) >= LOAN_MAX_ACTIVE_LOANS:
+                    results.append((book_key, MaxActiveLoansReached()))
+                else:
+                    book.status_id = loaned_book_status_id
+                    loan = Loan(
+                        user_id=user.id,
+                        book_id=book.id,
+                        status_id=active_loan_status_id,
+                        start_date=now,
+                        due_date=due_date,
+                        fine_amount=0.0,
+                    )
+                    new_loans.append(loan)
+                    results.append((book_key, loan))
+
+            session.add_all(new_loans)
+            session.flush()
 
-            try:
-                NotificationService.notify_due_date(
+            session.add_all(
+                LoanEvent(
+                    loan_id=loan.id,
+                    old_status_id=None,
+                    new_status_id=active_loan_status_id,
+                    created_at=now,
+                )
+                for loan in new_loans
+            )
+
+            notifications = [
+                NotificationService().enqueue_due_date(
+                    session,
                     user_email=user.email,
-                    loan_key=str(new_loan.loan_key),
-                    book_title=book.title,
+                    loan_key=str(loan.loan_key),
+                    book_title=books[book_key].title,
                     due_date=due_date,
                 )
-            except Exception:
-                pass
-            return new_loan
+                for book_key, loan in results
+                if isinstance(loan, Loan)
+            ]
+
+            results = [
+                (book_key, outcome if isinstance(outcome, CustomError) else outcome.id)
+                for book_key, outcome in results
+            ]
+            loan_ids = [loan.id for loan in new_loans]
+            session.commit()
 
         except Exception as exc:
             session.rollback()
             raise exc
 
+        for book_key, outcome in results:
+            if not isinstance(outcome, CustomError):
+                clear_cache(f"book:{book_key}:details")
+        if any(notification is not None for notification in notifications):
+            wake_notification_dispatcher()
+
+        loans = self._load_loans(session, loan_ids)
+        return self._batch_response(results, loans, "created")
+
+    def return_batch(self, session: Session, batch: LoanBatchReturnRequest):
+        active_status_id = get_status_id(session, LoanStatus, "active")
+        returned_status_id = get_status_id(session, LoanStatus, "returned")
+        available_book_status_id = get_status_id(session, BookStatus, "available")
+
+        try:
+            books = self._lock_books(session, batch.book_keys)
+            active_loans = {
+                loan.book_id: loan
+                for loan in session.query(Loan).filter(
+                    Loan.book_id.in_([book.id for book in books.values()]),
+                    Loan.status_id == active_status_id,
+                    Loan.return_date.is_(None),
+                )
+            }
+
+            now = datetime.now(timezone.utc)
+
+            results = []
+            returned = []
+            for book_key in batch.book_keys:
+                book = books.get(book_key)
+                loan = active_loans.pop(book.id, None) if book else None
+                if not book:
+                    results.append((book_key, BookNotFound()))
+                elif not loan:
+                    results.append((book_key, ActiveLoanNotFound()))
+                else:
+                    loan.return_date = now
+                    loan.status_id = returned_status_id
+                    loan.fine_amount = self._calculate_fine(loan, now)
+                    book.status_id = available_book_status_id
+                    returned.append(loan)
+                    results.append((book_key, loan.id))
+
+            loan_ids = [loan.id for loan in returned]
+
+            session.add_all(
+                LoanEvent(
+                    loan_id=loan.id,
+                    old_status_id=active_status_id,
+                    new_status_id=returned_status_id,
+                    created_at=now,
+                )
+                for loan in returned
+            )
+            loan_keys = [loan.loan_key for loan in returned]
+            session.commit()
+
+        except Exception as exc:
+            session.rollback()
+            raise exc
+
+        for book_key, outcome in results:
+            if not isinstance(outcome, CustomError):
+                clear_cache(f"book:{book_key}:details")
+        for loan_key in loan_keys:
+            clear_cache(f"loan:{loan_key}:details")
+
+        loans = self._load_loans(session, loan_ids)
+        return self._batch_response(results, loans, "returned")
+
+    @staticmethod
+    def _fast_checkout_available(session: Session) -> bool:
+        # Data-modifying CTEs are PostgreSQL-only; other backends use the ORM path.
+        return LOAN_FAST_CHECKOUT and session.get_bind().dialect.name == "postgresql"
+
+    def _checkout_statement(
+        self, session: Session, loan_data: LoanCreate, loan_key, now, due_date
+    ):
+        users, books = User.__table__, Book.__table__
+        loans, events = Loan.__table__, LoanEvent.__table__
+        active_loan_status_id = get_status_id(session, LoanStatus, "active")
+
+        active_loans = (
+            select(func.count())
+            .select_from(loans)
+            .where(
+                loans.c.user_id == users.c.id,
+                loans.c.status_id == active_loan_status_id,
+                loans.c.return_date.is_(None),
+            )
+            .scalar_subquery()
+        )
+        borrower = (
+            select(users.c.id, users.c.email)
+            .where(
+                users.c.user_key == loan_data.user_key,
+                users.c.status_id == get_status_id(session, UserStatus, "active"),
+                active_loans < LOAN_MAX_ACTIVE_LOANS,
+            )
+            .cte("borrower")
+        )
+        claimed = (
+            update(books)
+            .where(
+                books.c.book_key == loan_data.book_key,
+                books.c.status_id == get_status_id(session, BookStatus, "available"),
+                borrower.c.id.isnot(None),
+            )
+            .values(status_id=get_status_id(session, BookStatus, "loaned"))
+            .returning(
+                books.c.id,
+                books.c.title,
+                borrower.c.id.label("user_id"),
+                borrower.c.email,
+            )
+            .cte("claimed")
+        )
+        new_loan = (
+            insert(loans)
+            .from_select(
+                [
+                    "loan_key",
+                    "user_id",
+                    "book_id",
+                    "status_id",
+                    "start_date",
+                    "due_date",
+                    "fine_amount",
+                ],
+                select(
+                    literal(loan_key, loans.c.loan_key.type),
+                    claimed.c.user_id,
+                    claimed.c.id,
+                    literal(active_loan_status_id),
+                    literal(now, loans.c.start_date.type),
+                    literal(due_date, loans.c.due_date.type),
+                    literal(0.0),
+                ),
+            )
+            .returning(loans.c.id, loans.c.book_id)
+            .cte("new_loan")
+        )
+        new_event = (
+            insert(events)
+            .from_select(
+                ["loan_id", "old_status_id", "new_status_id", "created_at"],
+                select(
+                    new_loan.c.id,
+                    null(),
+                    literal(active_loan_status_id),
+                    literal(now, events.c.created_at.type),
+                ),
+            )
+            .cte("new_event")
+        )
+        return (
+            select(new_loan.c.id, claimed.c.title, claimed.c.email)
+            .join_from(new_loan, claimed, claimed.c.id == new_loan.c.book_id)
+            .add_cte(new_event)
+        )
+
+    def _create_fast(self, session: Session, loan_data: LoanCreate) -> Loan | None:
+        loan_key = uuid.uuid4()
+        now = datetime.now(timezone.utc)
+        due_date = now + timedelta(days=LOAN_DEFAULT_DAYS)
+
+        try:
+            row = session.execute(
+                self._checkout_statement(session, loan_data, loan_key, now, due_date)
+            ).first()
+            if row is None:
+                return None
+
+            mark_changed_tables(session, ("books", "loans", "loan_events"))
+            add_status_events(
+                session,
+                LoanEvent,
+                [(loan_key, None, get_status_id(session, LoanStatus, "active"))],
+            )
+            notification = NotificationService().enqueue_due_date(
+                session,
+                user_email=row.email,
+                loan_key=str(loan_key),
+                book_title=row.title,
+                due_date=due_date,
+            )
+            session.commit()
+
+        except Exception as exc:
+            session.rollback()
+            raise exc
+
+        clear_cache(f"book:{loan_data.book_key}:details")
+        if notification is not None:
+            wake_notification_dispatcher()
+        return self._load_loans(session, [row.id])[row.id]
+
+    def apply_filters(
+        self, session: Session, query, status: str = None, overdue: bool = False
+    ):
+        if status:
+            query = query.filter(
+                Loan.status_id == get_status_id(session, LoanStatus, status)
+            )
+
+        if overdue:
+            now = datetime.now(timezone.utc)
+            query = query.filter(
+                Loan.status_id == get_status_id(session, LoanStatus, "active"),
+                Loan.return_date.is_(None),
+                Loan.due_date < now,
+            )
+
+        return query
+
     def get_all(
         self,
         session: Session,
@@ -127,25 +517,15 @@ class LoanService:
         limit: int = 100,
         status: str = None,
         overdue: bool = False,
+        cursor: Optional[str] = None,
     ):
         query = session.query(Loan).options(
             joinedload(Loan.user), joinedload(Loan.book), joinedload(Loan.status)
         )
+        query = self.apply_filters(session, query, status=status, overdue=overdue)
+        return paginate(query, Loan, Loan.loan_key, skip, limit, cursor)
 
-        if status:
-            query = query.join(Loan.status).filter(LoanStatus.enumerator == status)
-
-        if overdue:
-            now = datetime.now(timezone.utc)
-            query = (
-                query.join(Loan.status)
-                .filter(LoanStatus.enumerator == "active")
-                .filter(Loan.due_date < now)
-            )
-
-        return query.offset(skip).limit(limit).all()
-
-    def get_by_key(self, session: Session, loan_key: str):
+    def get_by_key(self, session: Session, loan_key: str) -> bytes | None:
         loan_key = validate_uuid(loan_key)
         if not loan_key:
             return None
@@ -164,33 +544,35 @@ class LoanService:
             .first()
         )
 
-        if loan:
-            set_cache(cache_key, loan, ttl_seconds=CACHE_ENTITY_TTL)
+        if not loan:
+            return None
 
-        return loan
+        snapshot = dump_snapshot(LoanResponse, loan)
+        set_cache(cache_key, snapshot, ttl_seconds=CACHE_ENTITY_TTL)
+
+        return snapshot
 
     def return_book(self, session: Session, return_data: LoanReturnRequest):
         book = session.query(Book).filter(Book.book_key == return_data.book_key).first()
         if not book:
             raise BookNotFound()
 
-        active_status = (
-            session.query(LoanStatus).filter(LoanStatus.enumerator == "active").first()
-        )
-        returned_status = (
-            session.query(LoanStatus)
-            .filter(LoanStatus.enumerator == "returned")
-            .first()
-        )
-        available_book_status = (
-            session.query(BookStatus)
-            .filter(BookStatus.enumerator == "available")
-            .first()
-        )
+        active_status_id = get_status_id(session, LoanStatus, "active")
+        returned_status_id = get_status_id(session, LoanStatus, "returned")
+        available_book_status_id = get_status_id(session, BookStatus, "available")
 
         loan = (
             session.query(Loan)
-            .filter(Loan.book_id == book.id, Loan.status_id == active_status.id)
+            .options(
+                joinedload(Loan.user).joinedload(User.status),
+                joinedload(Loan.book),
+                joinedload(Loan.status),
+            )
+            .filter(
+                Loan.book_id == book.id,
+                Loan.status_id == active_status_id,
+                Loan.return_date.is_(None),
+            )
             .first()
         )
 
@@ -199,38 +581,28 @@ class LoanService:
 
         try:
             now = datetime.now(timezone.utc)
-            fine = 0.0
-
-            if loan.due_date:
-                due_date_aware = (
-                    loan.due_date
-                    if loan.due_date.tzinfo
-                    else loan.due_date.replace(tzinfo=timezone.utc)
-                )
 
-                if now > due_date_aware:
-                    days_late = (now - due_date_aware).days
-                    if days_late > 0:
-                        fine = days_late * LOAN_FINE_PER_DAY
+            active_status = loan.status
+            returned_status = session.get(LoanStatus, returned_status_id)
 
             loan.return_date = now
-            loan.status_id = returned_status.id
-            loan.fine_amount = fine
+            loan.status = returned_status
+            loan.fine_amount = self._calculate_fine(loan, now)
 
-            book.status_id = available_book_status.id
+            book.status = session.get(BookStatus, available_book_status_id)
 
-            event = LoanEvent(
-                loan_id=loan.id,
-                old_status_id=active_status.id,
-                new_status_id=returned_status.id,
-                created_at=now,
+            loan.events.append(
+                LoanEvent(
+                    old_status=active_status,
+                    new_status=returned_status,
+                    created_at=now,
+                )
             )
-            session.add(event)
 
             session.commit()
-            session.refresh(loan)
 
-            clear_cache(f"book:{return_data.book_key}:details")
+            clear_cache(f"book:{book.book_key}:details")
+            clear_cache(f"loan:{loan.loan_key}:details")
 
             return loan
 
@@ -246,8 +618,8 @@ class LoanService:
         loan = (
             session.query(Loan)
             .options(
-                joinedload(Loan.user),
-                joinedload(Loan.book),
+                joinedload(Loan.user).joinedload(User.status),
+                joinedload(Loan.book).joinedload(Book.status),
                 joinedload(Loan.status),
                 joinedload(Loan.events).joinedload(LoanEvent.new_status),
                 joinedload(Loan.events).joinedload(LoanEvent.old_status),
@@ -259,11 +631,9 @@ class LoanService:
         if not loan:
             raise LoanNotFound()
 
-        active_status = (
-            session.query(LoanStatus).filter(LoanStatus.enumerator == "active").first()
-        )
+        active_status_id = get_status_id(session, LoanStatus, "active")
 
-        if loan.status_id != active_status.id:
+        if loan.status_id != active_status_id:
             raise CannotRenewInactiveLoan()
 
         now = datetime.now(timezone.utc)
@@ -277,18 +647,22 @@ class LoanService:
         extension = timedelta(days=LOAN_RENEWAL_EXTENSION_DAYS)
         loan.due_date = (due_date or now) + extension
 
-        event = LoanEvent(
-            loan_id=loan.id,
-            old_status_id=active_status.id,
-            new_status_id=active_status.id,
-            created_at=now,
+        loan.events.append(
+            LoanEvent(
+                old_status_id=active_status_id,
+                new_status_id=active_status_id,
+                created_at=now,
+            )
         )
-        session.add(event)
 
         session.commit()
-        session.refresh(loan)
 
         cache_key = f"loan:{loan_key}:details"
-        set_cache(cache_key, loan, ttl_seconds=60)
+        set_cache(
+            cache_key,
+            dump_snapshot(LoanResponse, loan),
+            ttl_seconds=CACHE_ENTITY_TTL,
+            publish=True,
+        )
 
         return loan
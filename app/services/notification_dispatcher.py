@@ -0,0 +1,250 @@
+from datetime import datetime, timedelta, timezone
+from threading import Event, Lock, Thread
+from typing import Callable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from sqlalchemy import and_, delete, or_
+from sqlalchemy.orm import Session
+
+from app.core.constants import (
+    NOTIFY_BACKOFF_MAX_SECONDS,
+    NOTIFY_BACKOFF_SECONDS,
+    NOTIFY_BATCH_SIZE,
+    NOTIFY_HTTP_POOL_SIZE,
+    NOTIFY_LEASE_SECONDS,
+    NOTIFY_MAX_ATTEMPTS,
+    NOTIFY_POLL_INTERVAL,
+    NOTIFY_PURGE_INTERVAL,
+    NOTIFY_RETENTION_SECONDS,
+    NOTIFY_TIMEOUT,
+    get_notify_webhook_url,
+)
+from app.core.logger import get_logger, log_operation
+from app.core.metrics import record_notification
+from app.db.session import SessionLocal
+from app.models.notification_outbox import NotificationOutbox
+
+
+def build_http_session(pool_size: int = NOTIFY_HTTP_POOL_SIZE) -> requests.Session:
+    http = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    http.mount("http://", adapter)
+    http.mount("https://", adapter)
+    return http
+
+
+class NotificationDispatcher:
+    def __init__(
+        self,
+        webhook_url: str,
+        session_factory: Callable[[], Session] = SessionLocal,
+        http: Optional[requests.Session] = None,
+        batch_size: int = NOTIFY_BATCH_SIZE,
+        max_attempts: int = NOTIFY_MAX_ATTEMPTS,
+        backoff_seconds: float = NOTIFY_BACKOFF_SECONDS,
+        poll_interval: float = NOTIFY_POLL_INTERVAL,
+        lease_seconds: float = NOTIFY_LEASE_SECONDS,
+        retention_seconds: float = NOTIFY_RETENTION_SECONDS,
+        purge_interval: float = NOTIFY_PURGE_INTERVAL,
+    ) -> None:
+        self.webhook_url = webhook_url
+        self.session_factory = session_factory
+        self.http = http or build_http_session()
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.retention_seconds = retention_seconds
+        self.purge_interval = purge_interval
+        self.logger = get_logger(__name__)
+        self._wake = Event()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+        self._purged_at: Optional[datetime] = None
+
+    def backoff(self, attempts: int) -> timedelta:
+        seconds = self.backoff_seconds * 2 ** (attempts - 1)
+        return timedelta(seconds=min(seconds, NOTIFY_BACKOFF_MAX_SECONDS))
+
+    def dispatch_once(self) -> int:
+        claimed = self._claim()
+        lease_expires = datetime.now(timezone.utc) + timedelta(
+            seconds=self.lease_seconds
+        )
+
+        for message_id, event_key, payload in claimed:
+            # Rows left over once the lease runs out are reclaimed by the next poll.
+            if datetime.now(timezone.utc) >= lease_expires:
+                break
+            error = self._post(event_key, payload)
+            self._record(message_id, error)
+
+        return len(claimed)
+
+    def _claim(self) -> list[tuple[int, str, dict]]:
+        with self.session_factory() as session:
+            now = datetime.now(timezone.utc)
+            messages = (
+                session.query(NotificationOutbox)
+                .filter(
+                    or_(
+                        and_(
+                            NotificationOutbox.status == "pending",
+                            NotificationOutbox.next_attempt_at <= now,
+                        ),
+                        and_(
+                            NotificationOutbox.status == "sending",
+                            NotificationOutbox.locked_until <= now,
+                        ),
+                    )
+                )
+                .order_by(NotificationOutbox.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+
+            locked_until = now + timedelta(seconds=self.lease_seconds)
+            for message in messages:
+                message.status = "sending"
+                message.locked_until = locked_until
+            claimed = [
+                (message.id, str(message.event_key), message.payload)
+                for message in messages
+            ]
+            session.commit()
+
+            return claimed
+
+    def _post(self, event_key: str, payload: dict) -> Optional[str]:
+        try:
+            response = self.http.post(
+                self.webhook_url,
+                json=payload,
+                headers={"Idempotency-Key": event_key},
+                timeout=NOTIFY_TIMEOUT,
+            )
+            response.raise_for_status()
+        except Exception as exc:
+            return str(exc)[:500]
+        return None
+
+    def _record(self, message_id: int, error: Optional[str]) -> None:
+        with self.session_factory() as session:
+            message = session.get(NotificationOutbox, message_id, with_for_update=True)
+            if message is None or message.status != "sending":
+                return
+
+            message.attempts += 1
+            message.locked_until = None
+            if error is None:
+                message.status = "sent"
+                message.sent_at = datetime.now(timezone.utc)
+                message.last_error = None
+                record_notification("sent")
+            elif message.attempts >= self.max_attempts:
+                message.status = "dead"
+                message.last_error = error
+                record_notification("dead")
+                log_operation(
+                    self.logger,
+                    operation="notify",
+                    entity_type="notification",
+                    entity_id=str(message.event_key),
+                    status="dead",
+                    details={"error": error},
+                    level="error",
+                )
+            else:
+                message.status = "pending"
+                message.last_error = error
+                message.next_attempt_at = datetime.now(timezone.utc) + self.backoff(
+                    message.attempts
+                )
+                record_notification("retry")
+            session.commit()
+
+    def purge(self, now: Optional[datetime] = None) -> int:
+        # Sent and dead rows are only kept around for inspection.
+        now = now or datetime.now(timezone.utc)
+        cutoff = now - timedelta(seconds=self.retention_seconds)
+        with self.session_factory() as session:
+            result = session.execute(
+                delete(NotificationOutbox)
+                .where(
+                    NotificationOutbox.status.in_(("sent", "dead")),
+                    NotificationOutbox.created_at < cutoff,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+        return result.rowcount
+
+    def _purge_due(self) -> None:
+        now = datetime.now(timezone.utc)
+        if self._purged_at and now - self._purged_at < timedelta(
+            seconds=self.purge_interval
+        ):
+            return
+        self._purged_at = now
+        self.purge(now)
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def start(self) -> None:
+        self._thread = Thread(
+            target=self._run, name="notification-dispatcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self.http.close()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._purge_due()
+                dispatched = self.dispatch_once()
+            except Exception as exc:
+                dispatched = 0
+                self.logger.warning(
+                    "notification_dispatch_failed", extra={"details": str(exc)}
+                )
+            if dispatched < self.batch_size:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+
+
+_dispatcher: Optional[NotificationDispatcher] = None
+_dispatcher_lock = Lock()
+
+
+def start_notification_dispatcher() -> None:
+    global _dispatcher
+    webhook_url = get_notify_webhook_url()
+    if not webhook_url:
+        return
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = NotificationDispatcher(webhook_url)
+            _dispatcher.start()
+
+
+def stop_notification_dispatcher() -> None:
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is not None:
+            _dispatcher.stop()
+            _dispatcher = None
+
+
+def wake_notification_dispatcher() -> None:
+    if _dispatcher is not None:
+        _dispatcher.wake()
@@ -1,38 +1,52 @@
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Any, Optional
 
-import requests
+from sqlalchemy.orm import Session
 
 from app.core.constants import get_notify_webhook_url
-from app.core.logger import get_logger
+from app.models.notification_outbox import NotificationOutbox
 
 
 class NotificationService:
     def __init__(self) -> None:
         self.webhook_url = get_notify_webhook_url()
-        self.logger = get_logger(__name__)
 
-    def notify_due_date(
+    @staticmethod
+    def _due_date_payload(
+        *, user_email: str, loan_key: str, book_title: str, due_date: Optional[datetime]
+    ) -> dict[str, Any]:
+        return {
+            "type": "loan_due_date",
+            "loan_key": loan_key,
+            "user_email": user_email,
+            "book_title": book_title,
+            "due_date": due_date.isoformat() if due_date else None,
+        }
+
+    def enqueue_due_date(
         self,
+        session: Session,
         *,
         user_email: str,
         loan_key: str,
         book_title: str,
         due_date: Optional[datetime]
-    ) -> None:
+    ) -> Optional[NotificationOutbox]:
         if not self.webhook_url:
-            return
-
-        payload = {
-            "type": "loan_due_date",
-            "loan_key": loan_key,
-            "user_email": user_email,
-            "book_title": book_title,
-            "due_date": due_date.isoformat() if due_date else None,
-        }
+            return None
 
-        try:
-            response = requests.post(self.webhook_url, json=payload, timeout=3)
-            response.raise_for_status()
-        except Exception as exc:
-            self.logger.warning("notification_failed", extra={"details": str(exc)})
+        payload = self._due_date_payload(
+            user_email=user_email,
+            loan_key=loan_key,
+            book_title=book_title,
+            due_date=due_date,
+        )
+        message = NotificationOutbox(
+            type=payload["type"],
+            payload=payload,
+            status="pending",
+            attempts=0,
+            next_attempt_at=datetime.now(timezone.utc),
+        )
+        session.add(message)
+        return message
@@ -0,0 +1,70 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import BoundedSemaphore, Lock
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+from app.core.constants import (
+    RENDER_POOL_MAX_PENDING,
+    RENDER_POOL_MIN_ROWS,
+    RENDER_POOL_WORKERS,
+)
+from app.core.logger import get_logger
+from app.core.metrics import record_render, record_render_queued
+
+logger = get_logger(__name__)
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = Lock()
+_slots = BoundedSemaphore(max(RENDER_POOL_MAX_PENDING, 1))
+
+
+def get_render_executor() -> Optional[ProcessPoolExecutor]:
+    global _executor
+    if RENDER_POOL_WORKERS <= 0:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=RENDER_POOL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def shutdown_render_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def render(
+    renderer: Callable[..., bytes],
+    headers: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    *args: Any,
+) -> bytes:
+    rows = [tuple(row) for row in rows]
+    executor = get_render_executor() if len(rows) >= RENDER_POOL_MIN_ROWS else None
+    if executor is None:
+        started = time.perf_counter()
+        content = renderer(headers, rows, *args)
+        record_render(renderer.__name__, "inline", time.perf_counter() - started)
+        return content
+
+    record_render_queued(1)
+    try:
+        with _slots:
+            started = time.perf_counter()
+            content = executor.submit(renderer, headers, rows, *args).result()
+            record_render(renderer.__name__, "process", time.perf_counter() - started)
+            return content
+    except BrokenProcessPool as exc:
+        logger.warning("render_pool_broken", extra={"details": str(exc)})
+        shutdown_render_executor()
+        return renderer(headers, rows, *args)
+    finally:
+        record_render_queued(-1)
@@ -0,0 +1,153 @@
+import csv
+import io
+from itertools import islice
+from typing import Any, BinaryIO, Iterable, Sequence
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+from reportlab.platypus import Frame, LayoutError, Paragraph, Spacer, Table, TableStyle
+
+from app.core.constants import REPORT_PDF_SAMPLE_ROWS
+
+PDF_MARGIN = 30
+PDF_FONT_SIZE = 8
+PDF_CELL_PADDING = 6
+PDF_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), PDF_FONT_SIZE),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ]
+)
+
+
+def build_csv(headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> bytes:
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(headers)
+    writer.writerows(rows)
+
+    return output.getvalue().encode("utf-8")
+
+
+def _pdf_cells(row: Sequence[Any]) -> list[str]:
+    return ["" if col is None else str(col) for col in row]
+
+
+def _pdf_column_widths(
+    headers: Sequence[str], rows: Sequence[Sequence[str]], max_width: float
+) -> list[float]:
+    widths = [
+        stringWidth(header, "Helvetica-Bold", PDF_FONT_SIZE) for header in headers
+    ]
+    for row in rows:
+        for index, cell in enumerate(row):
+            widths[index] = max(
+                widths[index], stringWidth(cell, "Helvetica", PDF_FONT_SIZE)
+            )
+
+    widths = [width + 2 * PDF_CELL_PADDING for width in widths]
+    total = sum(widths)
+    if total > max_width:
+        widths = [width * max_width / total for width in widths]
+    return widths
+
+
+def _pdf_table(
+    headers: Sequence[str], rows: Sequence[Sequence[str]], widths: list[float]
+) -> Table:
+    table = Table([list(headers)] + list(rows), colWidths=widths, repeatRows=1)
+    table.setStyle(PDF_TABLE_STYLE)
+    return table
+
+
+def _draw_pdf_page(
+    pdf: canvas.Canvas, flowables: list, width: float, height: float
+) -> None:
+    frame = Frame(
+        PDF_MARGIN,
+        PDF_MARGIN,
+        width,
+        height,
+        leftPadding=0,
+        rightPadding=0,
+        topPadding=0,
+        bottomPadding=0,
+    )
+    head = flowables[0]
+    frame.addFromList(flowables, pdf)
+    if flowables:
+        pieces = frame.split(flowables[0], pdf)
+        if not pieces and flowables[0] is head:
+            raise LayoutError("Report row does not fit on a PDF page.")
+        flowables[0:1] = pieces or flowables[0:1]
+        frame.addFromList(flowables, pdf)
+    pdf.showPage()
+
+
+def write_pdf(
+    output: BinaryIO,
+    headers: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    title: str,
+    subtitle: str,
+) -> None:
+    page_width, page_height = letter
+    frame_width = page_width - 2 * PDF_MARGIN
+    frame_height = page_height - 2 * PDF_MARGIN
+    styles = getSampleStyleSheet()
+    pdf = canvas.Canvas(output, pagesize=letter)
+
+    flowables = [
+        Paragraph(title, styles["Title"]),
+        Paragraph(subtitle, styles["Normal"]),
+        Spacer(1, 12),
+    ]
+    heading_height = sum(
+        flowable.wrap(frame_width, frame_height)[1] for flowable in flowables
+    )
+
+    rows = iter(rows)
+    pending = [_pdf_cells(row) for row in islice(rows, REPORT_PDF_SAMPLE_ROWS)]
+    widths = _pdf_column_widths(headers, pending, frame_width)
+    sample = _pdf_table(headers, pending[:1] or [[""] * len(headers)], widths)
+    row_height = sample.wrap(frame_width, frame_height)[1] / 2
+    page_rows = max(int((frame_height - heading_height) // row_height) - 1, 1)
+
+    while True:
+        if len(pending) < page_rows:
+            pending.extend(
+                _pdf_cells(row) for row in islice(rows, page_rows - len(pending))
+            )
+        chunk, pending = pending[:page_rows], pending[page_rows:]
+        if not chunk and pdf.getPageNumber() > 1:
+            break
+
+        flowables.append(_pdf_table(headers, chunk, widths))
+        while flowables:
+            _draw_pdf_page(pdf, flowables, frame_width, frame_height)
+
+        if len(chunk) < page_rows:
+            break
+        page_rows = max(int(frame_height // row_height) - 1, 1)
+
+    pdf.save()
+
+
+def build_pdf(
+    headers: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    title: str,
+    subtitle: str,
+) -> bytes:
+    buffer = io.BytesIO()
+    write_pdf(buffer, headers, rows, title, subtitle)
+    return buffer.getvalue()
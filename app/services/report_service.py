@@ -1,18 +1,112 @@
 import csv
+import hashlib
 import io
-from typing import Any, Optional, Sequence
+import json
+import tempfile
+import time
+from datetime import date, datetime
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Optional, Sequence
 
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from sqlalchemy import Select, select
 from sqlalchemy.orm import Session
 
+from app.core.constants import (
+    PDF_READ_SIZE,
+    REPORT_CACHE_MAX_BYTES,
+    REPORT_CACHE_TTL,
+    REPORT_STREAM_CHUNK_SIZE,
+)
 from app.core.errors import InvalidExportFormat
+from app.models import (
+    Book,
+    BookStatus,
+    Loan,
+    LoanStatus,
+    Reservation,
+    ReservationStatus,
+    User,
+    UserStatus,
+)
+from app.services import render_pool
 from app.services.book_service import BookService
 from app.services.loan_service import LoanService
+from app.services.report_render import build_csv, build_pdf, write_pdf
 from app.services.reservation_service import ReservationService
 from app.services.user_service import UserService
+from app.utils.cache import get_cache, set_cache
+from app.utils.data_version import get_data_versions
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = pq = None
+
+LOAN_HEADERS = [
+    "Loan ID",
+    "User ID",
+    "Book ID",
+    "Status",
+    "Start",
+    "Due",
+    "Return",
+    "Fine",
+]
+USER_HEADERS = ["User ID", "Name", "Email", "Status", "Created At"]
+BOOK_HEADERS = ["Book ID", "Title", "Author", "Genre", "Status", "Created At"]
+RESERVATION_HEADERS = [
+    "Res. ID",
+    "User Name",
+    "Book Title",
+    "Status",
+    "Reserved At",
+    "Expires At",
+    "Completed",
+]
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "pdf": "application/pdf",
+    "ndjson": "application/x-ndjson",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+ARROW_FORMATS = {"arrow", "parquet"}
+REPORT_TABLES = {
+    "loans": ("loans", "users", "books", "loan_status"),
+    "users": ("users", "user_status"),
+    "books": ("books", "book_status"),
+    "reservations": ("reservations", "users", "books", "reservation_status"),
+}
+
+
+class _ChunkSink(io.RawIOBase):
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self.chunks.append(chunk)
+        self.position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self.position
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
 
 
 class ReportService:
@@ -29,251 +123,500 @@ class ReportService:
         self.reservation_service = reservation_service or ReservationService()
 
     @staticmethod
-    def _validate_format(format: str) -> str:
+    def validate_format(format: str) -> str:
         normalized_format = format.lower()
-        if normalized_format not in {"csv", "pdf"}:
-            raise InvalidExportFormat("Unsupported format. Use 'csv' or 'pdf'.")
+        if normalized_format not in EXPORT_MEDIA_TYPES:
+            raise InvalidExportFormat(
+                f"Unsupported format. Use one of: {', '.join(EXPORT_MEDIA_TYPES)}."
+            )
+        if normalized_format in ARROW_FORMATS and pa is None:
+            raise InvalidExportFormat(
+                f"Format '{normalized_format}' requires the 'pyarrow' package."
+            )
         return normalized_format
 
-    def _safe_get(self, obj: Any, path: str, default: str = "") -> str:
-        current = obj
-        for attr in path.split("."):
-            if isinstance(current, dict):
-                current = current.get(attr)
-            else:
-                current = getattr(current, attr, None)
+    def select_loans(
+        self,
+        session: Session,
+        status_filter: Optional[str] = None,
+        overdue: bool = False,
+    ) -> Select:
+        query = (
+            select(
+                Loan.loan_key,
+                User.user_key,
+                Book.book_key,
+                LoanStatus.enumerator.label("status"),
+                Loan.start_date,
+                Loan.due_date,
+                Loan.return_date,
+                Loan.fine_amount,
+            )
+            .select_from(Loan)
+            .join(User, Loan.user_id == User.id)
+            .join(Book, Loan.book_id == Book.id)
+            .join(LoanStatus, Loan.status_id == LoanStatus.id)
+            .order_by(Loan.id)
+        )
+        return self.loan_service.apply_filters(
+            session, query, status=status_filter, overdue=overdue
+        )
 
-            if current is None:
-                return default
+    def select_users(self, session: Session) -> Select:
+        return (
+            select(
+                User.user_key,
+                User.name,
+                User.email,
+                UserStatus.enumerator.label("status"),
+                User.created_at,
+            )
+            .select_from(User)
+            .join(UserStatus, User.status_id == UserStatus.id)
+            .order_by(User.id)
+        )
 
-        return str(current)
+    def select_books(self, session: Session, genre: Optional[str] = None) -> Select:
+        query = (
+            select(
+                Book.book_key,
+                Book.title,
+                Book.author,
+                Book.genre,
+                BookStatus.enumerator.label("status"),
+                Book.created_at,
+            )
+            .select_from(Book)
+            .join(BookStatus, Book.status_id == BookStatus.id)
+            .order_by(Book.id)
+        )
+        return self.book_service.apply_filters(session, query, genre=genre)
+
+    def select_reservations(
+        self,
+        session: Session,
+        user_key: Optional[str] = None,
+        book_key: Optional[str] = None,
+        status_filter: Optional[str] = None,
+    ) -> Select:
+        query = (
+            select(
+                Reservation.reservation_key,
+                User.name.label("user_name"),
+                Book.title.label("book_title"),
+                ReservationStatus.enumerator.label("status"),
+                Reservation.reserved_at,
+                Reservation.expires_at,
+                Reservation.completed_at,
+            )
+            .select_from(Reservation)
+            .join(User, Reservation.user_id == User.id)
+            .join(Book, Reservation.book_id == Book.id)
+            .join(ReservationStatus, Reservation.status_id == ReservationStatus.id)
+            .order_by(Reservation.id)
+        )
+        return self.reservation_service.apply_filters(
+            session, query, user_key=user_key, book_key=book_key, status=status_filter
+        )
+
+    def _fetch(
+        self, session: Session, query: Select, skip: int, limit: Optional[int]
+    ) -> Sequence[Sequence[Any]]:
+        return session.execute(query.offset(skip).limit(limit)).all()
 
     def _build_csv(
         self, headers: Sequence[str], rows: Sequence[Sequence[Any]]
     ) -> bytes:
+        return render_pool.render(build_csv, headers, rows)
+
+    def _build_pdf(
+        self,
+        headers: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        title: str,
+        subtitle: str,
+    ) -> bytes:
+        return render_pool.render(build_pdf, headers, rows, title, subtitle)
+
+    def _write_pdf(
+        self,
+        output: BinaryIO,
+        headers: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        title: str,
+        subtitle: str,
+    ) -> None:
+        write_pdf(output, headers, rows, title, subtitle)
+
+    def _stream_partitions(
+        self,
+        session: Session,
+        query: Select,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> Iterator[Sequence[Sequence[Any]]]:
+        fetched = 0
+        result = session.execute(
+            query.execution_options(yield_per=REPORT_STREAM_CHUNK_SIZE)
+        )
+        for partition in result.partitions():
+            yield partition
+            fetched += len(partition)
+            if on_progress:
+                on_progress(fetched)
+
+        if on_progress:
+            on_progress(fetched)
+
+    def _stream_rows(
+        self,
+        session: Session,
+        query: Select,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> Iterator[Sequence[Any]]:
+        for partition in self._stream_partitions(session, query, on_progress):
+            yield from partition
+
+    def _stream_csv(
+        self,
+        session: Session,
+        headers: Sequence[str],
+        query: Select,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> Iterator[bytes]:
         output = io.StringIO()
         writer = csv.writer(output)
         writer.writerow(headers)
-        writer.writerows(rows)
 
-        return output.getvalue().encode("utf-8")
+        for partition in self._stream_partitions(session, query, on_progress):
+            writer.writerows(partition)
+            yield output.getvalue().encode("utf-8")
+            output.seek(0)
+            output.truncate(0)
 
-    def _build_pdf(
+        if output.tell():
+            yield output.getvalue().encode("utf-8")
+
+    @staticmethod
+    def _arrow_schema(query: Select) -> "pa.Schema":
+        fields = []
+        for column in query.selected_columns:
+            try:
+                python_type = column.type.python_type
+            except NotImplementedError:
+                python_type = str
+
+            if python_type is datetime:
+                timezone = "UTC" if getattr(column.type, "timezone", False) else None
+                arrow_type = pa.timestamp("us", tz=timezone)
+            else:
+                arrow_type = {
+                    bool: pa.bool_(),
+                    int: pa.int64(),
+                    float: pa.float64(),
+                    date: pa.date32(),
+                }.get(python_type, pa.string())
+            fields.append(pa.field(column.name, arrow_type))
+        return pa.schema(fields)
+
+    @staticmethod
+    def _arrow_batch(
+        schema: "pa.Schema", rows: Sequence[Sequence[Any]]
+    ) -> "pa.RecordBatch":
+        columns = list(zip(*rows)) if rows else [()] * len(schema)
+        arrays = []
+        for field, values in zip(schema, columns):
+            if pa.types.is_string(field.type):
+                values = [None if value is None else str(value) for value in values]
+            arrays.append(pa.array(values, type=field.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def _encode_batches(
+        self,
+        fmt: str,
+        query: Select,
+        batches: Iterable[Sequence[Sequence[Any]]],
+    ) -> Iterator[bytes]:
+        if fmt == "ndjson":
+            names = [column.name for column in query.selected_columns]
+            for rows in batches:
+                yield "".join(
+                    json.dumps(dict(zip(names, row)), default=_json_default) + "\n"
+                    for row in rows
+                ).encode("utf-8")
+            return
+
+        schema = self._arrow_schema(query)
+        sink = _ChunkSink()
+        if fmt == "parquet":
+            writer = pq.ParquetWriter(sink, schema)
+        else:
+            writer = pa.ipc.new_stream(sink, schema)
+
+        for rows in batches:
+            writer.write_batch(self._arrow_batch(schema, rows))
+            yield sink.drain()
+
+        writer.close()
+        yield sink.drain()
+
+    def _stream_pdf(
         self,
+        session: Session,
         headers: Sequence[str],
-        rows: Sequence[Sequence[Any]],
+        query: Select,
         title: str,
         subtitle: str,
-    ) -> bytes:
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=letter,
-            rightMargin=30,
-            leftMargin=30,
-            topMargin=30,
-            bottomMargin=30,
-        )
-        elements = []
-        styles = getSampleStyleSheet()
-
-        elements.append(Paragraph(title, styles["Title"]))
-        elements.append(Paragraph(subtitle, styles["Normal"]))
-        elements.append(Spacer(1, 12))
-
-        table_data = [headers] + [[str(col) for col in row] for row in rows]
-
-        table = Table(table_data)
-
-        style = TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 8),
-                ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ]
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> Iterator[bytes]:
+        with tempfile.TemporaryFile() as buffer:
+            rows = self._stream_rows(session, query, on_progress)
+            self._write_pdf(buffer, headers, rows, title, subtitle)
+            buffer.seek(0)
+            while chunk := buffer.read(PDF_READ_SIZE):
+                yield chunk
+
+    def export_etag(
+        self, name: str, fmt: str, skip: int, limit: Optional[int], **filters: Any
+    ) -> Optional[str]:
+        normalized = self.validate_format(fmt)
+        if REPORT_CACHE_TTL <= 0:
+            return None
+
+        versions = get_data_versions(REPORT_TABLES[name])
+        if versions is None:
+            return None
+
+        window = int(time.time() // REPORT_CACHE_TTL)
+        payload = repr(
+            (name, normalized, skip, limit, sorted(filters.items()), versions, window)
         )
-        table.setStyle(style)
+        return f'"{hashlib.sha256(payload.encode()).hexdigest()[:32]}"'
+
+    def _render(
+        self,
+        session: Session,
+        name: str,
+        headers: Sequence[str],
+        query: Select,
+        skip: int,
+        limit: Optional[int],
+        fmt: str,
+        title: str,
+        subtitle: str,
+        filters: dict[str, Any],
+    ) -> tuple[bytes, str, str]:
+        etag = self.export_etag(name, fmt, skip, limit, **filters)
+        cache_key = f"report:{etag}"
+        content = get_cache(cache_key) if etag else None
+
+        if content is None:
+            rows = self._fetch(session, query, skip, limit)
+            if fmt == "pdf":
+                content = self._build_pdf(headers, rows, title=title, subtitle=subtitle)
+            elif fmt == "csv":
+                content = self._build_csv(headers, rows)
+            else:
+                content = b"".join(self._encode_batches(fmt, query, [rows]))
 
-        elements.append(table)
+            if etag and len(content) <= REPORT_CACHE_MAX_BYTES:
+                set_cache(cache_key, content, ttl_seconds=REPORT_CACHE_TTL)
 
-        doc.build(elements)
-        return buffer.getvalue()
+        return content, EXPORT_MEDIA_TYPES[fmt], f"{name}.{fmt}"
 
     def export_loans(
         self,
         session: Session,
         skip: int,
-        limit: int,
+        limit: Optional[int],
         status_filter: Optional[str],
         overdue: bool,
         fmt: str,
     ) -> tuple[bytes, str, str]:
-        normalized = self._validate_format(fmt)
-        loans = self.loan_service.get_all(
+        normalized = self.validate_format(fmt)
+        query = self.select_loans(session, status_filter=status_filter, overdue=overdue)
+        return self._render(
             session,
-            skip=skip,
-            limit=limit,
-            status=status_filter,
-            overdue=overdue,
+            "loans",
+            LOAN_HEADERS,
+            query,
+            skip,
+            limit,
+            normalized,
+            title="Loan Report",
+            subtitle=f"Status: {status_filter or 'All'} | Overdue: {overdue}",
+            filters={"status_filter": status_filter, "overdue": overdue},
         )
 
-        headers = [
-            "Loan ID",
-            "User ID",
-            "Book ID",
-            "Status",
-            "Start",
-            "Due",
-            "Return",
-            "Fine",
-        ]
-
-        rows = [
-            [
-                self._safe_get(loan, "loan_key"),
-                self._safe_get(loan, "user_key"),
-                self._safe_get(loan, "book_key"),
-                self._safe_get(loan, "status.enumerator"),
-                self._safe_get(loan, "start_date"),
-                self._safe_get(loan, "due_date"),
-                self._safe_get(loan, "return_date"),
-                self._safe_get(loan, "fine_amount"),
-            ]
-            for loan in loans
-        ]
-
-        if normalized == "pdf":
-            content = self._build_pdf(
-                headers,
-                rows,
-                title="Loan Report",
-                subtitle=f"Status: {status_filter or 'All'} | Overdue: {overdue}",
-            )
-            return content, "application/pdf", "loans.pdf"
-
-        return self._build_csv(headers, rows), "text/csv", "loans.csv"
-
     def export_users(
-        self, session: Session, skip: int, limit: int, fmt: str
+        self, session: Session, skip: int, limit: Optional[int], fmt: str
     ) -> tuple[bytes, str, str]:
-        normalized = self._validate_format(fmt)
-        users = self.user_service.get_all(session, skip=skip, limit=limit)
-
-        headers = ["User ID", "Name", "Email", "Status", "Created At"]
-
-        rows = [
-            [
-                self._safe_get(user, "user_key"),
-                self._safe_get(user, "name"),
-                self._safe_get(user, "email"),
-                self._safe_get(user, "status.enumerator"),
-                self._safe_get(user, "created_at"),
-            ]
-            for user in users
-        ]
-
-        if normalized == "pdf":
-            content = self._build_pdf(
-                headers,
-                rows,
-                title="Users Report",
-                subtitle="All users (paginated)",
-            )
-            return content, "application/pdf", "users.pdf"
-
-        return self._build_csv(headers, rows), "text/csv", "users.csv"
+        normalized = self.validate_format(fmt)
+        query = self.select_users(session)
+        return self._render(
+            session,
+            "users",
+            USER_HEADERS,
+            query,
+            skip,
+            limit,
+            normalized,
+            title="Users Report",
+            subtitle="All users (paginated)",
+            filters={},
+        )
 
     def export_books(
         self,
         session: Session,
         skip: int,
-        limit: int,
+        limit: Optional[int],
         genre: Optional[str],
         fmt: str,
     ) -> tuple[bytes, str, str]:
-        normalized = self._validate_format(fmt)
-        books = self.book_service.get_all(
-            session=session, skip=skip, limit=limit, genre=genre
+        normalized = self.validate_format(fmt)
+        query = self.select_books(session, genre=genre)
+        return self._render(
+            session,
+            "books",
+            BOOK_HEADERS,
+            query,
+            skip,
+            limit,
+            normalized,
+            title="Books Report",
+            subtitle=f"Genre: {genre}" if genre else "All genres",
+            filters={"genre": genre},
         )
 
-        headers = ["Book ID", "Title", "Author", "Genre", "Status", "Created At"]
-
-        rows = [
-            [
-                self._safe_get(book, "book_key"),
-                self._safe_get(book, "title"),
-                self._safe_get(book, "author"),
-                self._safe_get(book, "genre"),
-                self._safe_get(book, "status.enumerator"),
-                self._safe_get(book, "created_at"),
-            ]
-            for book in books
-        ]
-
-        subtitle = f"Genre: {genre}" if genre else "All genres"
-
-        if normalized == "pdf":
-            content = self._build_pdf(
-                headers, rows, title="Books Report", subtitle=subtitle
-            )
-            return content, "application/pdf", "books.pdf"
-
-        return self._build_csv(headers, rows), "text/csv", "books.csv"
-
     def export_reservations(
         self,
         session: Session,
         skip: int,
-        limit: int,
+        limit: Optional[int],
         user_key: Optional[str],
         book_key: Optional[str],
         status_filter: Optional[str],
         fmt: str,
     ) -> tuple[bytes, str, str]:
-        normalized = self._validate_format(fmt)
-        reservations = self.reservation_service.get_all(
-            session=session,
-            skip=skip,
-            limit=limit,
-            user_key=user_key,
-            book_key=book_key,
-            status=status_filter,
+        normalized = self.validate_format(fmt)
+        query = self.select_reservations(
+            session, user_key=user_key, book_key=book_key, status_filter=status_filter
+        )
+        return self._render(
+            session,
+            "reservations",
+            RESERVATION_HEADERS,
+            query,
+            skip,
+            limit,
+            normalized,
+            title="Reservations Report",
+            subtitle=f"Status: {status_filter or 'any'}",
+            filters={
+                "user_key": user_key,
+                "book_key": book_key,
+                "status_filter": status_filter,
+            },
         )
 
-        headers = [
-            "Res. ID",
-            "User Name",
-            "Book Title",
-            "Status",
-            "Reserved At",
-            "Expires At",
-            "Completed",
-        ]
-
-        rows = [
-            [
-                self._safe_get(reservation, "reservation_key"),
-                self._safe_get(reservation, "user_name"),
-                self._safe_get(reservation, "book_title"),
-                self._safe_get(reservation, "status_name"),
-                self._safe_get(reservation, "reserved_at"),
-                self._safe_get(reservation, "expires_at"),
-                self._safe_get(reservation, "completed_at"),
-            ]
-            for reservation in reservations
-        ]
-
-        subtitle = f"Status: {status_filter or 'any'}"
-
+    def _stream(
+        self,
+        session: Session,
+        name: str,
+        headers: Sequence[str],
+        query: Select,
+        fmt: str,
+        title: str,
+        subtitle: str,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> tuple[Iterator[bytes], str, str]:
+        normalized = self.validate_format(fmt)
         if normalized == "pdf":
-            content = self._build_pdf(
-                headers, rows, title="Reservations Report", subtitle=subtitle
+            content = self._stream_pdf(
+                session, headers, query, title, subtitle, on_progress
             )
-            return content, "application/pdf", "reservations.pdf"
+        elif normalized == "csv":
+            content = self._stream_csv(session, headers, query, on_progress)
+        else:
+            partitions = self._stream_partitions(session, query, on_progress)
+            content = self._encode_batches(normalized, query, partitions)
 
-        return self._build_csv(headers, rows), "text/csv", "reservations.csv"
+        return content, EXPORT_MEDIA_TYPES[normalized], f"{name}.{normalized}"
+
+    def stream_loans(
+        self,
+        session: Session,
+        status_filter: Optional[str],
+        overdue: bool,
+        fmt: str,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> tuple[Iterator[bytes], str, str]:
+        query = self.select_loans(session, status_filter=status_filter, overdue=overdue)
+        return self._stream(
+            session,
+            "loans",
+            LOAN_HEADERS,
+            query,
+            fmt,
+            title="Loan Report",
+            subtitle=f"Status: {status_filter or 'All'} | Overdue: {overdue}",
+            on_progress=on_progress,
+        )
+
+    def stream_users(
+        self,
+        session: Session,
+        fmt: str,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> tuple[Iterator[bytes], str, str]:
+        return self._stream(
+            session,
+            "users",
+            USER_HEADERS,
+            self.select_users(session),
+            fmt,
+            title="Users Report",
+            subtitle="All users",
+            on_progress=on_progress,
+        )
+
+    def stream_books(
+        self,
+        session: Session,
+        genre: Optional[str],
+        fmt: str,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> tuple[Iterator[bytes], str, str]:
+        return self._stream(
+            session,
+            "books",
+            BOOK_HEADERS,
+            self.select_books(session, genre=genre),
+            fmt,
+            title="Books Report",
+            subtitle=f"Genre: {genre}" if genre else "All genres",
+            on_progress=on_progress,
+        )
+
+    def stream_reservations(
+        self,
+        session: Session,
+        user_key: Optional[str],
+        book_key: Optional[str],
+        status_filter: Optional[str],
+        fmt: str,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> tuple[Iterator[bytes], str, str]:
+        query = self.select_reservations(
+            session, user_key=user_key, book_key=book_key, status_filter=status_filter
+        )
+        return self._stream(
+            session,
+            "reservations",
+            RESERVATION_HEADERS,
+            query,
+            fmt,
+            title="Reservations Report",
+            subtitle=f"Status: {status_filter or 'any'}",
+            on_progress=on_progress,
+        )
@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
+from typing import Optional
 
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 from sqlalchemy.orm import Session, joinedload
 
 from app.core.constants import CACHE_ENTITY_TTL, RESERVATION_EXPIRY_DAYS
@@ -17,10 +18,14 @@ from app.core.errors import (
 from app.models.book import Book
 from app.models.book_status import BookStatus
 from app.models.reservation import Reservation
+from app.models.reservation_event import ReservationEvent
 from app.models.reservation_status import ReservationStatus
 from app.models.user import User
-from app.schemas.reservation import ReservationCreate
+from app.schemas.reservation import ReservationCreate, ReservationResponse
 from app.utils.cache import get_cache, set_cache
+from app.utils.pagination import paginate
+from app.utils.snapshot import dump_snapshot
+from app.utils.status_registry import get_status_id
 from app.utils.uuid import validate_uuid
 
 
@@ -29,6 +34,7 @@ class ReservationService:
     def create(self, session: Session, reservation_data: ReservationCreate):
         user = (
             session.query(User)
+            .options(joinedload(User.status))
             .filter(User.user_key == reservation_data.user_key)
             .first()
         )
@@ -37,25 +43,17 @@ class ReservationService:
 
         book = (
             session.query(Book)
+            .options(joinedload(Book.status))
             .filter(Book.book_key == reservation_data.book_key)
             .first()
         )
         if not book:
             raise BookNotFound()
 
-        available_status = (
-            session.query(BookStatus)
-            .filter(BookStatus.enumerator == "available")
-            .first()
-        )
-        if book.status_id == available_status.id:
+        if book.status_id == get_status_id(session, BookStatus, "available"):
             raise CannotReserveAvailableBook()
 
-        active_status = (
-            session.query(ReservationStatus)
-            .filter(ReservationStatus.enumerator == "active")
-            .first()
-        )
+        active_status_id = get_status_id(session, ReservationStatus, "active")
 
         existing_reservation = (
             session.query(Reservation)
@@ -63,7 +61,7 @@ class ReservationService:
                 and_(
                     Reservation.user_id == user.id,
                     Reservation.book_id == book.id,
-                    Reservation.status_id == active_status.id,
+                    Reservation.status_id == active_status_id,
                 )
             )
             .first()
@@ -73,56 +71,82 @@ class ReservationService:
 
         expires_at = datetime.now() + timedelta(days=RESERVATION_EXPIRY_DAYS)
         new_reservation = Reservation(
-            user_id=user.id,
-            book_id=book.id,
-            status_id=active_status.id,
+            user=user,
+            book=book,
+            status=session.get(ReservationStatus, active_status_id),
             expires_at=expires_at,
+            events=[
+                ReservationEvent(
+                    old_status_id=None,
+                    new_status_id=active_status_id,
+                    created_at=datetime.now(),
+                )
+            ],
         )
         session.add(new_reservation)
         session.commit()
-        session.refresh(new_reservation)
-
-        full_reservation = self._get_with_relations(
-            session, new_reservation.reservation_key
-        )
 
-        return full_reservation
+        return new_reservation
 
-    def get_all(
+    def apply_filters(
         self,
         session: Session,
-        skip: int = 0,
-        limit: int = 100,
+        query,
         user_key: str = None,
         book_key: str = None,
         status: str = None,
     ):
-        query = session.query(Reservation).options(
-            joinedload(Reservation.user),
-            joinedload(Reservation.book),
-            joinedload(Reservation.status),
-        )
-
         if user_key:
             user_key = validate_uuid(user_key)
             if user_key:
-                query = query.join(User).filter(User.user_key == user_key)
+                query = query.filter(
+                    Reservation.user_id
+                    == select(User.id)
+                    .where(User.user_key == user_key)
+                    .scalar_subquery()
+                )
 
         if book_key:
             book_key = validate_uuid(book_key)
             if book_key:
-                query = query.join(Book).filter(Book.book_key == book_key)
+                query = query.filter(
+                    Reservation.book_id
+                    == select(Book.id)
+                    .where(Book.book_key == book_key)
+                    .scalar_subquery()
+                )
 
         if status:
-            query = query.join(Reservation.status).filter(
-                ReservationStatus.enumerator == status.lower()
+            query = query.filter(
+                Reservation.status_id
+                == get_status_id(session, ReservationStatus, status.lower())
             )
-        reservations = (
-            query.order_by(Reservation.reserved_at).offset(skip).limit(limit).all()
+
+        return query
+
+    def get_all(
+        self,
+        session: Session,
+        skip: int = 0,
+        limit: int = 100,
+        user_key: str = None,
+        book_key: str = None,
+        status: str = None,
+        cursor: Optional[str] = None,
+    ):
+        query = session.query(Reservation).options(
+            joinedload(Reservation.user),
+            joinedload(Reservation.book),
+            joinedload(Reservation.status),
+        )
+        query = self.apply_filters(
+            session, query, user_key=user_key, book_key=book_key, status=status
+        )
+        return paginate(
+            query, Reservation, Reservation.reservation_key, skip, limit, cursor
         )
-        return reservations
 
-    def get_by_key(self, session: Session, reservation_key: str):
+    def get_by_key(self, session: Session, reservation_key: str) -> bytes | None:
         reservation_key = validate_uuid(reservation_key)
         if not reservation_key:
             return None
@@ -134,10 +158,13 @@ class ReservationService:
 
         reservation = self._get_with_relations(session, reservation_key)
 
-        if reservation:
-            set_cache(cache_key, reservation, ttl_seconds=CACHE_ENTITY_TTL)
+        if not reservation:
+            return None
 
-        return reservation
+        snapshot = dump_snapshot(ReservationResponse, reservation)
+        set_cache(cache_key, snapshot, ttl_seconds=CACHE_ENTITY_TTL)
+
+        return snapshot
 
     def cancel_reservation(self, session: Session, reservation_key: str):
         reservation_key = validate_uuid(reservation_key)
@@ -149,30 +176,27 @@ class ReservationService:
         if not reservation:
             raise ReservationNotFound()
 
-        cancelled_status = (
-            session.query(ReservationStatus)
-            .filter(ReservationStatus.enumerator == "cancelled")
-            .first()
-        )
-        completed_status = (
-            session.query(ReservationStatus)
-            .filter(ReservationStatus.enumerator == "completed")
-            .first()
-        )
+        cancelled_status_id = get_status_id(session, ReservationStatus, "cancelled")
+        completed_status_id = get_status_id(session, ReservationStatus, "completed")
 
-        if reservation.status_id == cancelled_status.id:
+        if reservation.status_id == cancelled_status_id:
             raise ReservationAlreadyCancelled()
-        if reservation.status_id == completed_status.id:
+        if reservation.status_id == completed_status_id:
             raise CannotCancelCompletedReservation()
 
-        reservation.status_id = cancelled_status.id
+        self._create_event(session, reservation, cancelled_status_id)
+        reservation.status = session.get(ReservationStatus, cancelled_status_id)
         session.commit()
 
         cache_key = f"reservation:{reservation_key}:details"
-        updated = self._get_with_relations(session, reservation_key)
-        set_cache(cache_key, updated, ttl_seconds=CACHE_ENTITY_TTL)
+        set_cache(
+            cache_key,
+            dump_snapshot(ReservationResponse, reservation),
+            ttl_seconds=CACHE_ENTITY_TTL,
+            publish=True,
+        )
 
-        return updated
+        return reservation
 
     def complete_reservation(self, session: Session, reservation_key: str):
         reservation_key = validate_uuid(reservation_key)
@@ -184,36 +208,45 @@ class ReservationService:
         if not reservation:
             raise ReservationNotFound()
 
-        active_status = (
-            session.query(ReservationStatus)
-            .filter(ReservationStatus.enumerator == "active")
-            .first()
-        )
-        if reservation.status_id != active_status.id:
+        active_status_id = get_status_id(session, ReservationStatus, "active")
+        if reservation.status_id != active_status_id:
             raise CannotCompleteInactiveReservation()
 
-        completed_status = (
-            session.query(ReservationStatus)
-            .filter(ReservationStatus.enumerator == "completed")
-            .first()
-        )
-        reservation.status_id = completed_status.id
+        completed_status_id = get_status_id(session, ReservationStatus, "completed")
+        self._create_event(session, reservation, completed_status_id)
+        reservation.status = session.get(ReservationStatus, completed_status_id)
         reservation.completed_at = datetime.now()
 
         session.commit()
 
         cache_key = f"reservation:{reservation_key}:details"
-        updated = self._get_with_relations(session, reservation_key)
-        set_cache(cache_key, updated, ttl_seconds=CACHE_ENTITY_TTL)
+        set_cache(
+            cache_key,
+            dump_snapshot(ReservationResponse, reservation),
+            ttl_seconds=CACHE_ENTITY_TTL,
+            publish=True,
+        )
+
+        return reservation
 
-        return updated
+    def _create_event(
+        self, session: Session, reservation: Reservation, new_status_id: int
+    ) -> None:
+        session.add(
+            ReservationEvent(
+                reservation=reservation,
+                old_status_id=reservation.status_id,
+                new_status_id=new_status_id,
+                created_at=datetime.now(),
+            )
+        )
 
     def _get_with_relations(self, session: Session, reservation_key):
         return (
             session.query(Reservation)
             .options(
-                joinedload(Reservation.user),
-                joinedload(Reservation.book),
+                joinedload(Reservation.user).joinedload(User.status),
+                joinedload(Reservation.book).joinedload(Book.status),
                 joinedload(Reservation.status),
             )
             .filter(Reservation.reservation_key == reservation_key)
@@ -0,0 +1,184 @@
+from datetime import datetime, timedelta, timezone
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Optional
+
+from sqlalchemy import Select, and_, case, delete, func, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.core.constants import (
+    REPORT_STATS_MAX_AGE_SECONDS,
+    REPORT_STATS_REFRESH_SECONDS,
+)
+from app.core.errors import InvalidStatsGroup
+from app.core.logger import get_logger, log_operation
+from app.db.session import SessionLocal
+from app.models import Book, Loan, LoanStat, LoanStatus
+
+STATS_GROUPS = ("status", "genre", "month")
+
+
+class StatsService:
+    def __init__(self) -> None:
+        self.logger = get_logger(__name__)
+
+    @staticmethod
+    def _bucket(session: Session, group_by: str):
+        if group_by == "status":
+            return LoanStatus.enumerator
+        if group_by == "genre":
+            return Book.genre
+        if session.get_bind().dialect.name == "sqlite":
+            return func.strftime("%Y-%m", Loan.start_date)
+        return func.to_char(Loan.start_date, "YYYY-MM")
+
+    def aggregate(
+        self, session: Session, group_by: str, now: Optional[datetime] = None
+    ) -> Select:
+        if group_by not in STATS_GROUPS:
+            raise InvalidStatsGroup()
+
+        now = now or datetime.now(timezone.utc)
+        bucket = self._bucket(session, group_by)
+        not_returned = Loan.return_date.is_(None)
+        query = select(
+            bucket.label("bucket"),
+            func.count(Loan.id).label("loans"),
+            func.sum(case((not_returned, 1), else_=0)).label("active"),
+            func.sum(case((and_(not_returned, Loan.due_date < now), 1), else_=0)).label(
+                "overdue"
+            ),
+            func.sum(case((not_returned, 0), else_=1)).label("returned"),
+            func.coalesce(func.sum(Loan.fine_amount), 0.0).label("fines"),
+        ).select_from(Loan)
+
+        if group_by == "status":
+            query = query.join(LoanStatus, Loan.status_id == LoanStatus.id)
+        elif group_by == "genre":
+            query = query.join(Book, Loan.book_id == Book.id)
+
+        return query.group_by(bucket).order_by(bucket)
+
+    def get_loan_stats(
+        self, session: Session, group_by: str, live: bool = False
+    ) -> dict[str, Any]:
+        if group_by not in STATS_GROUPS:
+            raise InvalidStatsGroup()
+
+        if not live:
+            query = session.query(LoanStat).filter(LoanStat.dimension == group_by)
+            if REPORT_STATS_MAX_AGE_SECONDS > 0:
+                # A summary the refresher stopped updating is worse than a live scan.
+                cutoff = datetime.now(timezone.utc) - timedelta(
+                    seconds=REPORT_STATS_MAX_AGE_SECONDS
+                )
+                query = query.filter(LoanStat.refreshed_at >= cutoff)
+            rows = query.order_by(LoanStat.bucket).all()
+            if rows:
+                return {
+                    "group_by": group_by,
+                    "source": "summary",
+                    "refreshed_at": rows[0].refreshed_at,
+                    "buckets": rows,
+                }
+
+        rows = session.execute(self.aggregate(session, group_by)).mappings().all()
+        return {
+            "group_by": group_by,
+            "source": "live",
+            "refreshed_at": None,
+            "buckets": rows,
+        }
+
+    @staticmethod
+    def _lock_summary(session: Session) -> None:
+        # Serializes concurrent refreshes (worker thread vs. the refresh endpoint)
+        # so two delete+insert passes cannot interleave; readers are not blocked.
+        if session.get_bind().dialect.name == "postgresql":
+            session.execute(text("LOCK TABLE loan_stats IN EXCLUSIVE MODE"))
+
+    def refresh(self, session: Session) -> dict[str, Any]:
+        self._lock_summary(session)
+        refreshed_at = datetime.now(timezone.utc)
+        values = []
+        for group_by in STATS_GROUPS:
+            query = self.aggregate(session, group_by, now=refreshed_at)
+            values.extend(
+                {**row, "dimension": group_by, "refreshed_at": refreshed_at}
+                for row in session.execute(query).mappings()
+            )
+
+        session.execute(delete(LoanStat))
+        if values:
+            session.execute(insert(LoanStat), values)
+        session.commit()
+
+        log_operation(
+            self.logger,
+            operation="refresh",
+            entity_type="loan_stats",
+            details={"buckets": len(values)},
+        )
+        return {"buckets": len(values), "refreshed_at": refreshed_at}
+
+
+class StatsRefresher:
+    def __init__(
+        self,
+        service: StatsService,
+        interval: float,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> None:
+        self.service = service
+        self.interval = interval
+        self.session_factory = session_factory
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def start(self) -> None:
+        self._thread = Thread(target=self._run, name="stats-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                with self.session_factory() as session:
+                    self.service.refresh(session)
+            except Exception as exc:
+                log_operation(
+                    self.service.logger,
+                    operation="refresh",
+                    entity_type="loan_stats",
+                    status="failed",
+                    details={"error": str(exc)},
+                    level="error",
+                )
+            self._stop.wait(self.interval)
+
+
+_refresher: Optional[StatsRefresher] = None
+_refresher_lock = Lock()
+
+
+def start_stats_refresher(service: Optional[StatsService] = None) -> None:
+    global _refresher
+    if REPORT_STATS_REFRESH_SECONDS <= 0:
+        return
+    with _refresher_lock:
+        if _refresher is None:
+            _refresher = StatsRefresher(
+                service or StatsService(), REPORT_STATS_REFRESH_SECONDS
+            )
+            _refresher.start()
+
+
+def stop_stats_refresher() -> None:
+    global _refresher
+    with _refresher_lock:
+        if _refresher is not None:
+            _refresher.stop()
+            _refresher = None
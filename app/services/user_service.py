@@ -1,16 +1,32 @@
+import uuid
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import insert, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.sql import func
 
 from app.core.constants import CACHE_ENTITY_TTL
 from app.core.errors import EmailAlreadyRegistered, UserNotFound
 from app.models.loan import Loan
+from app.models.loan_status import LoanStatus
 from app.models.user import User
 from app.models.user_event import UserEvent
 from app.models.user_status import UserStatus
-from app.schemas.user import UserCreate, UserUpdate
-from app.utils.cache import clear_cache, get_cache, set_cache
+from app.schemas.user import (
+    UserBulkCreateResponse,
+    UserBulkStatusResponse,
+    UserBulkStatusUpdate,
+    UserCreate,
+    UserResponse,
+    UserUpdate,
+)
+from app.services.event_publisher import add_status_events
+from app.utils.cache import clear_cache, clear_cache_many, get_cache, set_cache
+from app.utils.pagination import paginate
+from app.utils.snapshot import dump_snapshot
+from app.utils.status_registry import get_status_id
 from app.utils.uuid import validate_uuid
 
 
@@ -20,31 +36,92 @@ class UserService:
         if existing_user:
             raise EmailAlreadyRegistered()
 
-        active_status = (
-            session.query(UserStatus).filter(UserStatus.enumerator == "active").first()
-        )
+        active_status_id = get_status_id(session, UserStatus, "active")
 
-        new_user = User(name=user.name, email=user.email, status_id=active_status.id)
+        new_user = User(name=user.name, email=user.email, status_id=active_status_id)
         session.add(new_user)
         session.flush()
 
-        self._create_event(session, new_user.id, None, active_status.id)
+        self._create_event(session, new_user.id, None, active_status_id)
 
         session.commit()
-        session.refresh(new_user)
 
         return new_user
 
-    def get_all(self, session: Session, skip: int = 0, limit: int = 100):
-        return (
-            session.query(User)
-            .options(joinedload(User.status))
-            .offset(skip)
-            .limit(limit)
-            .all()
+    def create_many(
+        self, session: Session, users: list[UserCreate]
+    ) -> UserBulkCreateResponse:
+        active_status_id = get_status_id(session, UserStatus, "active")
+
+        rows = []
+        conflicts = []
+        seen = set()
+        for user in users:
+            if user.email in seen:
+                conflicts.append(user.email)
+                continue
+            seen.add(user.email)
+            rows.append(
+                {
+                    "user_key": uuid.uuid4(),
+                    "name": user.name,
+                    "email": user.email,
+                    "status_id": active_status_id,
+                }
+            )
+
+        try:
+            created = session.scalars(
+                self._insert_skipping_conflicts(session).returning(User), rows
+            ).all()
+            if created:
+                session.execute(
+                    insert(UserEvent),
+                    [
+                        {
+                            "user_id": user.id,
+                            "old_status_id": None,
+                            "new_status_id": active_status_id,
+                            "created_at": datetime.now(),
+                        }
+                        for user in created
+                    ],
+                )
+                add_status_events(
+                    session,
+                    UserEvent,
+                    [(user.user_key, None, active_status_id) for user in created],
+                )
+            response = [UserResponse.model_validate(user) for user in created]
+            session.commit()
+        except Exception as exc:
+            session.rollback()
+            raise exc
+
+        created_emails = {user.email for user in response}
+        conflicts.extend(
+            row["email"] for row in rows if row["email"] not in created_emails
         )
+        return UserBulkCreateResponse(created=response, conflicts=conflicts)
+
+    @staticmethod
+    def _insert_skipping_conflicts(session: Session):
+        dialect = (
+            postgresql if session.get_bind().dialect.name == "postgresql" else sqlite
+        )
+        return dialect.insert(User).on_conflict_do_nothing(index_elements=["email"])
+
+    def get_all(
+        self,
+        session: Session,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ):
+        query = session.query(User).options(joinedload(User.status))
+        return paginate(query, User, User.user_key, skip, limit, cursor)
 
-    def get_by_key(self, session: Session, user_key: str):
+    def get_by_key(self, session: Session, user_key: str) -> bytes | None:
         user_key = validate_uuid(user_key)
         if not user_key:
             return None
@@ -61,10 +138,13 @@ class UserService:
             .first()
         )
 
-        if user:
-            set_cache(cache_key, user, ttl_seconds=CACHE_ENTITY_TTL)
+        if not user:
+            return None
 
-        return user
+        snapshot = dump_snapshot(UserResponse, user)
+        set_cache(cache_key, snapshot, ttl_seconds=CACHE_ENTITY_TTL)
+
+        return snapshot
 
     def _get_for_update(self, session: Session, user_key: str) -> User | None:
         uuid = validate_uuid(user_key)
@@ -88,9 +168,13 @@ class UserService:
             user.email = data.email
 
         session.commit()
-        session.refresh(user)
 
-        set_cache(f"user:{user_key}:details", user, ttl_seconds=CACHE_ENTITY_TTL)
+        set_cache(
+            f"user:{user.user_key}:details",
+            dump_snapshot(UserResponse, user),
+            ttl_seconds=CACHE_ENTITY_TTL,
+            publish=True,
+        )
 
         return user
 
@@ -99,26 +183,75 @@ class UserService:
         if not user:
             return None
 
-        status = (
-            session.query(UserStatus)
-            .filter(UserStatus.enumerator == status_enum)
-            .first()
-        )
-        if not status:
+        status_id = get_status_id(session, UserStatus, status_enum)
+        if not status_id:
             return None
 
         old_status_id = user.status_id
-        user.status_id = status.id
+        user.status = session.get(UserStatus, status_id)
 
-        self._create_event(session, user.id, old_status_id, status.id)
+        self._create_event(session, user.id, old_status_id, status_id)
 
         session.commit()
-        session.refresh(user)
 
-        clear_cache(f"user:{user_key}:details")
+        clear_cache(f"user:{user.user_key}:details")
 
         return user
 
+    def set_status_many(
+        self, session: Session, data: UserBulkStatusUpdate
+    ) -> UserBulkStatusResponse | None:
+        status_id = get_status_id(session, UserStatus, data.status_enum)
+        if not status_id:
+            return None
+
+        try:
+            users = session.execute(
+                select(User.id, User.user_key, User.status_id)
+                .where(User.user_key.in_(set(data.user_keys)))
+                .order_by(User.id)
+                .with_for_update()
+            ).all()
+            changed = [user for user in users if user.status_id != status_id]
+
+            if changed:
+                changed_ids = [user.id for user in changed]
+                session.execute(
+                    insert(UserEvent).from_select(
+                        ["user_id", "old_status_id", "new_status_id", "created_at"],
+                        select(
+                            User.id, User.status_id, literal(status_id), func.now()
+                        ).where(User.id.in_(changed_ids)),
+                    )
+                )
+                session.execute(
+                    update(User)
+                    .where(User.id.in_(changed_ids))
+                    .values(status_id=status_id)
+                    .execution_options(synchronize_session=False)
+                )
+                add_status_events(
+                    session,
+                    UserEvent,
+                    [(user.user_key, user.status_id, status_id) for user in changed],
+                )
+
+            session.commit()
+        except Exception as exc:
+            session.rollback()
+            raise exc
+
+        clear_cache_many([f"user:{user.user_key}:details" for user in changed])
+
+        found = {user.user_key for user in users}
+        return UserBulkStatusResponse(
+            updated=len(changed),
+            unchanged=len(users) - len(changed),
+            not_found=list(
+                dict.fromkeys(key for key in data.user_keys if key not in found)
+            ),
+        )
+
     def _create_event(
         self,
         session: Session,
@@ -141,8 +274,9 @@ class UserService:
         skip: int = 0,
         limit: int = 100,
         status: Optional[str] = None,
+        cursor: Optional[str] = None,
     ):
-        user = self.get_by_key(session, user_key)
+        user = self._get_for_update(session, user_key)
 
         if not user:
             raise UserNotFound()
@@ -154,6 +288,8 @@ class UserService:
         )
 
         if status:
-            query = query.join(Loan.status).filter(Loan.status.has(enumerator=status))
+            query = query.filter(
+                Loan.status_id == get_status_id(session, LoanStatus, status)
+            )
 
-        return query.offset(skip).limit(limit).all()
+        return paginate(query, Loan, Loan.loan_key, skip, limit, cursor)
@@ -1,35 +1,326 @@
+import asyncio
+import heapq
 import time
+import uuid
+from collections import OrderedDict
 from threading import RLock
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-from app.core.constants import CACHE_DEFAULT_TTL, CACHE_MAX_SIZE
+import redis
+from redis.exceptions import RedisError
+from sqlalchemy.util.concurrency import await_only, in_greenlet
 
-_store: dict[str, tuple[float, Any]] = {}
-_lock = RLock()
+from app.core.constants import (
+    CACHE_BACKEND,
+    CACHE_DEFAULT_TTL,
+    CACHE_INVALIDATION_CHANNEL,
+    CACHE_MAX_SIZE,
+    CACHE_NAMESPACE_LIMITS,
+    REDIS_SOCKET_TIMEOUT,
+    REDIS_URL,
+)
+from app.core.logger import get_logger
+from app.core.metrics import (
+    record_cache_eviction,
+    record_cache_hit,
+    record_cache_miss,
+    record_cache_redis_error,
+    record_cache_redis_hit,
+    record_cache_redis_miss,
+    record_cache_size,
+)
 
+logger = get_logger(__name__)
 
-def get_cache(key: str) -> Optional[Any]:
-    now = time.time()
-    with _lock:
-        item = _store.get(key)
-        if not item:
+
+def run_blocking(fn: Callable[..., Any], *args) -> Any:
+    # AsyncSession.run_sync runs services on the event loop; keep socket I/O off it.
+    if in_greenlet():
+        return await_only(asyncio.to_thread(fn, *args))
+    return fn(*args)
+
+
+def _namespace(key: str) -> str:
+    return key.split(":", 1)[0]
+
+
+class Cache:
+    def __init__(
+        self,
+        max_size: int = CACHE_MAX_SIZE,
+        namespace_limits: Optional[dict[str, int]] = None,
+    ) -> None:
+        self.max_size = max_size
+        self.namespace_limits = (
+            CACHE_NAMESPACE_LIMITS if namespace_limits is None else namespace_limits
+        )
+        self._entries: dict[str, OrderedDict[str, tuple[float, Any]]] = {}
+        self._expirations: list[tuple[float, str]] = []
+        self._lock = RLock()
+
+    def get(self, key: str) -> Optional[Any]:
+        namespace = _namespace(key)
+        now = time.time()
+        with self._lock:
+            self._purge_expired(now)
+            entries = self._entries.get(namespace)
+            item = entries.get(key) if entries else None
+            if item is None:
+                record_cache_miss(namespace)
+                return None
+
+            entries.move_to_end(key)
+            record_cache_hit(namespace)
+            return item[1]
+
+    def set(self, key: str, value: Any, ttl_seconds: int = CACHE_DEFAULT_TTL) -> None:
+        namespace = _namespace(key)
+        now = time.time()
+        expires_at = now + ttl_seconds
+        with self._lock:
+            self._purge_expired(now)
+            entries = self._entries.setdefault(namespace, OrderedDict())
+            entries[key] = (expires_at, value)
+            entries.move_to_end(key)
+            heapq.heappush(self._expirations, (expires_at, key))
+
+            limit = self.namespace_limits.get(namespace, self.max_size)
+            while len(entries) > limit:
+                entries.popitem(last=False)
+                record_cache_eviction(namespace, "size")
+
+            if len(self._expirations) > 2 * self._size() + 64:
+                self._compact_expirations()
+
+            record_cache_size(namespace, len(entries))
+
+    def delete(self, key: str) -> None:
+        namespace = _namespace(key)
+        with self._lock:
+            entries = self._entries.get(namespace)
+            if entries and entries.pop(key, None) is not None:
+                record_cache_size(namespace, len(entries))
+
+    def delete_many(self, keys: list[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self.delete(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for namespace in self._entries:
+                record_cache_size(namespace, 0)
+            self._entries.clear()
+            self._expirations.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._size()
+
+    def _size(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def _purge_expired(self, now: float) -> None:
+        while self._expirations and self._expirations[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expirations)
+            namespace = _namespace(key)
+            entries = self._entries.get(namespace)
+            item = entries.get(key) if entries else None
+            # Skip heap entries left behind by a later set() or an eviction.
+            if item is None or item[0] != expires_at:
+                continue
+            del entries[key]
+            record_cache_eviction(namespace, "expired")
+            record_cache_size(namespace, len(entries))
+
+    def _compact_expirations(self) -> None:
+        self._expirations = [
+            (expires_at, key)
+            for entries in self._entries.values()
+            for key, (expires_at, _) in entries.items()
+        ]
+        heapq.heapify(self._expirations)
+
+
+class RedisCache:
+    def __init__(
+        self,
+        client: redis.Redis,
+        local: Optional[Cache] = None,
+        channel: str = CACHE_INVALIDATION_CHANNEL,
+    ) -> None:
+        self.client = client
+        self.local = local or Cache()
+        self.channel = channel
+        self.instance_id = uuid.uuid4().hex
+        self._listener = None
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.local.get(key)
+        if value is not None:
+            return value
+
+        namespace = _namespace(key)
+        try:
+            pipe = self.client.pipeline()
+            pipe.get(key)
+            pipe.pttl(key)
+            value, ttl_ms = self._execute(pipe)
+        except RedisError as exc:
+            self._log_error("get", exc)
             return None
-        expires_at, value = item
-        if expires_at < now:
-            _store.pop(key, None)
+
+        if value is None:
+            record_cache_redis_miss(namespace)
             return None
+
+        record_cache_redis_hit(namespace)
+        ttl_seconds = ttl_ms / 1000 if ttl_ms > 0 else CACHE_DEFAULT_TTL
+        self.local.set(key, value, ttl_seconds)
         return value
 
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int = CACHE_DEFAULT_TTL,
+        publish: bool = False,
+    ) -> None:
+        self.local.set(key, value, ttl_seconds)
+
+        # Only serialized snapshots are shared; anything else stays worker-local.
+        if not isinstance(value, bytes):
+            return
+
+        # Read-through fills must not evict the value other nodes just loaded;
+        # only writes that replace a stale value publish an invalidation.
+        try:
+            pipe = self.client.pipeline()
+            pipe.set(key, value, px=max(int(ttl_seconds * 1000), 1))
+            if publish:
+                pipe.publish(self.channel, f"{self.instance_id}:{key}")
+            self._execute(pipe)
+        except RedisError as exc:
+            self._log_error("set", exc)
 
-def set_cache(key: str, value: Any, ttl_seconds: int = CACHE_DEFAULT_TTL) -> None:
-    expires_at = time.time() + ttl_seconds
-    with _lock:
-        if len(_store) >= CACHE_MAX_SIZE:
-            _store.clear()
+    def delete(self, key: str) -> None:
+        self.local.delete(key)
+        try:
+            pipe = self.client.pipeline()
+            pipe.delete(key)
+            pipe.publish(self.channel, f"{self.instance_id}:{key}")
+            self._execute(pipe)
+        except RedisError as exc:
+            self._log_error("delete", exc)
 
-        _store[key] = (expires_at, value)
+    def delete_many(self, keys: list[str]) -> None:
+        if not keys:
+            return
+        self.local.delete_many(keys)
+        try:
+            pipe = self.client.pipeline()
+            pipe.delete(*keys)
+            for key in keys:
+                pipe.publish(self.channel, f"{self.instance_id}:{key}")
+            self._execute(pipe)
+        except RedisError as exc:
+            self._log_error("delete", exc)
+
+    def clear(self) -> None:
+        self.local.clear()
+
+    @staticmethod
+    def _execute(pipe) -> list:
+        return run_blocking(pipe.execute)
+
+    def start_listener(self) -> None:
+        if self._listener is not None:
+            return
+
+        try:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{self.channel: self.handle_invalidation})
+            self._listener = pubsub.run_in_thread(
+                sleep_time=1.0,
+                daemon=True,
+                exception_handler=self._handle_listener_error,
+            )
+        except RedisError as exc:
+            self._log_error("subscribe", exc)
+
+    def stop_listener(self) -> None:
+        if self._listener is None:
+            return
+
+        self._listener.stop()
+        self._listener = None
+
+    def handle_invalidation(self, message: dict) -> None:
+        data = message.get("data")
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+
+        origin, _, key = str(data).partition(":")
+        if key and origin != self.instance_id:
+            self.local.delete(key)
+
+    def _handle_listener_error(self, exc: Exception, pubsub, thread) -> None:
+        # Invalidations may have been missed while disconnected.
+        self._log_error("subscribe", exc)
+        self.local.clear()
+        time.sleep(1.0)
+
+    def _log_error(self, operation: str, exc: Exception) -> None:
+        record_cache_redis_error(operation)
+        logger.warning(
+            "cache_redis_error", extra={"operation": operation, "details": str(exc)}
+        )
+
+
+def _build_cache() -> Cache | RedisCache:
+    if CACHE_BACKEND == "redis":
+        client = redis.Redis.from_url(
+            REDIS_URL,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+        )
+        return RedisCache(client)
+    return Cache()
+
+
+_cache = _build_cache()
+
+
+def get_cache(key: str) -> Optional[Any]:
+    return _cache.get(key)
+
+
+def set_cache(
+    key: str, value: Any, ttl_seconds: int = CACHE_DEFAULT_TTL, publish: bool = False
+) -> None:
+    if isinstance(_cache, RedisCache):
+        _cache.set(key, value, ttl_seconds, publish=publish)
+    else:
+        _cache.set(key, value, ttl_seconds)
 
 
 def clear_cache(key: str) -> None:
-    with _lock:
-        _store.pop(key, None)
+    _cache.delete(key)
+
+
+def clear_cache_many(keys: list[str]) -> None:
+    _cache.delete_many(keys)
+
+
+def get_redis_client() -> Optional[redis.Redis]:
+    return _cache.client if isinstance(_cache, RedisCache) else None
+
+
+def start_cache_listener() -> None:
+    if isinstance(_cache, RedisCache):
+        _cache.start_listener()
+
+
+def stop_cache_listener() -> None:
+    if isinstance(_cache, RedisCache):
+        _cache.stop_listener()
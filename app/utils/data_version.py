@@ -0,0 +1,101 @@
+from collections import defaultdict
+from threading import Lock
+from typing import Iterable, Optional
+
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.logger import get_logger
+from app.core.metrics import record_cache_redis_error
+from app.utils.cache import get_redis_client, run_blocking
+
+logger = get_logger(__name__)
+
+_versions: dict[str, int] = defaultdict(int)
+_lock = Lock()
+
+
+def _redis_key(table: str) -> str:
+    return f"data_version:{table}"
+
+
+def get_data_versions(tables: Iterable[str]) -> Optional[tuple[int, ...]]:
+    tables = tuple(tables)
+    client = get_redis_client()
+    if client is None:
+        with _lock:
+            return tuple(_versions[table] for table in tables)
+
+    try:
+        values = run_blocking(client.mget, [_redis_key(table) for table in tables])
+    except RedisError as exc:
+        record_cache_redis_error("data_version")
+        logger.warning("data_version_error", extra={"details": str(exc)})
+        return None
+    return tuple(int(value or 0) for value in values)
+
+
+def bump_data_versions(tables: Iterable[str]) -> None:
+    tables = set(tables)
+    if not tables:
+        return
+
+    with _lock:
+        for table in tables:
+            _versions[table] += 1
+
+    client = get_redis_client()
+    if client is None:
+        return
+
+    try:
+        pipe = client.pipeline()
+        for table in tables:
+            pipe.incr(_redis_key(table))
+        run_blocking(pipe.execute)
+    except RedisError as exc:
+        record_cache_redis_error("data_version")
+        logger.warning("data_version_error", extra={"details": str(exc)})
+
+
+def _changed_tables(session: Session) -> set[str]:
+    return session.info.setdefault("changed_tables", set())
+
+
+def mark_changed_tables(session: Session, tables: Iterable[str]) -> None:
+    _changed_tables(session).update(tables)
+
+
+def _track_flush(session: Session, flush_context) -> None:
+    _changed_tables(session).update(
+        instance.__table__.name
+        for instance in (*session.new, *session.dirty, *session.deleted)
+    )
+
+
+def _track_bulk(orm_execute_state) -> None:
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None:
+        _changed_tables(orm_execute_state.session).add(mapper.persist_selectable.name)
+
+
+def _bump_on_commit(session: Session) -> None:
+    bump_data_versions(session.info.pop("changed_tables", ()))
+
+
+def _discard_on_rollback(session: Session, previous_transaction) -> None:
+    session.info.pop("changed_tables", None)
+
+
+event.listen(Session, "after_flush", _track_flush)
+event.listen(Session, "do_orm_execute", _track_bulk)
+event.listen(Session, "after_commit", _bump_on_commit)
+event.listen(Session, "after_soft_rollback", _discard_on_rollback)
@@ -0,0 +1,54 @@
+import base64
+import binascii
+from typing import Any, Optional, Sequence
+from uuid import UUID
+
+from fastapi import Response
+from sqlalchemy import select
+from sqlalchemy.orm import Query
+
+from app.core.errors import InvalidCursor
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(key: UUID) -> str:
+    return base64.urlsafe_b64encode(UUID(str(key)).bytes).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> UUID:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return UUID(bytes=raw)
+    except (binascii.Error, ValueError):
+        raise InvalidCursor()
+
+
+def paginate(
+    query: Query,
+    model,
+    key_column,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> list:
+    query = query.order_by(model.id)
+
+    if cursor:
+        last_id = query.session.execute(
+            select(model.id).where(key_column == decode_cursor(cursor))
+        ).scalar_one_or_none()
+        if last_id is None:
+            raise InvalidCursor()
+        return query.filter(model.id > last_id).limit(limit).all()
+
+    return query.offset(skip).limit(limit).all()
+
+
+def set_next_cursor(
+    response: Response, items: Sequence[Any], limit: int, key_attr: str
+) -> None:
+    if items and len(items) >= limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            getattr(items[-1], key_attr)
+        )
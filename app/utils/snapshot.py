@@ -0,0 +1,12 @@
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+class SnapshotResponse(Response):
+    media_type = "application/json"
+
+
+def dump_snapshot(schema: type[BaseModel], obj: Any) -> bytes:
+    return schema.model_validate(obj).model_dump_json().encode("utf-8")
@@ -0,0 +1,94 @@
+import time
+from threading import RLock
+from typing import Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+
+from app.core.constants import CACHE_STATUS_MISS_RELOAD, CACHE_STATUS_TTL
+from app.models.book_status import BookStatus
+from app.models.loan_status import LoanStatus
+from app.models.reservation_status import ReservationStatus
+from app.models.user_status import UserStatus
+
+STATUS_MODELS = (BookStatus, LoanStatus, ReservationStatus, UserStatus)
+
+_registry: dict[str, tuple[float, float, dict[str, int], dict[int, str]]] = {}
+_lock = RLock()
+
+
+def _load(session: Session, model) -> tuple[dict[str, int], dict[int, str]]:
+    rows = session.execute(select(model.id, model.enumerator)).all()
+    by_enum = {enumerator: status_id for status_id, enumerator in rows}
+    by_id = {status_id: enumerator for status_id, enumerator in rows}
+
+    now = time.time()
+    with _lock:
+        _registry[model.__tablename__] = (now + CACHE_STATUS_TTL, now, by_enum, by_id)
+
+    return by_enum, by_id
+
+
+def _lookup(
+    session: Session, model, force: bool = False
+) -> tuple[dict[str, int], dict[int, str]]:
+    with _lock:
+        entry = _registry.get(model.__tablename__)
+    now = time.time()
+    # Unknown enumerators come from requests; reload for them at most every few seconds.
+    if (
+        entry
+        and entry[0] > now
+        and (not force or now - entry[1] < CACHE_STATUS_MISS_RELOAD)
+    ):
+        return entry[2], entry[3]
+
+    return _load(session, model)
+
+
+def get_status_id(session: Session, model, enumerator: str) -> Optional[int]:
+    by_enum, _ = _lookup(session, model)
+    if enumerator in by_enum:
+        return by_enum[enumerator]
+
+    by_enum, _ = _lookup(session, model, force=True)
+    return by_enum.get(enumerator)
+
+
+def get_status_enumerator(session: Session, model, status_id: int) -> Optional[str]:
+    _, by_id = _lookup(session, model)
+    if status_id in by_id:
+        return by_id[status_id]
+
+    _, by_id = _lookup(session, model, force=True)
+    return by_id.get(status_id)
+
+
+def warm_status_registry(session: Session) -> None:
+    for model in STATUS_MODELS:
+        _load(session, model)
+
+
+def invalidate_status_registry(model=None) -> None:
+    with _lock:
+        if model is None:
+            _registry.clear()
+        else:
+            _registry.pop(model.__tablename__, None)
+
+
+def _invalidate_on_change(mapper, connection, target) -> None:
+    invalidate_status_registry(type(target))
+
+
+def _invalidate_on_update(mapper, connection, target) -> None:
+    # Assigning entity.status dirties the backref collection; only column edits count.
+    session = object_session(target)
+    if session is None or session.is_modified(target, include_collections=False):
+        invalidate_status_registry(type(target))
+
+
+for _model in STATUS_MODELS:
+    event.listen(_model, "after_insert", _invalidate_on_change)
+    event.listen(_model, "after_update", _invalidate_on_update)
+    event.listen(_model, "after_delete", _invalidate_on_change)
@@ -0,0 +1,121 @@
+"""Assert that the hot loan/reservation queries are served by an index.
+
+    DATABASE_URL=postgresql://... python benchmarks/check_indexes.py
+
+On PostgreSQL sequential scans are disabled for the session, so the plan
+falls back to a seq scan only when no usable index exists. On SQLite
+``EXPLAIN QUERY PLAN`` is used instead; pass ``--create-schema`` to build the
+tables from the models first.
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine, func, select, text
+
+from app.db.session import Base
+from app.models import Loan, LoanEvent, Reservation
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+CHECKS = [
+    (
+        "active loans by user (LoanService.create)",
+        select(func.count(Loan.id)).where(
+            Loan.user_id == 1, Loan.status_id == 1, Loan.return_date.is_(None)
+        ),
+        {"ix_loans_active_user_id", "ix_loans_user_id_status_id"},
+    ),
+    (
+        "active loan by book (LoanService.return_book)",
+        select(Loan.id).where(
+            Loan.book_id == 1, Loan.status_id == 1, Loan.return_date.is_(None)
+        ),
+        {"ix_loans_active_book_id", "ix_loans_book_id_status_id"},
+    ),
+    (
+        "overdue loans (LoanService.get_all overdue=true)",
+        select(Loan.id).where(
+            Loan.status_id == 1, Loan.return_date.is_(None), Loan.due_date < NOW
+        ),
+        {"ix_loans_active_due_date", "ix_loans_status_id_id"},
+    ),
+    (
+        "loan history by user (UserService.get_user_loans)",
+        select(Loan.id).where(Loan.user_id == 1).order_by(Loan.id).limit(100),
+        {"ix_loans_user_id_status_id"},
+    ),
+    (
+        "duplicate active reservation (ReservationService.create)",
+        select(Reservation.id).where(
+            Reservation.user_id == 1,
+            Reservation.book_id == 1,
+            Reservation.status_id == 1,
+        ),
+        {"ix_reservations_user_id_book_id_status_id"},
+    ),
+    (
+        "reservations by book",
+        select(Reservation.id).where(
+            Reservation.book_id == 1, Reservation.status_id == 1
+        ),
+        {
+            "ix_reservations_book_id_status_id",
+            "ix_reservations_user_id_book_id_status_id",
+        },
+    ),
+    (
+        "loan events by loan",
+        select(LoanEvent.id).where(LoanEvent.loan_id == 1),
+        {"ix_loan_events_loan_id"},
+    ),
+]
+
+
+def explain(connection, statement) -> str:
+    sql = str(
+        statement.compile(
+            dialect=connection.dialect, compile_kwargs={"literal_binds": True}
+        )
+    )
+    if connection.dialect.name == "sqlite":
+        rows = connection.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+        return "\n".join(str(row[-1]) for row in rows)
+
+    rows = connection.execute(text(f"EXPLAIN {sql}")).all()
+    return "\n".join(row[0] for row in rows)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--create-schema", action="store_true")
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    if args.create_schema:
+        Base.metadata.create_all(engine)
+
+    failures = 0
+    with engine.connect() as connection:
+        if connection.dialect.name == "postgresql":
+            connection.execute(text("SET enable_seqscan = off"))
+
+        for name, statement, expected in CHECKS:
+            plan = explain(connection, statement)
+            used = sorted(index for index in expected if index in plan)
+            if used:
+                print(f"ok    {name}: {', '.join(used)}")
+            else:
+                failures += 1
+                print(f"FAIL  {name}: expected one of {sorted(expected)}")
+                print("      " + plan.replace("\n", "\n      "))
+
+    engine.dispose()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""Compare request throughput of the sync and async database stacks.
+
+Start one API per stack, for example:
+
+    DB_MODE=sync uvicorn app.main:app --workers 1 --port 8000
+    DB_MODE=async uvicorn app.main:app --workers 1 --port 8001
+
+then run:
+
+    python benchmarks/load_test.py \\
+        --target sync=http://localhost:8000 \\
+        --target async=http://localhost:8001
+
+Only GET endpoints are exercised so the rate limiter does not interfere.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+import httpx
+
+DEFAULT_PATHS = ["/books/", "/users/", "/loans/", "/books/{book_key}"]
+
+
+async def _book_keys(client: httpx.AsyncClient) -> list[str]:
+    response = await client.get("/books/", params={"per_page": 100})
+    response.raise_for_status()
+    return [book["book_key"] for book in response.json()]
+
+
+async def run_target(
+    base_url: str, paths: list[str], requests: int, concurrency: int, auth
+) -> dict:
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, auth=auth, limits=limits, timeout=30
+    ) as client:
+        book_keys = await _book_keys(client) or ["00000000-0000-0000-0000-000000000000"]
+        latencies: list[float] = []
+        errors = 0
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for index in range(requests):
+            queue.put_nowait(index)
+
+        async def worker() -> None:
+            nonlocal errors
+            while True:
+                try:
+                    index = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                path = paths[index % len(paths)].format(
+                    book_key=book_keys[index % len(book_keys)]
+                )
+                start = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                    if response.status_code >= 500:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "rps": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--target",
+        action="append",
+        required=True,
+        help="name=base_url, repeat once per deployment",
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--path", action="append", dest="paths")
+    args = parser.parse_args()
+
+    auth = (os.getenv("USER", "admin"), os.getenv("PASSWORD", "password123"))
+    paths = args.paths or DEFAULT_PATHS
+
+    print(
+        f"{'target':<10}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}"
+    )
+    for target in args.target:
+        name, _, base_url = target.partition("=")
+        result = asyncio.run(
+            run_target(base_url, paths, args.requests, args.concurrency, auth)
+        )
+        print(
+            f"{name:<10}{result['rps']:>10.1f}{result['p50_ms']:>10.1f}"
+            f"{result['p95_ms']:>10.1f}{result['p99_ms']:>10.1f}{result['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
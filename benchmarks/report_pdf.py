@@ -0,0 +1,118 @@
+"""Compare PDF report rendering: single table vs page-sized table chunks.
+
+    python benchmarks/report_pdf.py --rows 10000 100000
+
+Renders synthetic loan rows with the legacy one-table document build and with
+the chunked renderer writing to a temp file. --memory adds a second, traced
+pass per mode to report peak Python allocations.
+"""
+
+import argparse
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from reportlab.lib.pagesizes import letter  # noqa: E402
+from reportlab.lib.styles import getSampleStyleSheet  # noqa: E402
+from reportlab.platypus import (  # noqa: E402
+    Paragraph,
+    SimpleDocTemplate,
+    Spacer,
+    Table,
+)
+
+from app.services.report_render import PDF_TABLE_STYLE  # noqa: E402
+from app.services.report_service import LOAN_HEADERS, ReportService  # noqa: E402
+
+
+def generate_rows(count: int):
+    now = datetime.now(timezone.utc)
+    for _ in range(count):
+        yield (
+            uuid.uuid4(),
+            uuid.uuid4(),
+            uuid.uuid4(),
+            "active",
+            now,
+            now + timedelta(days=14),
+            None,
+            0.0,
+        )
+
+
+def single_table(rows: int) -> int:
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        rightMargin=30,
+        leftMargin=30,
+        topMargin=30,
+        bottomMargin=30,
+    )
+    styles = getSampleStyleSheet()
+    table = Table(
+        [LOAN_HEADERS]
+        + [
+            ["" if col is None else str(col) for col in row]
+            for row in generate_rows(rows)
+        ],
+        repeatRows=1,
+    )
+    table.setStyle(PDF_TABLE_STYLE)
+    doc.build(
+        [
+            Paragraph("Loan Report", styles["Title"]),
+            Paragraph("Benchmark", styles["Normal"]),
+            Spacer(1, 12),
+            table,
+        ]
+    )
+    return len(buffer.getvalue())
+
+
+def chunked(rows: int) -> int:
+    with tempfile.TemporaryFile() as output:
+        ReportService()._write_pdf(
+            output, LOAN_HEADERS, generate_rows(rows), "Loan Report", "Benchmark"
+        )
+        return output.tell()
+
+
+def measure(name: str, render, rows: int, trace_memory: bool) -> None:
+    started = time.perf_counter()
+    size = render(rows)
+    elapsed = time.perf_counter() - started
+
+    peak = "-"
+    if trace_memory:
+        tracemalloc.start()
+        render(rows)
+        peak = f"{tracemalloc.get_traced_memory()[1] / 2**20:.1f}MB"
+        tracemalloc.stop()
+
+    print(f"{name:<10}{rows:>10}{elapsed:>10.2f}s{peak:>12}{size / 2**20:>10.1f}MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--skip-single", action="store_true")
+    parser.add_argument("--memory", action="store_true")
+    args = parser.parse_args()
+
+    print(f"{'mode':<10}{'rows':>10}{'time':>11}{'peak':>12}{'size':>12}")
+    for rows in args.rows:
+        if not args.skip_single:
+            measure("single", single_table, rows, args.memory)
+        measure("chunked", chunked, rows, args.memory)
+
+
+if __name__ == "__main__":
+    main()
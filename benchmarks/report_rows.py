@@ -0,0 +1,156 @@
+"""Compare loan export throughput: ORM graph loading vs column projection.
+
+    python benchmarks/report_rows.py --rows 50000
+
+Seeds a throwaway SQLite database (or uses --url with an already populated
+database) and times a full CSV export through both paths.
+"""
+
+import argparse
+import csv
+import io
+import os
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.db.session import Base  # noqa: E402
+from app.models import (  # noqa: E402
+    Book,
+    BookStatus,
+    Loan,
+    LoanStatus,
+    User,
+    UserStatus,
+)
+from app.services.loan_service import LoanService  # noqa: E402
+from app.services.report_service import LOAN_HEADERS, ReportService  # noqa: E402
+
+ORM_COLUMNS = [
+    "loan_key",
+    "user.user_key",
+    "book.book_key",
+    "status.enumerator",
+    "start_date",
+    "due_date",
+    "return_date",
+    "fine_amount",
+]
+
+
+def seed(session: Session, rows: int) -> None:
+    session.add_all(
+        [
+            UserStatus(id=1, enumerator="active", translation="Ativo"),
+            BookStatus(id=1, enumerator="loaned", translation="Emprestado"),
+            LoanStatus(id=1, enumerator="active", translation="Ativo"),
+        ]
+    )
+    session.flush()
+
+    now = datetime.now(timezone.utc)
+    users = max(rows // 10, 1)
+    session.execute(
+        insert(User),
+        [
+            {
+                "id": index,
+                "user_key": uuid.uuid4(),
+                "name": f"User {index}",
+                "email": f"user{index}@example.com",
+                "status_id": 1,
+            }
+            for index in range(1, users + 1)
+        ],
+    )
+    session.execute(
+        insert(Book),
+        [
+            {
+                "id": index,
+                "book_key": uuid.uuid4(),
+                "title": f"Book {index}",
+                "author": "Author",
+                "status_id": 1,
+            }
+            for index in range(1, rows + 1)
+        ],
+    )
+    session.execute(
+        insert(Loan),
+        [
+            {
+                "loan_key": uuid.uuid4(),
+                "user_id": index % users + 1,
+                "book_id": index,
+                "status_id": 1,
+                "start_date": now,
+                "due_date": now + timedelta(days=14),
+                "fine_amount": 0.0,
+            }
+            for index in range(1, rows + 1)
+        ],
+    )
+    session.commit()
+
+
+def orm_export(session: Session) -> int:
+    def cell(obj, path):
+        for attr in path.split("."):
+            obj = getattr(obj, attr, None)
+            if obj is None:
+                return ""
+        return str(obj)
+
+    loans = LoanService().get_all(session, skip=0, limit=None)
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(LOAN_HEADERS)
+    writer.writerows([[cell(loan, path) for path in ORM_COLUMNS] for loan in loans])
+    output.getvalue().encode("utf-8")
+    return len(loans)
+
+
+def projection_export(session: Session) -> int:
+    content, _, _ = ReportService().export_loans(
+        session, skip=0, limit=None, status_filter=None, overdue=False, fmt="csv"
+    )
+    return content.count(b"\n") - 1
+
+
+def measure(engine, name: str, export) -> None:
+    with Session(engine) as session:
+        started = time.perf_counter()
+        rows = export(session)
+        elapsed = time.perf_counter() - started
+    print(f"{name:<12}{rows:>10}{elapsed:>10.2f}s{rows / elapsed:>14,.0f} rows/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--url")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        url = args.url or f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        engine = create_engine(url)
+        if not args.url:
+            Base.metadata.create_all(engine)
+            with Session(engine) as session:
+                seed(session, args.rows)
+
+        print(f"{'path':<12}{'rows':>10}{'time':>11}{'throughput':>14}")
+        measure(engine, "orm", orm_export)
+        measure(engine, "projection", projection_export)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.api.routers import users as sync_users
+from app.api.routers.aio import books, loans, reservations, users
+from app.db.async_session import (
+    get_async_read_session,
+    get_async_session,
+    to_async_url,
+)
+from app.db.session import Base
+from app.models import BookStatus, LoanStatus, ReservationStatus, UserStatus
+from app.utils.status_registry import invalidate_status_registry
+
+
+@pytest.fixture(name="async_client")
+def async_client_fixture(tmp_path):
+    url = f"sqlite:///{tmp_path / 'library.db'}"
+    sync_engine = create_engine(url)
+    Base.metadata.create_all(bind=sync_engine)
+    with sessionmaker(bind=sync_engine)() as db:
+        db.add_all(
+            [
+                UserStatus(enumerator="active", translation="Ativo"),
+                UserStatus(enumerator="suspended", translation="Suspenso"),
+                BookStatus(enumerator="available", translation="Disponível"),
+                BookStatus(enumerator="loaned", translation="Emprestado"),
+                LoanStatus(enumerator="active", translation="Ativo"),
+                LoanStatus(enumerator="returned", translation="Devolvido"),
+                ReservationStatus(enumerator="active", translation="Ativa"),
+            ]
+        )
+        db.commit()
+    invalidate_status_registry()
+
+    async_engine = create_async_engine(to_async_url(url), poolclass=NullPool)
+    AsyncTestingSession = async_sessionmaker(bind=async_engine, autoflush=False)
+
+    async def override_get_async_session():
+        async with AsyncTestingSession() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(users.router, prefix="/users")
+    app.include_router(books.router, prefix="/books")
+    app.include_router(loans.router, prefix="/loans")
+    app.include_router(reservations.router, prefix="/reservations")
+    # Mounted after the async routers, as app.main does in DB_MODE=async.
+    app.include_router(sync_users.router, prefix="/users")
+    app.dependency_overrides[get_async_session] = override_get_async_session
+    app.dependency_overrides[get_async_read_session] = override_get_async_session
+
+    with TestClient(app) as client:
+        yield client
+
+    invalidate_status_registry()
+    sync_engine.dispose()
+
+
+def test_to_async_url_maps_drivers():
+    assert to_async_url("postgresql://u:p@db:5432/lib") == (
+        "postgresql+asyncpg://u:p@db:5432/lib"
+    )
+    assert to_async_url("sqlite:///:memory:") == "sqlite+aiosqlite:///:memory:"
+
+
+def test_async_checkout_flow(async_client):
+    user = async_client.post(
+        "/users/", json={"name": "Async User", "email": "async@example.com"}
+    ).json()
+    book = async_client.post(
+        "/books/", json={"title": "Async Book", "author": "Author"}
+    ).json()
+
+    loan_response = async_client.post(
+        "/loans/", json={"user_key": user["user_key"], "book_key": book["book_key"]}
+    )
+    assert loan_response.status_code == 201
+    loan = loan_response.json()
+    assert loan["status"]["enumerator"] == "active"
+    assert len(loan["events"]) == 1
+
+    book_response = async_client.get(f"/books/{book['book_key']}")
+    assert book_response.status_code == 200
+    assert book_response.json()["status"]["enumerator"] == "loaned"
+
+    returned = async_client.post("/loans/return", json={"book_key": book["book_key"]})
+    assert returned.status_code == 200
+    assert returned.json()["status"]["enumerator"] == "returned"
+
+    user_loans = async_client.get(f"/users/{user['user_key']}/loans")
+    assert [item["loan_key"] for item in user_loans.json()] == [loan["loan_key"]]
+
+
+def test_async_errors_propagate(async_client):
+    book = async_client.post(
+        "/books/", json={"title": "Async Book", "author": "Author"}
+    ).json()
+
+    response = async_client.post("/loans/return", json={"book_key": book["book_key"]})
+
+    assert response.status_code == 404
+    assert response.json()["detail"]["code"] == "LBS007"
+
+
+def test_async_bulk_user_endpoints(async_client):
+    created = async_client.post(
+        "/users/batch",
+        json={
+            "users": [
+                {"name": "A", "email": "a@example.com"},
+                {"name": "B", "email": "b@example.com"},
+            ]
+        },
+    )
+    assert created.status_code == 200
+    keys = [user["user_key"] for user in created.json()["created"]]
+    assert len(keys) == 2
+
+    response = async_client.post(
+        "/users/batch/status",
+        json={"user_keys": keys, "status_enum": "suspended"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["updated"] == 2
+    for key in keys:
+        user = async_client.get(f"/users/{key}").json()
+        assert user["status"]["enumerator"] == "suspended"
@@ -104,3 +104,40 @@ def test_get_genres(client):
     assert response.status_code == 200
     genres = response.json()
     assert set([genre.lower() for genre in genres]).issuperset({"drama", "horror"})
+
+
+def test_get_books_cursor_pagination(client):
+    titles = [f"Book {index}" for index in range(5)]
+    for title in titles:
+        client.post("/books/", json={"title": title, "author": "Author"})
+
+    first_page = client.get("/books/", params={"per_page": 2})
+    cursor = first_page.headers["X-Next-Cursor"]
+
+    second_page = client.get("/books/", params={"per_page": 2, "cursor": cursor})
+    last_page = client.get(
+        "/books/",
+        params={"per_page": 2, "cursor": second_page.headers["X-Next-Cursor"]},
+    )
+
+    pages = [first_page.json(), second_page.json(), last_page.json()]
+    assert [[book["title"] for book in page] for page in pages] == [
+        titles[0:2],
+        titles[2:4],
+        titles[4:],
+    ]
+    assert "X-Next-Cursor" not in last_page.headers
+
+
+def test_get_books_invalid_cursor(client):
+    response = client.get("/books/", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == "LBS019"
+
+
+def test_get_books_unknown_cursor(client):
+    response = client.get("/books/", params={"cursor": "AAAAAAAAAAAAAAAAAAAAAA"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == "LBS019"
@@ -0,0 +1,61 @@
+from app.utils import cache as cache_module
+from app.utils.cache import Cache
+
+
+def test_lru_eviction_is_per_namespace():
+    cache = Cache(max_size=10, namespace_limits={"book": 2})
+
+    cache.set("book:1:details", "b1")
+    cache.set("book:2:details", "b2")
+    cache.set("user:1:details", "u1")
+
+    assert cache.get("book:1:details") == "b1"
+
+    cache.set("book:3:details", "b3")
+
+    assert cache.get("book:2:details") is None
+    assert cache.get("book:1:details") == "b1"
+    assert cache.get("book:3:details") == "b3"
+    assert cache.get("user:1:details") == "u1"
+
+
+def test_expired_entries_are_purged_without_being_read(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = Cache()
+
+    cache.set("loan:1:details", "l1", ttl_seconds=10)
+    cache.set("loan:2:details", "l2", ttl_seconds=60)
+    assert len(cache) == 2
+
+    now[0] += 30
+    cache.set("user:1:details", "u1", ttl_seconds=60)
+
+    assert len(cache) == 2
+    assert cache.get("loan:1:details") is None
+    assert cache.get("loan:2:details") == "l2"
+
+
+def test_overwriting_key_keeps_latest_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = Cache()
+
+    cache.set("book:1:details", "old", ttl_seconds=10)
+    cache.set("book:1:details", "new", ttl_seconds=60)
+
+    now[0] += 30
+    assert cache.get("book:1:details") == "new"
+
+
+def test_cache_counters_exported(client):
+    cache_module.set_cache("reservation:metrics:details", "value")
+    cache_module.get_cache("reservation:metrics:details")
+    cache_module.get_cache("reservation:missing:details")
+    cache_module.clear_cache("reservation:metrics:details")
+
+    body = client.get("/metrics").text
+
+    assert 'cache_hits_total{namespace="reservation"}' in body
+    assert 'cache_misses_total{namespace="reservation"}' in body
+    assert "cache_entries" in body
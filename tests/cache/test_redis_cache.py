@@ -0,0 +1,147 @@
+import asyncio
+import threading
+import time
+
+import fakeredis
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.util.concurrency import greenlet_spawn
+
+from app.utils.cache import Cache, RedisCache
+
+
+@pytest.fixture
+def redis_server():
+    return fakeredis.FakeServer()
+
+
+def _worker(server):
+    return RedisCache(fakeredis.FakeRedis(server=server))
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def test_second_worker_reads_through_redis(redis_server):
+    first, second = _worker(redis_server), _worker(redis_server)
+
+    first.set("book:1:details", b'{"title":"A"}', ttl_seconds=60)
+
+    assert second.local.get("book:1:details") is None
+    assert second.get("book:1:details") == b'{"title":"A"}'
+    assert second.local.get("book:1:details") == b'{"title":"A"}'
+
+
+def test_non_snapshot_values_stay_local(redis_server):
+    first, second = _worker(redis_server), _worker(redis_server)
+
+    first.set("book:1:details", {"title": "A"})
+
+    assert first.get("book:1:details") == {"title": "A"}
+    assert second.get("book:1:details") is None
+
+
+def test_delete_is_broadcast_to_other_workers(redis_server):
+    first, second = _worker(redis_server), _worker(redis_server)
+    second.start_listener()
+    try:
+        first.set("book:1:details", b"v1", ttl_seconds=60)
+        assert second.get("book:1:details") == b"v1"
+
+        first.delete("book:1:details")
+
+        assert _wait_for(lambda: second.local.get("book:1:details") is None)
+        assert second.get("book:1:details") is None
+    finally:
+        second.stop_listener()
+
+
+def test_delete_many_is_broadcast_to_other_workers(redis_server):
+    first, second = _worker(redis_server), _worker(redis_server)
+    second.start_listener()
+    keys = [f"user:{index}:details" for index in range(3)]
+    try:
+        for key in keys:
+            first.set(key, b"v1", ttl_seconds=60)
+            assert second.get(key) == b"v1"
+
+        first.delete_many(keys)
+
+        assert _wait_for(lambda: all(second.local.get(key) is None for key in keys))
+        assert all(first.client.get(key) is None for key in keys)
+    finally:
+        second.stop_listener()
+
+
+def test_own_invalidations_are_ignored(redis_server):
+    worker = _worker(redis_server)
+    worker.local.set("book:1:details", b"v1")
+
+    worker.handle_invalidation({"data": f"{worker.instance_id}:book:1:details"})
+    assert worker.local.get("book:1:details") == b"v1"
+
+    worker.handle_invalidation({"data": b"other:book:1:details"})
+    assert worker.local.get("book:1:details") is None
+
+
+def test_redis_outage_falls_back_to_local_cache():
+    class BrokenRedis(fakeredis.FakeRedis):
+        def pipeline(self, *args, **kwargs):
+            raise RedisConnectionError("down")
+
+    worker = RedisCache(BrokenRedis(), local=Cache())
+
+    worker.set("user:1:details", b"v1", ttl_seconds=60)
+
+    assert worker.get("user:1:details") == b"v1"
+    assert worker.get("user:2:details") is None
+
+
+def test_only_write_fills_are_broadcast(redis_server):
+    first, second = _worker(redis_server), _worker(redis_server)
+    second.start_listener()
+    try:
+        second.set("book:1:details", b"v1", ttl_seconds=60)
+
+        first.set("book:1:details", b"v1", ttl_seconds=60)
+        time.sleep(0.2)
+        assert second.local.get("book:1:details") == b"v1"
+
+        first.set("book:1:details", b"v2", ttl_seconds=60, publish=True)
+        assert _wait_for(lambda: second.local.get("book:1:details") is None)
+        assert second.get("book:1:details") == b"v2"
+    finally:
+        second.stop_listener()
+
+
+def test_async_callers_do_redis_io_off_the_event_loop(redis_server):
+    threads = []
+
+    class RecordingRedis(fakeredis.FakeRedis):
+        def pipeline(self, *args, **kwargs):
+            pipe = super().pipeline(*args, **kwargs)
+            execute = pipe.execute
+
+            def record(*args, **kwargs):
+                threads.append(threading.get_ident())
+                return execute(*args, **kwargs)
+
+            pipe.execute = record
+            return pipe
+
+    worker = RedisCache(RecordingRedis(server=redis_server))
+
+    async def run():
+        await greenlet_spawn(worker.set, "book:1:details", b"v1", 60)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+
+    assert threads and loop_thread not in threads
+    assert worker.client.get("book:1:details") == b"v1"
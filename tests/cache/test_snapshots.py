@@ -0,0 +1,42 @@
+from sqlalchemy import event
+
+from app.utils.cache import get_cache
+
+
+def test_cached_book_is_served_without_queries(client, session, created_book):
+    book_key = created_book["book_key"]
+    first = client.get(f"/books/{book_key}")
+    assert first.status_code == 200
+
+    cached = get_cache(f"book:{book_key}:details")
+    assert isinstance(cached, bytes)
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    bind = session.get_bind()
+    event.listen(bind, "before_cursor_execute", before_cursor_execute)
+    try:
+        second = client.get(f"/books/{book_key}")
+    finally:
+        event.remove(bind, "before_cursor_execute", before_cursor_execute)
+
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert statements == []
+
+
+def test_loan_snapshot_invalidated_on_return(client, created_loan):
+    loan_key = created_loan["loan_key"]
+    assert client.get(f"/loans/{loan_key}").json()["status"]["enumerator"] == "active"
+
+    response = client.post(
+        "/loans/return", json={"book_key": created_loan["book"]["book_key"]}
+    )
+    assert response.status_code == 200
+
+    loan = client.get(f"/loans/{loan_key}").json()
+    assert loan["status"]["enumerator"] == "returned"
+    assert loan["book"]["status"]["enumerator"] == "available"
@@ -0,0 +1,76 @@
+from sqlalchemy import event
+
+from app.models import BookStatus, LoanStatus
+from app.utils import status_registry
+from app.utils.status_registry import (
+    get_status_enumerator,
+    get_status_id,
+    warm_status_registry,
+)
+
+
+def _count_queries(session):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(session.get_bind(), "before_cursor_execute", before_cursor_execute)
+    return statements, lambda: event.remove(
+        session.get_bind(), "before_cursor_execute", before_cursor_execute
+    )
+
+
+def test_status_lookup_both_directions(session):
+    available_id = get_status_id(session, BookStatus, "available")
+
+    assert available_id is not None
+    assert get_status_enumerator(session, BookStatus, available_id) == "available"
+    assert get_status_id(session, BookStatus, "unknown") is None
+
+
+def test_warm_registry_avoids_queries(session):
+    warm_status_registry(session)
+    statements, stop = _count_queries(session)
+
+    try:
+        get_status_id(session, LoanStatus, "active")
+        get_status_id(session, LoanStatus, "returned")
+        get_status_id(session, BookStatus, "loaned")
+    finally:
+        stop()
+
+    assert statements == []
+
+
+def test_registry_invalidated_when_table_changes(session):
+    warm_status_registry(session)
+    assert get_status_id(session, BookStatus, "unavailable") is None
+
+    session.add(BookStatus(enumerator="unavailable", translation="Indisponível"))
+    session.commit()
+
+    statements, stop = _count_queries(session)
+    try:
+        assert get_status_id(session, BookStatus, "unavailable") is not None
+    finally:
+        stop()
+
+    assert len(statements) == 1
+
+
+def test_unknown_enumerators_reload_at_most_once_per_interval(session, monkeypatch):
+    warm_status_registry(session)
+    statements, stop = _count_queries(session)
+
+    try:
+        for _ in range(3):
+            assert get_status_id(session, BookStatus, "bogus") is None
+        assert statements == []
+
+        monkeypatch.setattr(status_registry, "CACHE_STATUS_MISS_RELOAD", 0)
+        assert get_status_id(session, BookStatus, "bogus") is None
+    finally:
+        stop()
+
+    assert len(statements) == 1
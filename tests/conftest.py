@@ -1,4 +1,5 @@
 import base64
+import importlib
 import os
 
 import pytest
@@ -7,7 +8,8 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from app.db.session import Base, get_session
+from app.core.rate_limiter import MemoryRateLimiter
+from app.db.session import Base, get_read_session, get_session
 from app.main import app
 from app.models import (
     Book,
@@ -18,6 +20,7 @@ from app.models import (
     User,
     UserStatus,
 )
+from app.utils.status_registry import invalidate_status_registry
 
 os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -28,7 +31,9 @@ engine = create_engine(
     poolclass=StaticPool,
 )
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 AUTH_USERNAME = "admin"
 AUTH_PASSWORD = "password123"
@@ -40,6 +45,7 @@ AUTH_HEADER = {
 @pytest.fixture(name="session")
 def session_fixture():
     Base.metadata.create_all(bind=engine)
+    invalidate_status_registry()
     db = TestingSessionLocal()
 
     db.add_all(
@@ -65,7 +71,10 @@ def session_fixture():
 
 
 @pytest.fixture(name="client")
-def client_fixture(session):
+def client_fixture(session, monkeypatch):
+    rate_limit_module = importlib.import_module("app.core.middlewares.rate_limit")
+    monkeypatch.setattr(rate_limit_module, "limiter", MemoryRateLimiter())
+
     def override_get_session():
         try:
             yield session
@@ -73,6 +82,7 @@ def client_fixture(session):
             session.close()
 
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_read_session] = override_get_session
     client = TestClient(app)
 
     client.headers.update(AUTH_HEADER)
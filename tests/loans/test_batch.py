@@ -0,0 +1,105 @@
+import uuid
+
+from app.models import LoanEvent
+from tests.utils.setup_tools import mark_loan_overdue
+
+
+def _create_books(client, count):
+    return [
+        client.post(
+            "/books/", json={"title": f"Batch Book {index}", "author": "Author"}
+        ).json()["book_key"]
+        for index in range(count)
+    ]
+
+
+def test_batch_checkout(client, session, created_user):
+    book_keys = _create_books(client, 2)
+
+    response = client.post(
+        "/loans/batch",
+        json={"user_key": created_user["user_key"], "book_keys": book_keys},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["succeeded"] == 2
+    assert data["failed"] == 0
+    assert [item["book_key"] for item in data["items"]] == book_keys
+    for item in data["items"]:
+        assert item["status"] == "created"
+        assert item["loan"]["book"]["status"]["enumerator"] == "loaned"
+        assert item["loan"]["status"]["enumerator"] == "active"
+        assert len(item["loan"]["events"]) == 1
+    assert session.query(LoanEvent).count() == 2
+
+
+def test_batch_checkout_reports_item_failures(client, created_user):
+    book_keys = _create_books(client, 4)
+    missing_key = str(uuid.uuid4())
+
+    response = client.post(
+        "/loans/batch",
+        json={
+            "user_key": created_user["user_key"],
+            "book_keys": [book_keys[0], missing_key, book_keys[0], *book_keys[1:]],
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["succeeded"] == 3
+    assert data["failed"] == 3
+    statuses = [
+        (item["status"], (item["error"] or {}).get("code")) for item in data["items"]
+    ]
+    assert statuses == [
+        ("created", None),
+        ("failed", "LBS001"),
+        ("failed", "LBS004"),
+        ("created", None),
+        ("created", None),
+        ("failed", "LBS006"),
+    ]
+
+
+def test_batch_checkout_unknown_user(client, created_user, created_book):
+    response = client.post(
+        "/loans/batch",
+        json={"user_key": str(uuid.uuid4()), "book_keys": [created_book["book_key"]]},
+    )
+
+    assert response.status_code == 404
+    assert response.json()["detail"]["code"] == "LBS002"
+
+
+def test_batch_checkout_requires_books(client, created_user):
+    response = client.post(
+        "/loans/batch", json={"user_key": created_user["user_key"], "book_keys": []}
+    )
+
+    assert response.status_code == 422
+
+
+def test_batch_return(client, session, created_user):
+    book_keys = _create_books(client, 3)
+    loans = client.post(
+        "/loans/batch",
+        json={"user_key": created_user["user_key"], "book_keys": book_keys[:2]},
+    ).json()["items"]
+    mark_loan_overdue(session, loans[0]["loan"]["loan_key"], days=3)
+
+    response = client.post("/loans/return/batch", json={"book_keys": book_keys})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["succeeded"] == 2
+    assert data["failed"] == 1
+    first, second, third = data["items"]
+    assert first["loan"]["status"]["enumerator"] == "returned"
+    assert first["loan"]["fine_amount"] == 6.0
+    assert first["loan"]["book"]["status"]["enumerator"] == "available"
+    assert second["loan"]["fine_amount"] == 0.0
+    assert third["status"] == "failed"
+    assert third["error"]["code"] == "LBS007"
+    assert session.query(LoanEvent).count() == 4
@@ -0,0 +1,137 @@
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, false, literal, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+from app.core.constants import LOAN_MAX_ACTIVE_LOANS
+from app.db.session import Base
+from app.models import Book, BookStatus, Loan, LoanStatus, User, UserStatus
+from app.schemas.loan import LoanCreate
+from app.services import loan_service
+from app.services.loan_service import LoanService
+from app.utils.status_registry import invalidate_status_registry
+
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+
+def test_checkout_statement_is_single_cte(session):
+    now = datetime.now(timezone.utc)
+    statement = LoanService()._checkout_statement(
+        session,
+        LoanCreate(user_key=uuid.uuid4(), book_key=uuid.uuid4()),
+        uuid.uuid4(),
+        now,
+        now + timedelta(days=14),
+    )
+
+    sql = " ".join(str(statement.compile(dialect=postgresql.dialect())).split())
+
+    assert sql.startswith("WITH borrower AS")
+    assert "claimed AS (UPDATE books SET status_id=" in sql
+    assert "FROM borrower WHERE books.book_key =" in sql
+    assert "RETURNING books.id, books.title" in sql
+    assert "new_loan AS (INSERT INTO loans" in sql
+    assert "new_event AS (INSERT INTO loan_events" in sql
+
+
+def test_fast_checkout_miss_falls_back_to_validation(
+    client, monkeypatch, created_user, created_loan
+):
+    calls = []
+
+    def no_match(self, *args):
+        calls.append(args)
+        return select(literal(1)).where(false())
+
+    monkeypatch.setattr(
+        LoanService, "_fast_checkout_available", staticmethod(lambda session: True)
+    )
+    monkeypatch.setattr(LoanService, "_checkout_statement", no_match)
+
+    response = client.post(
+        "/loans/",
+        json={
+            "user_key": created_user["user_key"],
+            "book_key": created_loan["book"]["book_key"],
+        },
+    )
+
+    assert len(calls) == 1
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == "LBS004"
+
+
+@pytest.fixture(name="pg_session")
+def pg_session_fixture(monkeypatch):
+    if not TEST_POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    monkeypatch.setattr(loan_service, "LOAN_FAST_CHECKOUT", True)
+    engine = create_engine(TEST_POSTGRES_URL)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    invalidate_status_registry()
+    db = sessionmaker(bind=engine, expire_on_commit=False)()
+    db.add_all(
+        [
+            UserStatus(enumerator="active", translation="Ativo"),
+            BookStatus(enumerator="available", translation="Disponível"),
+            BookStatus(enumerator="loaned", translation="Emprestado"),
+            LoanStatus(enumerator="active", translation="Ativo"),
+            LoanStatus(enumerator="returned", translation="Devolvido"),
+        ]
+    )
+    db.commit()
+
+    yield db
+
+    db.close()
+    Base.metadata.drop_all(bind=engine)
+    invalidate_status_registry()
+    engine.dispose()
+
+
+def _pg_seed(session, books, email="ana@example.com"):
+    active_user = session.query(UserStatus).filter_by(enumerator="active").one()
+    available = session.query(BookStatus).filter_by(enumerator="available").one()
+    user = User(name="Ana", email=email, status=active_user)
+    items = [
+        Book(title=f"Book {index}", author="Author", status=available)
+        for index in range(books)
+    ]
+    session.add_all([user, *items])
+    session.commit()
+    return user, items
+
+
+def test_pg_fast_checkout_creates_loan(pg_session):
+    user, (book,) = _pg_seed(pg_session, 1)
+
+    loan = LoanService()._create_fast(
+        pg_session, LoanCreate(user_key=user.user_key, book_key=book.book_key)
+    )
+
+    assert loan is not None
+    assert loan.status.enumerator == "active"
+    assert loan.book.status.enumerator == "loaned"
+    assert [event.new_status.enumerator for event in loan.events] == ["active"]
+
+
+def test_pg_fast_checkout_misses(pg_session):
+    user, books = _pg_seed(pg_session, LOAN_MAX_ACTIVE_LOANS + 1)
+    service = LoanService()
+
+    for book in books[:LOAN_MAX_ACTIVE_LOANS]:
+        assert service._create_fast(
+            pg_session, LoanCreate(user_key=user.user_key, book_key=book.book_key)
+        )
+
+    other_user, _ = _pg_seed(pg_session, 0, email="bia@example.com")
+    over_limit = LoanCreate(user_key=user.user_key, book_key=books[-1].book_key)
+    unavailable = LoanCreate(user_key=other_user.user_key, book_key=books[0].book_key)
+    assert service._create_fast(pg_session, over_limit) is None
+    assert service._create_fast(pg_session, unavailable) is None
+    assert pg_session.query(Loan).count() == LOAN_MAX_ACTIVE_LOANS
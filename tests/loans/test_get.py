@@ -71,3 +71,20 @@ def test_get_loans_filter_status_and_overdue(client, session, created_user):
     assert reponse_overdue.status_code == 200
     overdue_list = reponse_overdue.json()
     assert any(loan["book"]["book_key"] == book3_key for loan in overdue_list)
+
+
+def test_get_user_loans_cursor_pagination(client, created_user):
+    user_key = created_user["user_key"]
+    loan_keys = [
+        create_loan(client, user_key, f"Book {index}", "Author")[0]["loan_key"]
+        for index in range(3)
+    ]
+
+    first_page = client.get(f"/users/{user_key}/loans", params={"per_page": 2})
+    second_page = client.get(
+        f"/users/{user_key}/loans",
+        params={"per_page": 2, "cursor": first_page.headers["X-Next-Cursor"]},
+    )
+
+    assert [loan["loan_key"] for loan in first_page.json()] == loan_keys[:2]
+    assert [loan["loan_key"] for loan in second_page.json()] == loan_keys[2:]
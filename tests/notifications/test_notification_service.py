@@ -1,70 +1,73 @@
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
+from app.core.constants import NOTIFY_TIMEOUT
+from app.models import NotificationOutbox
+from app.services.notification_dispatcher import NotificationDispatcher
 from app.services.notification_service import NotificationService
+from tests.conftest import TestingSessionLocal
 
 
-def test_notify_skips_when_no_webhook(monkeypatch):
+def _enqueue(session, due_date=datetime(2026, 1, 1)):
+    message = NotificationService().enqueue_due_date(
+        session,
+        user_email="u@test.com",
+        loan_key="lk",
+        book_title="Book",
+        due_date=due_date,
+    )
+    session.commit()
+    return message
+
+
+def _dispatcher(webhook, http):
+    return NotificationDispatcher(
+        webhook, session_factory=TestingSessionLocal, http=http
+    )
+
+
+def test_notify_skips_when_no_webhook(session, monkeypatch):
     monkeypatch.delenv("NOTIFY_WEBHOOK_URL", raising=False)
-    service = NotificationService()
-    with patch("app.services.notification_service.requests.post") as mock_post:
-        service.notify_due_date(
-            user_email="u@test.com",
-            loan_key="lk",
-            book_title="Book",
-            due_date=datetime(2026, 1, 1),
-        )
-    mock_post.assert_not_called()
-
-
-def test_notify_calls_webhook(monkeypatch):
+
+    assert _enqueue(session) is None
+    assert session.query(NotificationOutbox).count() == 0
+
+
+def test_notify_calls_webhook(session, monkeypatch):
     webhook = "https://example.com/hook"
     monkeypatch.setenv("NOTIFY_WEBHOOK_URL", webhook)
-    service = NotificationService()
-
-    with patch("app.services.notification_service.requests.post") as mock_post:
-        mock_resp = MagicMock()
-        mock_resp.raise_for_status.return_value = None
-        mock_post.return_value = mock_resp
-
-        service.notify_due_date(
-            user_email="u@test.com",
-            loan_key="lk",
-            book_title="Book",
-            due_date=datetime(2026, 1, 1),
-        )
-
-        mock_post.assert_called_once()
-        args, kwargs = mock_post.call_args
-        assert args[0] == webhook
-        assert kwargs["json"]["type"] == "loan_due_date"
-        assert kwargs["json"]["user_email"] == "u@test.com"
-        assert kwargs["json"]["loan_key"] == "lk"
-        assert kwargs["json"]["book_title"] == "Book"
-        assert kwargs["json"]["due_date"].startswith("2026-01-01")
-        assert kwargs["timeout"] == 3
-
-
-def test_notify_best_effort_on_failure(monkeypatch, caplog):
+    message = _enqueue(session)
+    http = MagicMock()
+    http.post.return_value.raise_for_status.return_value = None
+
+    assert _dispatcher(webhook, http).dispatch_once() == 1
+
+    http.post.assert_called_once()
+    args, kwargs = http.post.call_args
+    assert args[0] == webhook
+    assert kwargs["json"]["type"] == "loan_due_date"
+    assert kwargs["json"]["user_email"] == "u@test.com"
+    assert kwargs["json"]["loan_key"] == "lk"
+    assert kwargs["json"]["book_title"] == "Book"
+    assert kwargs["json"]["due_date"].startswith("2026-01-01")
+    assert kwargs["headers"]["Idempotency-Key"] == str(message.event_key)
+    assert kwargs["timeout"] == NOTIFY_TIMEOUT
+    session.refresh(message)
+    assert message.status == "sent"
+
+
+def test_notify_best_effort_on_failure(session, monkeypatch):
     webhook = "https://example.com/hook"
     monkeypatch.setenv("NOTIFY_WEBHOOK_URL", webhook)
-    service = NotificationService()
-
-    with patch("app.services.notification_service.requests.post") as mock_post:
-        mock_resp = MagicMock()
-        mock_resp.raise_for_status.side_effect = Exception("boom")
-        mock_post.return_value = mock_resp
-
-        service.notify_due_date(
-            user_email="u@test.com",
-            loan_key="lk",
-            book_title="Book",
-            due_date=None,
-        )
-
-        mock_post.assert_called_once()
-        assert not caplog.records or caplog.records[-1].levelname in {
-            "WARNING",
-            "INFO",
-            "ERROR",
-        }
+    message = _enqueue(session, due_date=None)
+    http = MagicMock()
+    http.post.return_value.raise_for_status.side_effect = Exception("boom")
+
+    assert _dispatcher(webhook, http).dispatch_once() == 1
+
+    http.post.assert_called_once()
+    assert http.post.call_args.kwargs["json"]["due_date"] is None
+    session.refresh(message)
+    assert message.status == "pending"
+    assert message.attempts == 1
+    assert message.last_error == "boom"
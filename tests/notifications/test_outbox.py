@@ -0,0 +1,190 @@
+import json
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+
+import pytest
+
+from app.models import NotificationOutbox
+from app.services.notification_dispatcher import NotificationDispatcher
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture(name="webhook")
+def webhook_fixture():
+    received = []
+    responses = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received.append(
+                {
+                    "payload": json.loads(body),
+                    "idempotency_key": self.headers["Idempotency-Key"],
+                    "client_port": self.client_address[1],
+                }
+            )
+            code = responses.pop(0) if responses else 200
+            self.send_response(code)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.received = received
+    server.responses = responses
+    server.url = f"http://127.0.0.1:{server.server_port}/hook"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _dispatcher(webhook, **kwargs):
+    return NotificationDispatcher(
+        webhook.url, session_factory=TestingSessionLocal, **kwargs
+    )
+
+
+def test_loan_enqueues_notification(client, session, monkeypatch, created_user):
+    monkeypatch.setenv("NOTIFY_WEBHOOK_URL", "http://127.0.0.1:9/hook")
+    book = client.post("/books/", json={"title": "Dune", "author": "Herbert"}).json()
+
+    loan = client.post(
+        "/loans/",
+        json={"user_key": created_user["user_key"], "book_key": book["book_key"]},
+    ).json()
+
+    (message,) = session.query(NotificationOutbox).all()
+    assert message.status == "pending"
+    assert message.payload["loan_key"] == loan["loan_key"]
+    assert message.payload["book_title"] == "Dune"
+
+
+def test_loan_without_webhook_skips_outbox(client, session, monkeypatch, created_loan):
+    monkeypatch.delenv("NOTIFY_WEBHOOK_URL", raising=False)
+
+    assert session.query(NotificationOutbox).count() == 0
+
+
+def test_dispatcher_delivers_batch(client, session, monkeypatch, webhook, created_user):
+    monkeypatch.setenv("NOTIFY_WEBHOOK_URL", webhook.url)
+    for index in range(3):
+        book = client.post(
+            "/books/", json={"title": f"Book {index}", "author": "Author"}
+        ).json()
+        client.post(
+            "/loans/",
+            json={"user_key": created_user["user_key"], "book_key": book["book_key"]},
+        )
+    assert webhook.received == []
+
+    dispatcher = _dispatcher(webhook)
+    assert dispatcher.dispatch_once() == 3
+
+    assert [item["payload"]["book_title"] for item in webhook.received] == [
+        "Book 0",
+        "Book 1",
+        "Book 2",
+    ]
+    assert len({item["client_port"] for item in webhook.received}) == 1
+    session.expire_all()
+    statuses = {message.status for message in session.query(NotificationOutbox)}
+    assert statuses == {"sent"}
+    assert dispatcher.dispatch_once() == 0
+
+
+def test_dispatcher_retries_then_dead_letters(session, webhook):
+    session.add(
+        NotificationOutbox(type="loan_due_date", payload={"loan_key": "lk"}, attempts=0)
+    )
+    session.commit()
+    webhook.responses.extend([500, 500])
+    dispatcher = _dispatcher(webhook, max_attempts=2, backoff_seconds=0)
+
+    dispatcher.dispatch_once()
+    message = session.query(NotificationOutbox).one()
+    session.refresh(message)
+    assert message.status == "pending"
+    assert message.attempts == 1
+    assert "500" in message.last_error
+
+    dispatcher.dispatch_once()
+    session.refresh(message)
+    assert message.status == "dead"
+    assert message.attempts == 2
+    assert len(webhook.received) == 2
+    assert webhook.received[0]["idempotency_key"] == str(message.event_key)
+
+
+def test_dispatcher_backoff_delays_retry(session, webhook):
+    session.add(NotificationOutbox(type="loan_due_date", payload={}, attempts=0))
+    session.commit()
+    webhook.responses.append(503)
+    dispatcher = _dispatcher(webhook, backoff_seconds=60)
+
+    dispatcher.dispatch_once()
+
+    assert dispatcher.dispatch_once() == 0
+    assert len(webhook.received) == 1
+    assert dispatcher.backoff(3).total_seconds() == 240
+
+
+def test_dispatcher_skips_leased_rows(session, webhook):
+    session.add(NotificationOutbox(type="loan_due_date", payload={}, attempts=0))
+    session.commit()
+    dispatcher = _dispatcher(webhook)
+
+    assert len(dispatcher._claim()) == 1
+    message = session.query(NotificationOutbox).one()
+    session.refresh(message)
+    assert message.status == "sending"
+    assert message.locked_until is not None
+
+    assert dispatcher.dispatch_once() == 0
+    assert webhook.received == []
+
+
+def test_dispatcher_reclaims_expired_lease(session, webhook):
+    session.add(
+        NotificationOutbox(
+            type="loan_due_date",
+            payload={"loan_key": "lk"},
+            attempts=0,
+            status="sending",
+            locked_until=datetime.now(timezone.utc) - timedelta(seconds=1),
+        )
+    )
+    session.commit()
+
+    assert _dispatcher(webhook).dispatch_once() == 1
+
+    message = session.query(NotificationOutbox).one()
+    session.refresh(message)
+    assert message.status == "sent"
+    assert message.attempts == 1
+    assert message.locked_until is None
+    assert [item["payload"] for item in webhook.received] == [{"loan_key": "lk"}]
+
+
+def test_dispatcher_purges_finished_rows(session, webhook):
+    session.add_all(
+        [
+            NotificationOutbox(type="loan_due_date", payload={}, status=status)
+            for status in ("sent", "dead", "pending")
+        ]
+    )
+    session.commit()
+    dispatcher = _dispatcher(webhook, retention_seconds=60)
+
+    assert dispatcher.purge() == 0
+    assert dispatcher.purge(now=datetime.now(timezone.utc) + timedelta(hours=1)) == 2
+
+    (message,) = session.query(NotificationOutbox).all()
+    assert message.status == "pending"
@@ -1,5 +1,12 @@
 import csv
 import io
+import json
+import re
+
+import pytest
+
+from app.services.report_service import BOOK_HEADERS, ReportService
+from tests.utils.setup_tools import create_loan
 
 
 def test_export_loans_csv(client, created_loan):
@@ -58,3 +65,137 @@ def test_export_reservations_csv(client, created_reservation):
 def test_export_invalid_format(client):
     response = client.get("/reports/loans/export?format=xml")
     assert response.json()["detail"]["code"] == "LBS018"
+
+
+def test_export_loans_csv_stream(client, created_user):
+    for index in range(3):
+        create_loan(client, created_user["user_key"], f"Book {index}", "Author")
+
+    response = client.get("/reports/loans/export?format=csv&stream=true&per_page=1")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "loans.csv" in response.headers.get("content-disposition", "")
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert len(rows) == 4
+
+
+def test_export_stream_chunks(client, session, monkeypatch):
+    monkeypatch.setattr("app.services.report_service.REPORT_STREAM_CHUNK_SIZE", 2)
+    for index in range(5):
+        client.post("/books/", json={"title": f"Book {index}", "author": "Author"})
+
+    content, _, _ = ReportService().stream_books(session, genre=None, fmt="csv")
+    chunks = list(content)
+
+    assert len(chunks) == 3
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+    assert [row[1] for row in rows[1:]] == [f"Book {index}" for index in range(5)]
+
+
+def test_export_books_pdf_stream(client):
+    client.post("/books/", json={"title": "Book", "author": "Author"})
+
+    response = client.get("/reports/books/export?format=pdf&stream=true")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/pdf")
+    assert "books.pdf" in response.headers.get("content-disposition", "")
+    assert response.content.startswith(b"%PDF")
+
+
+def test_build_pdf_pages(client):
+    rows = [
+        (f"key-{index}", "Title", "Author", None, "available", "")
+        for index in range(200)
+    ]
+
+    empty = ReportService()._build_pdf(BOOK_HEADERS, [], "Books", "All")
+    content = ReportService()._build_pdf(BOOK_HEADERS, iter(rows), "Books", "All")
+
+    assert len(re.findall(rb"/Type /Page\b", empty)) == 1
+    assert len(re.findall(rb"/Type /Page\b", content)) > 1
+
+
+def test_export_loans_csv_columns(client, created_user, created_book, created_loan):
+    response = client.get("/reports/loans/export?format=csv")
+
+    _, row = list(csv.reader(io.StringIO(response.text)))
+    assert row[:4] == [
+        created_loan["loan_key"],
+        created_user["user_key"],
+        created_book["book_key"],
+        "active",
+    ]
+    assert row[6] == ""
+
+
+def test_export_reservations_csv_columns(
+    client, created_user, created_book, created_reservation
+):
+    response = client.get("/reports/reservations/export?format=csv")
+
+    _, row = list(csv.reader(io.StringIO(response.text)))
+    assert row[:4] == [
+        created_reservation["reservation_key"],
+        created_user["name"],
+        created_book["title"],
+        "active",
+    ]
+
+
+def test_export_loans_ndjson(client, created_user, created_book, created_loan):
+    response = client.get("/reports/loans/export?format=ndjson")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert "loans.ndjson" in response.headers.get("content-disposition", "")
+    (record,) = [json.loads(line) for line in response.text.splitlines()]
+    assert record["loan_key"] == created_loan["loan_key"]
+    assert record["user_key"] == created_user["user_key"]
+    assert record["status"] == "active"
+    assert record["return_date"] is None
+
+
+def test_export_books_ndjson_stream(client):
+    for index in range(3):
+        client.post("/books/", json={"title": f"Book {index}", "author": "Author"})
+
+    response = client.get("/reports/books/export?format=ndjson&stream=true")
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [record["title"] for record in records] == ["Book 0", "Book 1", "Book 2"]
+
+
+def test_export_users_arrow(client, created_user):
+    pa = pytest.importorskip("pyarrow")
+
+    response = client.get("/reports/users/export?format=arrow&stream=true")
+
+    assert response.status_code == 200
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column_names == ["user_key", "name", "email", "status", "created_at"]
+    assert table.column("user_key").to_pylist() == [created_user["user_key"]]
+    assert pa.types.is_timestamp(table.schema.field("created_at").type)
+
+
+def test_export_loans_parquet(client, created_loan):
+    pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    response = client.get("/reports/loans/export?format=parquet")
+
+    assert response.status_code == 200
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.num_rows == 1
+    assert table.column("loan_key").to_pylist() == [created_loan["loan_key"]]
+    assert table.column("fine_amount").type == "double"
+
+
+def test_export_arrow_requires_pyarrow(client, monkeypatch):
+    monkeypatch.setattr("app.services.report_service.pa", None)
+
+    response = client.get("/reports/books/export?format=parquet")
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == "LBS018"
@@ -0,0 +1,133 @@
+import asyncio
+import csv
+import io
+import threading
+
+import fakeredis
+from sqlalchemy.util.concurrency import greenlet_spawn
+
+from app.models import Book, BookStatus
+from app.services.report_service import ReportService
+from app.utils import data_version
+from app.utils.data_version import bump_data_versions, get_data_versions
+
+
+def test_export_etag_not_modified(client):
+    client.post("/books/", json={"title": "Book", "author": "Author"})
+
+    first = client.get("/reports/books/export?format=csv")
+    etag = first.headers["ETag"]
+
+    response = client.get(
+        "/reports/books/export?format=csv", headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+
+def test_export_etag_if_none_match_lists(client):
+    client.post("/books/", json={"title": "Book", "author": "Author"})
+    etag = client.get("/reports/books/export?format=csv").headers["ETag"]
+
+    def status_for(header):
+        return client.get(
+            "/reports/books/export?format=csv", headers={"If-None-Match": header}
+        ).status_code
+
+    assert status_for(f'"other", {etag}') == 304
+    assert status_for(f"W/{etag}") == 304
+    assert status_for("*") == 304
+    assert status_for(f'"{etag[1:-1][:8]}"') == 200
+    assert status_for(f'"x{etag[1:-1]}"') == 200
+    assert status_for(etag[1:-1]) == 200
+
+
+def test_export_etag_changes_on_write(client):
+    client.post("/books/", json={"title": "First", "author": "Author"})
+    first = client.get("/reports/books/export?format=csv")
+
+    client.post("/books/", json={"title": "Second", "author": "Author"})
+    response = client.get(
+        "/reports/books/export?format=csv",
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != first.headers["ETag"]
+    assert len(list(csv.reader(io.StringIO(response.text)))) == 3
+
+
+def test_export_etag_depends_on_filters(client):
+    all_books = client.get("/reports/books/export?format=csv")
+    fiction = client.get("/reports/books/export?format=csv&genre=fiction")
+    pdf = client.get("/reports/books/export?format=pdf")
+
+    etags = {response.headers["ETag"] for response in (all_books, fiction, pdf)}
+    assert len(etags) == 3
+
+
+def test_export_reuses_cached_render(client, monkeypatch):
+    client.post("/books/", json={"title": "Book", "author": "Author"})
+    calls = []
+    build_pdf = ReportService._build_pdf
+
+    def counting_build_pdf(self, *args, **kwargs):
+        calls.append(args)
+        return build_pdf(self, *args, **kwargs)
+
+    monkeypatch.setattr(ReportService, "_build_pdf", counting_build_pdf)
+
+    first = client.get("/reports/books/export?format=pdf&genre=none")
+    second = client.get("/reports/books/export?format=pdf&genre=none")
+
+    assert first.content == second.content
+    assert len(calls) == 1
+
+
+def test_data_version_bumps_on_commit_only(session):
+    before = get_data_versions(["books"])
+    status_id = session.query(BookStatus.id).first()[0]
+
+    session.add(Book(title="Rolled back", author="Author", status_id=status_id))
+    session.flush()
+    session.rollback()
+    assert get_data_versions(["books"]) == before
+
+    session.add(Book(title="Committed", author="Author", status_id=status_id))
+    session.commit()
+    assert get_data_versions(["books"])[0] == before[0] + 1
+
+
+def test_data_versions_use_redis_off_the_event_loop(monkeypatch):
+    threads = []
+
+    class RecordingRedis(fakeredis.FakeRedis):
+        def mget(self, *args, **kwargs):
+            threads.append(threading.get_ident())
+            return super().mget(*args, **kwargs)
+
+        def pipeline(self, *args, **kwargs):
+            pipe = super().pipeline(*args, **kwargs)
+            execute = pipe.execute
+
+            def record(*args, **kwargs):
+                threads.append(threading.get_ident())
+                return execute(*args, **kwargs)
+
+            pipe.execute = record
+            return pipe
+
+    client = RecordingRedis(server=fakeredis.FakeServer())
+    monkeypatch.setattr(data_version, "get_redis_client", lambda: client)
+
+    async def run():
+        await greenlet_spawn(bump_data_versions, ["books"])
+        versions = await greenlet_spawn(get_data_versions, ["books"])
+        return threading.get_ident(), versions
+
+    loop_thread, versions = asyncio.run(run())
+
+    assert versions == (1,)
+    assert len(threads) == 2 and loop_thread not in threads
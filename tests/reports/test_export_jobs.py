@@ -0,0 +1,186 @@
+import csv
+import io
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.api.routers import reports
+from app.models import ExportJob
+from app.services import export_job_service
+from app.services.export_job_service import ExportJobService
+from tests.conftest import TestingSessionLocal
+from tests.utils.setup_tools import create_loan
+
+
+class ImmediateExecutor:
+    def submit(self, fn, *args, **kwargs):
+        fn(*args, **kwargs)
+
+
+class IdleExecutor:
+    def submit(self, fn, *args, **kwargs):
+        pass
+
+
+@pytest.fixture(name="export_jobs")
+def export_jobs_fixture(monkeypatch, tmp_path):
+    service = ExportJobService(
+        report_service=reports.report_service,
+        session_factory=TestingSessionLocal,
+        read_session_factory=TestingSessionLocal,
+        executor=ImmediateExecutor(),
+        storage_dir=str(tmp_path),
+    )
+    monkeypatch.setattr(reports, "export_job_service", service)
+    return service
+
+
+def test_export_job_csv(client, export_jobs, created_user):
+    for index in range(3):
+        create_loan(client, created_user["user_key"], f"Book {index}", "Author")
+
+    submitted = client.post("/reports/jobs", json={"report": "loans"})
+    assert submitted.status_code == 202
+    job_key = submitted.json()["job_key"]
+
+    job = client.get(f"/reports/jobs/{job_key}").json()
+    assert job["status"] == "completed"
+    assert job["total_rows"] == 3
+    assert job["processed_rows"] == 3
+    assert job["progress"] == 100.0
+
+    download = client.get(f"/reports/jobs/{job_key}/download")
+    assert download.status_code == 200
+    assert download.headers["content-type"].startswith("text/csv")
+    assert "loans.csv" in download.headers["content-disposition"]
+    rows = list(csv.reader(io.StringIO(download.text)))
+    assert len(rows) == 4
+
+
+def test_export_job_pdf(client, export_jobs):
+    client.post("/books/", json={"title": "Book", "author": "Author", "genre": "x"})
+
+    job_key = client.post(
+        "/reports/jobs", json={"report": "books", "format": "pdf", "genre": "x"}
+    ).json()["job_key"]
+
+    download = client.get(f"/reports/jobs/{job_key}/download")
+    assert download.status_code == 200
+    assert download.content.startswith(b"%PDF")
+
+
+def test_export_job_parquet(client, export_jobs, created_user):
+    pq = pytest.importorskip("pyarrow.parquet")
+    for index in range(3):
+        create_loan(client, created_user["user_key"], f"Book {index}", "Author")
+
+    job_key = client.post(
+        "/reports/jobs", json={"report": "loans", "format": "parquet"}
+    ).json()["job_key"]
+
+    download = client.get(f"/reports/jobs/{job_key}/download")
+    assert download.status_code == 200
+    assert "loans.parquet" in download.headers["content-disposition"]
+    assert pq.read_table(io.BytesIO(download.content)).num_rows == 3
+
+
+def test_export_job_pending_download(client, export_jobs, monkeypatch):
+    monkeypatch.setattr(export_jobs, "executor", IdleExecutor())
+
+    job = client.post("/reports/jobs", json={"report": "users"}).json()
+    assert job["status"] == "pending"
+
+    response = client.get(f"/reports/jobs/{job['job_key']}/download")
+    assert response.status_code == 409
+    assert response.json()["detail"]["code"] == "LBS021"
+
+
+def test_export_job_failure(client, export_jobs, monkeypatch):
+    def broken_stream(*args, **kwargs):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(export_jobs.report_service, "stream_users", broken_stream)
+
+    job_key = client.post("/reports/jobs", json={"report": "users"}).json()["job_key"]
+    job = client.get(f"/reports/jobs/{job_key}").json()
+
+    assert job["status"] == "failed"
+    assert job["error"] == "disk full"
+
+
+def test_export_job_not_found(client):
+    response = client.get(f"/reports/jobs/{uuid.uuid4()}")
+
+    assert response.status_code == 404
+    assert response.json()["detail"]["code"] == "LBS020"
+
+
+def test_export_job_recovers_stale_jobs(session, export_jobs):
+    stale = datetime.now(timezone.utc) - timedelta(hours=2)
+    fresh = datetime.now(timezone.utc)
+    session.add_all(
+        [
+            ExportJob(
+                report="users", format="csv", status="running", heartbeat_at=stale
+            ),
+            ExportJob(
+                report="users", format="csv", status="pending", heartbeat_at=stale
+            ),
+            ExportJob(
+                report="users", format="csv", status="running", heartbeat_at=fresh
+            ),
+        ]
+    )
+    session.commit()
+
+    assert export_jobs.recover_stale(session) == 1
+
+    session.expire_all()
+    statuses = [job.status for job in session.query(ExportJob).order_by(ExportJob.id)]
+    assert statuses == ["failed", "pending", "running"]
+
+
+def test_export_job_expired_file(client, session, export_jobs):
+    job_key = client.post("/reports/jobs", json={"report": "users"}).json()["job_key"]
+    job = session.query(ExportJob).one()
+    path = job.file_path
+    assert os.path.exists(path)
+
+    later = datetime.now(timezone.utc) + timedelta(days=2)
+    assert export_jobs.purge_expired(session, now=later) == 1
+
+    assert not os.path.exists(path)
+    assert client.get(f"/reports/jobs/{job_key}").json()["status"] == "expired"
+    response = client.get(f"/reports/jobs/{job_key}/download")
+    assert response.status_code == 410
+    assert response.json()["detail"]["code"] == "LBS024"
+
+
+def test_export_job_file_on_other_node(client, session, export_jobs):
+    job_key = client.post("/reports/jobs", json={"report": "users"}).json()["job_key"]
+    os.remove(session.query(ExportJob).one().file_path)
+
+    response = client.get(f"/reports/jobs/{job_key}/download")
+
+    assert response.status_code == 410
+
+
+def test_shutdown_fails_queued_jobs(client, session, export_jobs, monkeypatch):
+    release = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.submit(release.wait)
+    monkeypatch.setattr(export_jobs, "executor", None)
+    monkeypatch.setattr(export_job_service, "_executor", executor)
+    monkeypatch.setattr(export_job_service, "SessionLocal", TestingSessionLocal)
+
+    job_key = client.post("/reports/jobs", json={"report": "users"}).json()["job_key"]
+    export_job_service.shutdown_export_executor()
+    release.set()
+
+    job = client.get(f"/reports/jobs/{job_key}").json()
+    assert job["status"] == "failed"
+    assert job["error"] == "Cancelled at shutdown"
@@ -0,0 +1,51 @@
+import uuid
+from datetime import datetime, timezone
+
+from app.services import render_pool
+from app.services.report_render import build_csv, build_pdf
+from app.services.report_service import BOOK_HEADERS
+
+
+def _rows(count):
+    now = datetime.now(timezone.utc)
+    return [
+        (uuid.uuid4(), f"Book {index}", "Author", None, "available", now)
+        for index in range(count)
+    ]
+
+
+def test_render_pool_matches_inline(monkeypatch):
+    monkeypatch.setattr(render_pool, "RENDER_POOL_WORKERS", 1)
+    monkeypatch.setattr(render_pool, "RENDER_POOL_MIN_ROWS", 0)
+    rows = _rows(50)
+
+    try:
+        pooled_csv = render_pool.render(build_csv, BOOK_HEADERS, rows)
+        pooled_pdf = render_pool.render(build_pdf, BOOK_HEADERS, rows, "Books", "All")
+        assert render_pool._executor is not None
+    finally:
+        render_pool.shutdown_render_executor()
+
+    assert pooled_csv == build_csv(BOOK_HEADERS, rows)
+    assert pooled_pdf.startswith(b"%PDF")
+
+
+def test_render_pool_small_exports_stay_inline(monkeypatch):
+    monkeypatch.setattr(render_pool, "RENDER_POOL_WORKERS", 1)
+    monkeypatch.setattr(render_pool, "RENDER_POOL_MIN_ROWS", 100)
+    rows = _rows(5)
+
+    content = render_pool.render(build_csv, BOOK_HEADERS, rows)
+
+    assert render_pool._executor is None
+    assert content == build_csv(BOOK_HEADERS, rows)
+
+
+def test_render_pool_disabled(monkeypatch):
+    monkeypatch.setattr(render_pool, "RENDER_POOL_WORKERS", 0)
+    monkeypatch.setattr(render_pool, "RENDER_POOL_MIN_ROWS", 0)
+
+    assert render_pool.get_render_executor() is None
+    assert render_pool.render(build_csv, BOOK_HEADERS, []) == build_csv(
+        BOOK_HEADERS, []
+    )
@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.models import LoanStat
+from app.services.stats_service import StatsService
+from tests.utils.setup_tools import create_loan, mark_loan_overdue
+
+
+def _seed_loans(client, session, user_key):
+    overdue, _ = create_loan(client, user_key, "Overdue", "Author")
+    mark_loan_overdue(session, overdue["loan_key"])
+    create_loan(client, user_key, "Active", "Author")
+    _, returned_key = create_loan(client, user_key, "Returned", "Author")
+    client.post("/loans/return", json={"book_key": returned_key})
+
+
+def test_loan_stats_by_status(client, session, created_user):
+    _seed_loans(client, session, created_user["user_key"])
+
+    response = client.get("/reports/stats/loans?group_by=status")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["source"] == "live"
+    buckets = {bucket["bucket"]: bucket for bucket in body["buckets"]}
+    assert buckets["active"]["loans"] == 2
+    assert buckets["active"]["overdue"] == 1
+    assert buckets["returned"]["returned"] == 1
+
+
+def test_loan_stats_by_genre_and_month(client, session, created_user):
+    book = client.post(
+        "/books/", json={"title": "Dune", "author": "Herbert", "genre": "sci-fi"}
+    ).json()
+    client.post(
+        "/loans/",
+        json={"user_key": created_user["user_key"], "book_key": book["book_key"]},
+    )
+
+    by_genre = client.get("/reports/stats/loans?group_by=genre").json()
+    by_month = client.get("/reports/stats/loans?group_by=month").json()
+
+    assert [bucket["bucket"] for bucket in by_genre["buckets"]] == ["sci-fi"]
+    month = datetime.now(timezone.utc).strftime("%Y-%m")
+    assert [bucket["bucket"] for bucket in by_month["buckets"]] == [month]
+
+
+def test_loan_stats_summary_refresh(client, session, created_user):
+    _seed_loans(client, session, created_user["user_key"])
+
+    refreshed = client.post("/reports/stats/refresh")
+    assert refreshed.status_code == 200
+    assert refreshed.json()["buckets"] > 0
+
+    create_loan(client, created_user["user_key"], "Later", "Author")
+
+    summary = client.get("/reports/stats/loans?group_by=status").json()
+    assert summary["source"] == "summary"
+    assert summary["refreshed_at"] is not None
+    assert sum(bucket["loans"] for bucket in summary["buckets"]) == 3
+
+    live = client.get("/reports/stats/loans?group_by=status&live=true").json()
+    assert live["source"] == "live"
+    assert sum(bucket["loans"] for bucket in live["buckets"]) == 4
+
+
+def test_loan_stats_stale_summary_falls_back_to_live(client, session, created_user):
+    _seed_loans(client, session, created_user["user_key"])
+    client.post("/reports/stats/refresh")
+    create_loan(client, created_user["user_key"], "Later", "Author")
+
+    session.query(LoanStat).update(
+        {LoanStat.refreshed_at: datetime.now(timezone.utc) - timedelta(days=1)}
+    )
+    session.commit()
+
+    body = client.get("/reports/stats/loans?group_by=status").json()
+    assert body["source"] == "live"
+    assert sum(bucket["loans"] for bucket in body["buckets"]) == 4
+
+
+def test_loan_stats_invalid_group(client):
+    response = client.get("/reports/stats/loans?group_by=author")
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == "LBS022"
+
+
+def test_loan_stats_refresh_replaces_summary(client, session, created_user):
+    _seed_loans(client, session, created_user["user_key"])
+
+    first = client.post("/reports/stats/refresh").json()
+    second = client.post("/reports/stats/refresh").json()
+
+    assert first["buckets"] == second["buckets"]
+    assert session.query(LoanStat).count() == second["buckets"]
+
+
+def test_loan_stats_refresh_locks_summary_on_postgresql():
+    executed = []
+    session = SimpleNamespace(
+        get_bind=lambda: SimpleNamespace(dialect=SimpleNamespace(name="postgresql")),
+        execute=lambda statement: executed.append(str(statement)),
+    )
+
+    StatsService._lock_summary(session)
+
+    assert executed == ["LOCK TABLE loan_stats IN EXCLUSIVE MODE"]
@@ -0,0 +1,123 @@
+import pytest
+
+# Statements issued per write endpoint on the SQLite test database with a warm
+# status registry. A higher count means a post-commit reload crept back in.
+
+
+@pytest.fixture(autouse=True)
+def no_webhook(monkeypatch):
+    monkeypatch.delenv("NOTIFY_WEBHOOK_URL", raising=False)
+
+
+def _count(query_counter, call):
+    query_counter.clear()
+    response = call()
+    assert response.status_code < 300, response.text
+    return len(query_counter), response.json()
+
+
+def test_book_write_query_counts(client, query_counter):
+    payload = {"title": "Dune", "author": "Frank Herbert"}
+
+    count, book = _count(query_counter, lambda: client.post("/books/", json=payload))
+    assert count == 3
+    assert book["status"]["enumerator"] == "available"
+
+    book_key = book["book_key"]
+    count, book = _count(
+        query_counter,
+        lambda: client.patch(f"/books/{book_key}", json={"title": "Dune II"}),
+    )
+    assert count == 3
+    assert book["title"] == "Dune II"
+
+    count, book = _count(
+        query_counter,
+        lambda: client.post(
+            f"/books/{book_key}/status", params={"status_enum": "loaned"}
+        ),
+    )
+    assert count == 4
+    assert book["status"]["enumerator"] == "loaned"
+
+
+def test_user_write_query_counts(client, query_counter):
+    count, user = _count(
+        query_counter,
+        lambda: client.post(
+            "/users/", json={"name": "Ana", "email": "ana@example.com"}
+        ),
+    )
+    assert count == 4
+    assert user["status"]["enumerator"] == "active"
+
+    user_key = user["user_key"]
+    count, user = _count(
+        query_counter,
+        lambda: client.patch(f"/users/{user_key}", json={"name": "Ana Maria"}),
+    )
+    assert count == 3
+    assert user["name"] == "Ana Maria"
+
+    count, user = _count(
+        query_counter,
+        lambda: client.post(
+            f"/users/{user_key}/status", params={"status_enum": "suspended"}
+        ),
+    )
+    assert count == 4
+    assert user["status"]["enumerator"] == "suspended"
+
+
+def test_loan_write_query_counts(client, query_counter, created_user, created_book):
+    payload = {
+        "user_key": created_user["user_key"],
+        "book_key": created_book["book_key"],
+    }
+
+    count, loan = _count(query_counter, lambda: client.post("/loans/", json=payload))
+    assert count == 8
+    assert loan["book"]["status"]["enumerator"] == "loaned"
+    assert len(loan["events"]) == 1
+
+    loan_key = loan["loan_key"]
+    count, loan = _count(query_counter, lambda: client.post(f"/loans/{loan_key}/renew"))
+    assert count == 3
+    assert len(loan["events"]) == 2
+
+    count, loan = _count(
+        query_counter,
+        lambda: client.post(
+            "/loans/return", json={"book_key": created_book["book_key"]}
+        ),
+    )
+    assert count == 8
+    assert loan["status"]["enumerator"] == "returned"
+    assert loan["book"]["status"]["enumerator"] == "available"
+    assert [event["new_status"]["enumerator"] for event in loan["events"]] == [
+        "active",
+        "active",
+        "returned",
+    ]
+
+
+def test_reservation_write_query_counts(
+    client, query_counter, created_user, created_loan
+):
+    payload = {
+        "user_key": created_user["user_key"],
+        "book_key": created_loan["book"]["book_key"],
+    }
+
+    count, reservation = _count(
+        query_counter, lambda: client.post("/reservations/", json=payload)
+    )
+    assert count == 6
+    assert reservation["status"]["enumerator"] == "active"
+
+    key = reservation["reservation_key"]
+    count, reservation = _count(
+        query_counter, lambda: client.post(f"/reservations/{key}/complete")
+    )
+    assert count == 4
+    assert reservation["status"]["enumerator"] == "completed"
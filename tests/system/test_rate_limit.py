@@ -0,0 +1,86 @@
+import asyncio
+import importlib
+
+import fakeredis
+import pytest
+
+from app.core.rate_limiter import (
+    MemoryRateLimiter,
+    RedisRateLimiter,
+    TokenBucketRateLimiter,
+)
+
+
+def test_limiter_without_hit_fails_on_construction():
+    class Incomplete(TokenBucketRateLimiter):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_memory_bucket_allows_capacity_then_blocks():
+    limiter = MemoryRateLimiter(capacity=3, window=60)
+
+    async def run():
+        return [await limiter.hit("rl:test") for _ in range(4)]
+
+    results = asyncio.run(run())
+
+    assert [result.allowed for result in results] == [True, True, True, False]
+    assert [result.remaining for result in results[:3]] == [2, 1, 0]
+    assert results[-1].retry_after == pytest.approx(20, abs=0.5)
+
+
+def test_memory_bucket_evicts_least_recent_key():
+    limiter = MemoryRateLimiter(capacity=1, window=60, max_keys=2)
+
+    async def run():
+        await limiter.hit("rl:a")
+        await limiter.hit("rl:b")
+        await limiter.hit("rl:c")
+
+    asyncio.run(run())
+
+    assert list(limiter._buckets) == ["rl:b", "rl:c"]
+
+
+def test_redis_bucket_is_shared_between_limiters():
+    pytest.importorskip("lupa")
+    server = fakeredis.FakeServer()
+
+    async def run():
+        first = RedisRateLimiter(
+            fakeredis.FakeAsyncRedis(server=server), capacity=2, window=60
+        )
+        second = RedisRateLimiter(
+            fakeredis.FakeAsyncRedis(server=server), capacity=2, window=60
+        )
+        return [
+            await first.hit("rl:shared"),
+            await second.hit("rl:shared"),
+            await first.hit("rl:shared"),
+        ]
+
+    results = asyncio.run(run())
+
+    assert [result.allowed for result in results] == [True, True, False]
+    assert results[1].remaining == 0
+
+
+def test_middleware_returns_429_when_limited(client, monkeypatch):
+    rate_limit_module = importlib.import_module("app.core.middlewares.rate_limit")
+    monkeypatch.setattr(
+        rate_limit_module, "limiter", MemoryRateLimiter(capacity=1, window=60)
+    )
+    payload = {"title": "Book", "author": "Author"}
+
+    first = client.post("/books/", json=payload)
+    second = client.post("/books/", json=payload)
+
+    assert first.status_code == 201
+    assert first.headers["X-RateLimit-Limit"] == "1"
+    assert first.headers["X-RateLimit-Remaining"] == "0"
+    assert second.status_code == 429
+    assert second.json()["detail"]["code"] == "RATE_LIMIT_EXCEEDED"
+    assert int(second.headers["Retry-After"]) >= 1
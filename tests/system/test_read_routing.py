@@ -0,0 +1,47 @@
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.db.session import (
+    SessionLocal,
+    engine,
+    get_read_session,
+    get_session,
+    read_engine,
+)
+
+app = FastAPI()
+
+
+@app.get("/read")
+def read_only(read=Depends(get_read_session)):
+    return {"engine": "primary" if read.get_bind() is engine else "replica"}
+
+
+@app.post("/write")
+def write_then_read(session=Depends(get_session), read=Depends(get_read_session)):
+    return {"same_session": read is session}
+
+
+def test_read_engine_defaults_to_primary():
+    assert read_engine is engine
+
+
+def test_read_session_reuses_primary_after_write():
+    client = TestClient(app)
+
+    assert client.post("/write").json() == {"same_session": True}
+
+
+def test_read_session_is_separate_without_write(monkeypatch):
+    opened = []
+
+    def tracking_session():
+        session = SessionLocal()
+        opened.append(session)
+        return session
+
+    monkeypatch.setattr("app.db.session.ReadSessionLocal", tracking_session)
+    client = TestClient(app)
+
+    assert client.get("/read").status_code == 200
+    assert len(opened) == 1
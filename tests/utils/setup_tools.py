@@ -2,8 +2,10 @@ from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 import pytest
+from sqlalchemy import event
 
 from app.models.loan import Loan
+from app.utils.status_registry import warm_status_registry
 
 
 def create_loan(client, user_key: str, book_title: str, book_author: str):
@@ -84,3 +86,17 @@ def created_reservation(client, created_user, created_book):
     )
     assert response.status_code == 201
     return response.json()
+
+
+@pytest.fixture
+def query_counter(session):
+    warm_status_registry(session)
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)